@@ -8,6 +8,19 @@ class Config:
     """Configuración global del proyecto GIC."""
 
     DB_PATH = os.getenv("DB_PATH", "src/database/gic.db")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_PRAGMA_PROFILE = os.getenv("DB_PRAGMA_PROFILE", "wal")
+    DB_MIGRATION_BATCH_SIZE = int(os.getenv("DB_MIGRATION_BATCH_SIZE", 5000))
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", 10000))
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 200))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", 0.5))
+    AUDIT_PUT_TIMEOUT = float(os.getenv("AUDIT_PUT_TIMEOUT", 1.0))
+    ID_SCHEME = os.getenv("ID_SCHEME", "uuid7")
+    VALIDATOR_CACHE_SIZE = int(os.getenv("VALIDATOR_CACHE_SIZE", 4096))
+    CLIENT_CACHE_SIZE = int(os.getenv("CLIENT_CACHE_SIZE", 1024))
+    CLIENT_CACHE_TTL = float(os.getenv("CLIENT_CACHE_TTL", 60))
+    IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", 0))  # 0 = os.cpu_count()
     IDENTITY_API_URL = os.getenv("IDENTITY_API_URL", "")
     IDENTITY_API_KEY = os.getenv("IDENTITY_API_KEY", "")
     SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -17,3 +30,5 @@ class Config:
     FLASK_SECRET_KEY = os.getenv("FLASK_SECRET_KEY", "dev-key-cambiar")
     FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
     FLASK_PORT = int(os.getenv("FLASK_PORT", 5000))
+    PAGE_SIZE = int(os.getenv("PAGE_SIZE", 50))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 500))
@@ -0,0 +1,76 @@
+"""
+Benchmark: exposición de descuento y agregaciones sobre la cartera completa.
+
+Compara el recorrido clásico (hidratar modelos y llamar calcular_descuento
+en un bucle Python) contra el snapshot columnar de src/services/analitica.py.
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_analitica.py [cantidad]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from benchmark_hidratacion import preparar_bd
+from src.models import TIPOS_CLIENTE
+from src.services.analitica import SnapshotClientes
+from src.utils.logger import logger
+
+MONTO = 100_000
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+def bucle_python(ruta: str) -> float:
+    """Exposición Premium activa con modelos y calcular_descuento."""
+    conn = sqlite3.connect(ruta)
+    conn.row_factory = sqlite3.Row
+    total = 0.0
+    for row in conn.execute("SELECT * FROM clientes"):
+        cliente = TIPOS_CLIENTE[row["tipo_cliente"]].from_storage(dict(row))
+        if cliente.tipo_cliente == "Premium" and cliente.activo:
+            total += cliente.calcular_descuento(MONTO)
+    conn.close()
+    return total
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "bench.db")
+        preparar_bd(ruta, cantidad)
+
+        esperado, ms_bucle = cronometrar(lambda: bucle_python(ruta))
+        snapshot, ms_carga = cronometrar(lambda: SnapshotClientes.desde_bd(ruta))
+
+    mascara = snapshot.mascara(tipo="Premium", activo=True)
+    total, ms_exposicion = cronometrar(
+        lambda: snapshot.descuentos(MONTO)[mascara].sum()
+    )
+    descuentos = snapshot.descuentos(MONTO)
+    _, ms_tipo = cronometrar(lambda: snapshot.agregar(descuentos, por="tipo"))
+    _, ms_nivel = cronometrar(lambda: snapshot.agregar(descuentos, por="nivel"))
+    _, ms_tamano = cronometrar(lambda: snapshot.agregar(descuentos, por="tamano"))
+
+    print(f"Clientes: {cantidad:,}")
+    print(f"  Bucle Python (modelos):        {ms_bucle:>10,.1f} ms  total={esperado:,.2f}")
+    print(f"  Carga snapshot columnar:       {ms_carga:>10,.1f} ms")
+    print(f"  Exposición Premium activa:     {ms_exposicion:>10,.1f} ms  total={total:,.2f}")
+    print(f"  Agregación por tipo:           {ms_tipo:>10,.1f} ms")
+    print(f"  Agregación por nivel:          {ms_nivel:>10,.1f} ms")
+    print(f"  Agregación por tamaño:         {ms_tamano:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: concurrencia de N lectores + M escritores sobre un mismo archivo
+SQLite, comparando perfiles de PRAGMA (ver src/database/pragmas.py).
+
+Cada lector/escritor es un proceso independiente (como un worker de Flask).
+Se reporta throughput, errores "database is locked" y operaciones que
+debieron esperar un lock (latencia sobre el umbral).
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_concurrencia.py [lectores] [escritores] [segundos]
+"""
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datos_sinteticos import generar_filas
+from src.database.connection import DatabaseConnection
+from src.database.migrations import crear_tablas
+from src.database.pragmas import PERFILES_PRAGMA
+from src.utils.logger import logger
+
+UMBRAL_ESPERA = 0.020  # 20 ms: la operación estuvo bloqueada por un lock
+
+
+def _worker(rol, indice, ruta, perfil, segundos, resultados):
+    logger.remove()
+    ops = bloqueos = esperas = 0
+    filas = generar_filas(1_000_000, semilla=indice)
+    fin = time.perf_counter() + segundos
+    while time.perf_counter() < fin:
+        inicio = time.perf_counter()
+        try:
+            with DatabaseConnection(ruta, perfil=perfil) as conn:
+                if rol == "escritor":
+                    fila = next(filas)
+                    fila["email"] = f"w{indice}-{ops}@example.com"
+                    fila["id"] = f"{indice}-{ops}"
+                    columnas = ", ".join(fila)
+                    conn.execute(
+                        f"INSERT INTO clientes ({columnas}) "
+                        f"VALUES ({', '.join('?' * len(fila))})",
+                        list(fila.values()),
+                    )
+                else:
+                    conn.execute(
+                        "SELECT * FROM clientes ORDER BY fecha_registro DESC LIMIT 50"
+                    ).fetchall()
+            ops += 1
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) and "busy" not in str(e):
+                raise
+            bloqueos += 1
+        if time.perf_counter() - inicio > UMBRAL_ESPERA:
+            esperas += 1
+    resultados.put((rol, ops, bloqueos, esperas))
+
+
+def medir_perfil(perfil, lectores, escritores, segundos) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "bench.db")
+        crear_tablas(ruta, perfil=perfil)
+        resultados = multiprocessing.Queue()
+        procesos = [
+            multiprocessing.Process(
+                target=_worker,
+                args=(rol, i, ruta, perfil, segundos, resultados),
+            )
+            for i, rol in enumerate(
+                ["lector"] * lectores + ["escritor"] * escritores
+            )
+        ]
+        for p in procesos:
+            p.start()
+        totales = {
+            "lector": [0, 0, 0],
+            "escritor": [0, 0, 0],
+        }
+        for _ in procesos:
+            rol, ops, bloqueos, esperas = resultados.get()
+            for i, valor in enumerate((ops, bloqueos, esperas)):
+                totales[rol][i] += valor
+        for p in procesos:
+            p.join()
+    return totales
+
+
+def main():
+    lectores = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    escritores = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    segundos = float(sys.argv[3]) if len(sys.argv) > 3 else 3
+    logger.remove()
+
+    print(f"{lectores} lectores + {escritores} escritores, {segundos}s por perfil")
+    print(
+        f"{'perfil':<12} {'lect/s':>9} {'escr/s':>9} "
+        f"{'locked':>8} {'esperas':>8}"
+    )
+    for perfil in PERFILES_PRAGMA:
+        t = medir_perfil(perfil, lectores, escritores, segundos)
+        print(
+            f"{perfil:<12} {t['lector'][0] / segundos:>9,.0f} "
+            f"{t['escritor'][0] / segundos:>9,.0f} "
+            f"{t['lector'][1] + t['escritor'][1]:>8} "
+            f"{t['lector'][2] + t['escritor'][2]:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
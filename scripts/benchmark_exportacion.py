@@ -0,0 +1,135 @@
+"""
+Benchmark: exportación de clientes a archivo (JSON, NDJSON y CSV).
+
+Compara la exportación en memoria (listar() + lista de dicts + json.dump,
+o encabezado descubierto fila a fila para CSV) contra la exportación en
+streaming (iterar_vistas() + escritura por cliente) sobre una BD temporal
+con el esquema completo, y agrega NDJSON plano y con gzip. Reporta tiempo,
+pico de memoria de Python (tracemalloc) y tamaño del archivo por cantidad
+de clientes.
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_exportacion.py [cantidad ...]
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import Config
+from datos_sinteticos import generar_filas
+from src.database.connection import DatabaseConnection
+from src.database.migrations import crear_tablas
+from src.database.pool import cerrar_pools
+from src.repositories.csv_repository import CSVRepository
+from src.repositories.json_repository import JSONRepository
+from src.repositories.ndjson_repository import NDJSONRepository
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.utils.logger import logger
+
+
+def preparar_bd(ruta: str, cantidad: int, tam_lote: int = 5000):
+    """Crea la BD con el esquema completo y cantidad filas sintéticas."""
+    crear_tablas(ruta)
+    filas = generar_filas(cantidad)
+    columnas = list(next(generar_filas(1)))
+    sql = (
+        f"INSERT INTO clientes ({', '.join(columnas)}) "
+        f"VALUES ({', '.join('?' * len(columnas))})"
+    )
+    for inicio in range(0, cantidad, tam_lote):
+        lote = [
+            [fila.get(c) for c in columnas]
+            for fila, _ in zip(filas, range(min(tam_lote, cantidad - inicio)))
+        ]
+        with DatabaseConnection(ruta) as conn:
+            conn.executemany(sql, lote)
+
+
+def exportar_en_memoria(repo: SQLiteRepository, ruta: str):
+    """Ruta anterior: todos los modelos y todos los dicts en memoria."""
+    datos = [c.to_dict() for c in repo.listar()]
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+
+
+def exportar_streaming(repo: SQLiteRepository, ruta: str):
+    JSONRepository(ruta).exportar(repo.iterar_vistas())
+
+
+def exportar_csv_en_memoria(repo: SQLiteRepository, ruta: str):
+    """Ruta anterior: dicts en memoria y encabezado descubierto por fila."""
+    datos = [c.to_dict() for c in repo.listar()]
+    campos = []
+    for d in datos:
+        for k in d.keys():
+            if k not in campos:
+                campos.append(k)
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=campos, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(datos)
+
+
+def exportar_csv_streaming(repo: SQLiteRepository, ruta: str):
+    CSVRepository(ruta).exportar(repo.iterar_vistas())
+
+
+def exportar_ndjson(repo: SQLiteRepository, ruta: str, compresion: str = None):
+    ndjson = NDJSONRepository()
+    ndjson.ruta = ruta.removesuffix(".gz")
+    ndjson.exportar(repo.iterar_vistas(), compresion)
+
+
+def exportar_ndjson_gzip(repo: SQLiteRepository, ruta: str):
+    exportar_ndjson(repo, ruta, "gzip")
+
+
+METODOS = (
+    ("json memoria", exportar_en_memoria, "json"),
+    ("json stream", exportar_streaming, "json"),
+    ("csv memoria", exportar_csv_en_memoria, "csv"),
+    ("csv stream", exportar_csv_streaming, "csv"),
+    ("ndjson", exportar_ndjson, "ndjson"),
+    ("ndjson gzip", exportar_ndjson_gzip, "ndjson.gz"),
+)
+
+
+def medir(funcion, repo, ruta) -> tuple:
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcion(repo, ruta)
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracion, pico
+
+
+def main():
+    cantidades = [int(a) for a in sys.argv[1:]] or [1_000, 100_000]
+    logger.remove()
+
+    print(f"{'clientes':>10} {'método':<13} {'segundos':>9} {'pico MB':>9} {'archivo MB':>11}")
+    for cantidad in cantidades:
+        with tempfile.TemporaryDirectory() as tmp:
+            Config.DB_PATH = os.path.join(tmp, "bench.db")
+            preparar_bd(Config.DB_PATH, cantidad)
+            repo = SQLiteRepository()
+            for nombre, funcion, extension in METODOS:
+                ruta = os.path.join(tmp, f"{nombre.replace(' ', '_')}.{extension}")
+                duracion, pico = medir(funcion, repo, ruta)
+                print(
+                    f"{cantidad:>10,} {nombre:<13} {duracion:>9.2f} "
+                    f"{pico / 2**20:>9.1f} {os.path.getsize(ruta) / 2**20:>11.1f}"
+                )
+            cerrar_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: hidratación de clientes desde SQLite.
+
+Compara la ruta validada (from_dict -> __init__ con validadores y logs)
+contra la carga confiable (from_storage) sobre una BD temporal.
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_hidratacion.py [cantidad]
+"""
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datos_sinteticos import generar_filas
+from src.models import TIPOS_CLIENTE
+from src.utils.logger import logger
+
+
+def preparar_bd(ruta: str, cantidad: int):
+    """Crea una tabla clientes temporal con filas sintéticas."""
+    filas = list(generar_filas(cantidad))
+    columnas = sorted({k for f in filas for k in f})
+    conn = sqlite3.connect(ruta)
+    conn.execute(f"CREATE TABLE clientes ({', '.join(columnas)})")
+    conn.executemany(
+        f"INSERT INTO clientes ({', '.join(columnas)}) "
+        f"VALUES ({', '.join('?' * len(columnas))})",
+        [[f.get(c) for c in columnas] for f in filas],
+    )
+    conn.commit()
+    conn.close()
+
+
+def medir(ruta: str, metodo: str) -> float:
+    """Lee todas las filas e hidrata los modelos. Retorna filas/segundo."""
+    conn = sqlite3.connect(ruta)
+    conn.row_factory = sqlite3.Row
+    inicio = time.perf_counter()
+    rows = conn.execute("SELECT * FROM clientes").fetchall()
+    clientes = [
+        getattr(TIPOS_CLIENTE[row["tipo_cliente"]], metodo)(dict(row)) for row in rows
+    ]
+    duracion = time.perf_counter() - inicio
+    conn.close()
+    return len(clientes) / duracion
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    # Los logs siguen formateándose (son parte del costo), pero sin imprimirse
+    logger.remove()
+    logger.add(lambda msg: None, level="INFO")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "bench.db")
+        preparar_bd(ruta, cantidad)
+        antes = medir(ruta, "from_dict")
+        despues = medir(ruta, "from_storage")
+
+    print(f"Filas: {cantidad:,}")
+    print(f"  from_dict (validado):    {antes:>12,.0f} filas/s")
+    print(f"  from_storage (confiable): {despues:>12,.0f} filas/s")
+    print(f"  Aceleración: x{despues / antes:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: esquema de IDs (uuid4 aleatorio vs uuid7 ordenado por tiempo).
+
+Inserta N clientes con el esquema completo de la BD (índices, FTS5 y
+triggers) en una BD temporal por esquema y reporta throughput por tramo,
+tamaño final del archivo y páginas de la tabla clientes.
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_ids.py [cantidad] [tam_lote]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import Config
+from datos_sinteticos import generar_filas
+from src.database.connection import DatabaseConnection
+from src.database.migrations import crear_tablas
+from src.database.pool import cerrar_pools
+from src.utils.helpers import ESQUEMAS_ID, generar_id
+from src.utils.logger import logger
+
+TRAMOS = 5
+
+
+def medir(esquema: str, cantidad: int, tam_lote: int) -> dict:
+    Config.ID_SCHEME = esquema
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "bench.db")
+        crear_tablas(ruta)
+        filas = generar_filas(cantidad)
+        primera = next(generar_filas(1))
+        columnas = list(primera)
+        sql = (
+            f"INSERT INTO clientes ({', '.join(columnas)}) "
+            f"VALUES ({', '.join('?' * len(columnas))})"
+        )
+
+        tramo = max(1, cantidad // TRAMOS)
+        throughput, insertadas, inicio = [], 0, time.perf_counter()
+        while insertadas < cantidad:
+            lote = []
+            for _ in range(min(tam_lote, cantidad - insertadas)):
+                fila = next(filas)
+                fila["id"] = generar_id()
+                lote.append([fila.get(c) for c in columnas])
+            with DatabaseConnection(ruta) as conn:
+                conn.executemany(sql, lote)
+            insertadas += len(lote)
+            if insertadas % tramo == 0 or insertadas == cantidad:
+                ahora = time.perf_counter()
+                throughput.append(tramo / (ahora - inicio))
+                inicio = ahora
+
+        with DatabaseConnection(ruta) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            paginas = conn.execute(
+                "SELECT COUNT(*) FROM dbstat WHERE name = 'sqlite_autoindex_clientes_1'"
+            ).fetchone()[0]
+        cerrar_pools()
+        tamano = os.path.getsize(ruta)
+    return {"throughput": throughput, "tamano": tamano, "paginas_pk": paginas}
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tam_lote = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    logger.remove()
+
+    print(f"Clientes: {cantidad:,} (lotes de {tam_lote})")
+    for esquema in ESQUEMAS_ID:
+        r = medir(esquema, cantidad, tam_lote)
+        tramos = " ".join(f"{t:>8,.0f}" for t in r["throughput"])
+        print(
+            f"  {esquema}: filas/s por tramo [{tramos}]  "
+            f"archivo={r['tamano'] / 2**20:,.1f}MB  páginas PK={r['paginas_pk']:,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: importación de clientes desde archivos JSON y CSV.
+
+JSON: compara la importación anterior (json.load del archivo completo +
+lista de modelos validados + crear_lote) contra ImportadorJSON (parser
+incremental, validación por fila y lotes con checkpoint).
+
+CSV: compara CSVRepository.importar + crear_lote contra ImportadorCSV con
+1 proceso y con [procesos] procesos (por defecto os.cpu_count()).
+
+Cada método corre sobre una BD temporal vacía. Reporta filas/s y pico de
+memoria de Python del proceso principal (tracemalloc; no incluye los
+procesos del pool).
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_importacion.py [cantidad] [procesos]
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import Config
+from datos_sinteticos import generar_filas
+from src.database.migrations import crear_tablas
+from src.database.pool import cerrar_pools
+from src.models import TIPOS_CLIENTE
+from src.repositories.csv_repository import CSVRepository
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.services.importacion_csv import ImportadorCSV
+from src.services.importacion_json import ImportadorJSON
+from src.utils.logger import logger
+
+
+def escribir_archivo(ruta: str, cantidad: int):
+    """Arreglo JSON con el formato de exportación (indent=2)."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, fila in enumerate(generar_filas(cantidad)):
+            f.write(",\n  " if i else "\n  ")
+            f.write(json.dumps(fila, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+        f.write("\n]")
+
+
+def escribir_csv(ruta: str, cantidad: int):
+    """CSV con las columnas de exportación (CSVRepository.COLUMNAS)."""
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.DictWriter(f, CSVRepository.COLUMNAS, extrasaction="ignore")
+        escritor.writeheader()
+        escritor.writerows(generar_filas(cantidad))
+
+
+def importar_en_memoria(ruta: str) -> int:
+    """Ruta anterior: json.load + todos los modelos en una lista."""
+    with open(ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    clientes = [
+        TIPOS_CLIENTE[item.get("tipo_cliente", "Regular")].from_dict(item)
+        for item in datos
+    ]
+    return SQLiteRepository().crear_lote(clientes)["insertados"]
+
+
+def importar_streaming(ruta: str) -> int:
+    return ImportadorJSON(ruta, progreso=lambda avance: None).ejecutar()["insertados"]
+
+
+def importar_csv_secuencial(ruta: str) -> int:
+    """Ruta anterior: DictReader + modelos validados en una lista."""
+    repo = CSVRepository()
+    repo.ruta = ruta
+    return SQLiteRepository().crear_lote(repo.importar())["insertados"]
+
+
+def importar_csv_procesos(procesos: int):
+    def importar(ruta: str) -> int:
+        return ImportadorCSV(ruta, procesos=procesos).ejecutar()["insertados"]
+    return importar
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archivo = os.path.join(tmp, "clientes.json")
+        escribir_archivo(archivo, cantidad)
+        archivo_csv = os.path.join(tmp, "clientes.csv")
+        escribir_csv(archivo_csv, cantidad)
+        print(f"JSON: {cantidad:,} clientes, {os.path.getsize(archivo) / 2**20:,.1f} MB")
+        print(f"CSV:  {cantidad:,} clientes, {os.path.getsize(archivo_csv) / 2**20:,.1f} MB")
+        print(f"{'método':<14} {'filas/s':>9} {'pico MB':>9} {'insertados':>11}")
+
+        for nombre, funcion, ruta in (
+            ("memoria", importar_en_memoria, archivo),
+            ("streaming", importar_streaming, archivo),
+            ("csv anterior", importar_csv_secuencial, archivo_csv),
+            ("csv 1 proceso", importar_csv_procesos(1), archivo_csv),
+            (f"csv {procesos} proc.", importar_csv_procesos(procesos), archivo_csv),
+        ):
+            Config.DB_PATH = os.path.join(tmp, f"{nombre.replace(' ', '_')}.db")
+            crear_tablas(Config.DB_PATH)
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            insertados = funcion(ruta)
+            duracion = time.perf_counter() - inicio
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            cerrar_pools()
+            print(
+                f"{nombre:<14} {cantidad / duracion:>9,.0f} "
+                f"{pico / 2**20:>9.1f} {insertados:>11,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
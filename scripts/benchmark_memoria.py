@@ -0,0 +1,79 @@
+"""
+Benchmark: memoria de la jerarquía de clientes al cargar toda la tabla.
+
+Para cada tamaño se hidrata la tabla completa con from_storage (la ruta de
+listar()) en un proceso nuevo y se reporta:
+    - bytes por cliente de los modelos (tracemalloc)
+    - bytes por cliente de la copia to_dict()
+    - RSS máximo del proceso (incluye intérprete y SQLite)
+
+Uso:
+    PYTHONPATH=. python3 scripts/benchmark_memoria.py [cantidad ...]
+"""
+import multiprocessing
+import os
+import resource
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from benchmark_hidratacion import preparar_bd
+from src.models import TIPOS_CLIENTE
+from src.utils.logger import logger
+
+
+def _medir(ruta: str, resultados):
+    logger.remove()
+    conn = sqlite3.connect(ruta)
+    conn.row_factory = sqlite3.Row
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    clientes = [
+        TIPOS_CLIENTE[row["tipo_cliente"]].from_storage(dict(row))
+        for row in conn.execute("SELECT * FROM clientes")
+    ]
+    modelos = tracemalloc.get_traced_memory()[0] - base
+    dicts = [c.to_dict() for c in clientes]
+    copias = tracemalloc.get_traced_memory()[0] - base - modelos
+    tracemalloc.stop()
+
+    # ru_maxrss está en KiB en Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    resultados.put((len(clientes), modelos, copias, rss))
+    del dicts
+    conn.close()
+
+
+def medir(cantidad: int) -> tuple:
+    """Crea una BD con `cantidad` filas y mide la carga en un proceso aparte."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "bench.db")
+        preparar_bd(ruta, cantidad)
+        resultados = multiprocessing.Queue()
+        proceso = multiprocessing.Process(target=_medir, args=(ruta, resultados))
+        proceso.start()
+        resultado = resultados.get()
+        proceso.join()
+    return resultado
+
+
+def main():
+    cantidades = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    logger.remove()
+
+    print(f"{'clientes':>10} {'B/cliente':>10} {'B/to_dict':>10} {'RSS máx':>10}")
+    for cantidad in cantidades:
+        n, modelos, copias, rss = medir(cantidad)
+        print(
+            f"{n:>10,} {modelos / n:>10,.0f} {copias / n:>10,.0f} "
+            f"{rss / 2**20:>8,.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
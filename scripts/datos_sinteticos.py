@@ -0,0 +1,62 @@
+"""
+Generador de datos sintéticos para los benchmarks del proyecto GIC.
+
+Produce filas con el mismo formato que la tabla clientes (valores ya
+normalizados, como quedan tras pasar por los validadores).
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+NOMBRES = ("Juan", "María", "Carlos", "Ana", "Pedro", "Sofía", "Diego", "Lucía")
+APELLIDOS = ("Pérez", "López", "Díaz", "Muñoz", "Rojas", "Soto", "Silva", "Torres")
+NIVELES = ("Gold", "Platinum", "Diamond")
+TIPOS = ("Regular", "Premium", "Corporativo")
+
+
+def calcular_dv(cuerpo: int) -> str:
+    """Calcula el dígito verificador de un RUT chileno."""
+    suma, multiplicador = 0, 2
+    for digito in reversed(str(cuerpo)):
+        suma += int(digito) * multiplicador
+        multiplicador = multiplicador + 1 if multiplicador < 7 else 2
+    dv = 11 - suma % 11
+    return {11: "0", 10: "K"}.get(dv, str(dv))
+
+
+def generar_filas(n: int, semilla: int = 42):
+    """Genera n filas de clientes válidas (generador, memoria constante)."""
+    rnd = random.Random(semilla)
+    inicio = datetime(2024, 1, 1)
+    for i in range(n):
+        tipo = TIPOS[i % 3]
+        prefijo = rnd.randint(40, 68)
+        resto = rnd.randint(100000, 999999)
+        fecha = (inicio + timedelta(seconds=i * 7)).isoformat()
+        fila = {
+            "id": str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            "nombre": f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}",
+            "email": f"cliente{i}@example.com",
+            "telefono": f"+56 9 {prefijo}{str(resto)[:2]} {str(resto)[2:]}",
+            "direccion": f"Calle {rnd.randint(1, 9999)}, Santiago",
+            "activo": 1 if rnd.random() < 0.9 else 0,
+            "tipo_cliente": tipo,
+            "fecha_registro": fecha,
+            "fecha_actualizacion": fecha,
+        }
+        if tipo == "Regular":
+            fila["limite_credito"] = 500_000
+            fila["puntos_fidelidad"] = rnd.randint(0, 8000)
+        elif tipo == "Premium":
+            fila["asesor_dedicado"] = "Sin asignar"
+            fila["nivel_premium"] = rnd.choice(NIVELES)
+            fila["descuento"] = None
+        else:
+            cuerpo = rnd.randint(10_000_000, 99_999_999)
+            fila["rut_empresa"] = f"{cuerpo:,}".replace(",", ".") + f"-{calcular_dv(cuerpo)}"
+            fila["razon_social"] = f"Empresa {i} SpA"
+            fila["rubro"] = "Servicios"
+            fila["contacto_comercial"] = ""
+            fila["cantidad_empleados"] = rnd.randint(1, 500)
+            fila["descuento_volumen"] = None
+        yield fila
@@ -3,6 +3,7 @@ from src.services.cliente_service import ClienteService
 from src.exceptions.validation_errors import GICValidationError
 from src.exceptions.database_errors import RegistroNoEncontradoError, RegistroDuplicadoError
 from src.utils.logger import logger
+from config import Config
 
 cliente_bp = Blueprint("clientes", __name__)
 
@@ -16,8 +17,26 @@ def listar_clientes():
     tipo = request.args.get("tipo")
     activos = request.args.get("activos", "false").lower() == "true"
     busqueda = request.args.get("busqueda")
-    clientes = get_service().listar_clientes(activos_solo=activos, tipo=tipo, busqueda=busqueda)
-    return jsonify({"ok": True, "total": len(clientes), "clientes": [c.to_dict() for c in clientes]})
+    cursor = request.args.get("cursor")
+    try:
+        limite = int(request.args.get("limit", Config.PAGE_SIZE))
+        if limite < 1:
+            raise ValueError("limit debe ser mayor que 0")
+        clientes, siguiente = get_service().listar_vistas(
+            activos_solo=activos, tipo=tipo, busqueda=busqueda,
+            limite=min(limite, Config.PAGE_SIZE_MAX), cursor=cursor,
+            registrado_desde=request.args.get("registrado_desde"),
+            registrado_hasta=request.args.get("registrado_hasta"),
+            actualizado_desde=request.args.get("actualizado_desde"),
+        )
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({
+        "ok": True,
+        "total": len(clientes),
+        "clientes": [c.to_dict() for c in clientes],
+        "next_cursor": siguiente,
+    })
 
 
 @cliente_bp.route("/<id>", methods=["GET"])
@@ -29,6 +48,27 @@ def obtener_cliente(id):
         return jsonify({"ok": False, "error": str(e)}), 404
 
 
+@cliente_bp.route("/by-email/<email>", methods=["GET"])
+def obtener_por_email(email):
+    return _respuesta_busqueda(get_service().buscar_por_email(email), "email", email)
+
+
+@cliente_bp.route("/by-telefono/<telefono>", methods=["GET"])
+def obtener_por_telefono(telefono):
+    return _respuesta_busqueda(get_service().buscar_por_telefono(telefono), "teléfono", telefono)
+
+
+@cliente_bp.route("/by-rut/<rut>", methods=["GET"])
+def obtener_por_rut(rut):
+    return _respuesta_busqueda(get_service().buscar_por_rut(rut), "RUT", rut)
+
+
+def _respuesta_busqueda(cliente, campo: str, valor: str):
+    if cliente is None:
+        return jsonify({"ok": False, "error": f"No existe cliente con {campo} '{valor}'"}), 404
+    return jsonify({"ok": True, "cliente": cliente.to_dict()})
+
+
 @cliente_bp.route("", methods=["POST"])
 def crear_cliente():
     datos = request.get_json()
@@ -46,6 +86,41 @@ def crear_cliente():
         return jsonify({"ok": False, "error": str(e)}), 400
 
 
+@cliente_bp.route("/by-email/<email>", methods=["PUT"])
+def guardar_por_email(email):
+    datos = request.get_json()
+    if not datos:
+        return jsonify({"ok": False, "error": "Se requiere body JSON"}), 400
+    datos.pop("email", None)
+    tipo = datos.pop("tipo", "Regular")
+    try:
+        cliente, creado = get_service().guardar_por_email(email, tipo, **datos)
+    except GICValidationError as e:
+        return jsonify({"ok": False, "error": str(e), "campo": e.campo}), 422
+    except RegistroDuplicadoError as e:
+        return jsonify({"ok": False, "error": str(e)}), 409
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    mensaje = "Cliente creado" if creado else "Cliente actualizado"
+    return jsonify({
+        "ok": True, "mensaje": mensaje, "creado": creado, "cliente": cliente.to_dict()
+    }), 201 if creado else 200
+
+
+@cliente_bp.route("/merge", methods=["POST"])
+def fusionar_clientes():
+    filas = request.get_json()
+    if not isinstance(filas, list):
+        return jsonify({"ok": False, "error": "Se requiere una lista JSON de clientes"}), 400
+    if not all(isinstance(fila, dict) for fila in filas):
+        return jsonify({"ok": False, "error": "Cada cliente debe ser un objeto JSON"}), 400
+    try:
+        resultado = get_service().fusionar_lote(filas)
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({"ok": True, **resultado})
+
+
 @cliente_bp.route("/<id>", methods=["PUT"])
 def actualizar_cliente(id):
     datos = request.get_json()
@@ -72,34 +147,81 @@ def eliminar_cliente(id):
 @cliente_bp.route("/<id>/toggle", methods=["PATCH"])
 def toggle_cliente(id):
     try:
-        service = get_service()
-        cliente = service.obtener_cliente(id)
-        if cliente.activo:
-            service.desactivar_cliente(id)
-            estado = "desactivado"
-        else:
-            cliente.activar()
-            from src.repositories.sqlite_repository import SQLiteRepository
-            SQLiteRepository().actualizar(cliente)
-            estado = "activado"
-        return jsonify({"ok": True, "mensaje": f"Cliente {estado}"})
+        activo = get_service().alternar_activo(id)
+        estado = "activado" if activo else "desactivado"
+        return jsonify({"ok": True, "mensaje": f"Cliente {estado}", "activo": activo})
+    except RegistroNoEncontradoError as e:
+        return jsonify({"ok": False, "error": str(e)}), 404
+
+
+@cliente_bp.route("/<id>/puntos", methods=["POST"])
+def agregar_puntos(id):
+    data = request.get_json() or {}
+    try:
+        total = get_service().agregar_puntos(id, int(data.get("puntos", 0)))
+        return jsonify({"ok": True, "puntos_fidelidad": total})
+    except (TypeError, ValueError) as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
     except RegistroNoEncontradoError as e:
         return jsonify({"ok": False, "error": str(e)}), 404
 
 
+@cliente_bp.route("/<id>/historial", methods=["GET"])
+def historial_cliente(id):
+    try:
+        limite = int(request.args.get("limit", 100))
+        if limite < 1:
+            raise ValueError("limit debe ser mayor que 0")
+    except ValueError as e:
+        # Un LIMIT negativo en SQLite devolvería el historial completo
+        return jsonify({"ok": False, "error": str(e)}), 400
+    eventos = get_service().historial_cliente(id, limite)
+    return jsonify({"ok": True, "historial": eventos, "total": len(eventos)})
+
+
 @cliente_bp.route("/stats", methods=["GET"])
 def estadisticas():
     stats = get_service().estadisticas()
     return jsonify({"ok": True, "estadisticas": stats})
 
 
+def _activo_param():
+    activo = request.args.get("activo")
+    return None if activo is None else activo.lower() == "true"
+
+
 @cliente_bp.route("/export/json", methods=["POST"])
 def exportar_json():
-    ruta = get_service().exportar_json()
+    try:
+        ruta = get_service().exportar_json(compresion=request.args.get("compresion"))
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
     return jsonify({"ok": True, "mensaje": "Exportado a JSON", "ruta": ruta})
 
 
+@cliente_bp.route("/export/ndjson", methods=["POST"])
+def exportar_ndjson():
+    try:
+        ruta = get_service().exportar_ndjson(
+            compresion=request.args.get("compresion"),
+            tipo=request.args.get("tipo"),
+            activo=_activo_param(),
+        )
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({"ok": True, "mensaje": "Exportado a NDJSON", "ruta": ruta})
+
+
 @cliente_bp.route("/export/csv", methods=["POST"])
 def exportar_csv():
-    ruta = get_service().exportar_csv()
+    columnas = request.args.get("columnas")
+    try:
+        ruta = get_service().exportar_csv(
+            columnas=columnas.split(",") if columnas else None,
+            tipo=request.args.get("tipo"),
+            activo=_activo_param(),
+            compresion=request.args.get("compresion"),
+        )
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
     return jsonify({"ok": True, "mensaje": "Exportado a CSV", "ruta": ruta})
@@ -1,4 +1,6 @@
 from flask import Blueprint, jsonify
+from src.database.connection import DatabaseConnection
+from src.services.cache_clientes import obtener_cache_clientes
 
 health_bp = Blueprint("health", __name__)
 
@@ -15,3 +17,13 @@ def home():
 @health_bp.route("/health", methods=["GET"])
 def health_check():
     return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route("/health/db", methods=["GET"])
+def health_db():
+    return jsonify({"status": "ok", "pool": DatabaseConnection.estadisticas_pool()}), 200
+
+
+@health_bp.route("/health/cache", methods=["GET"])
+def health_cache():
+    return jsonify({"status": "ok", "cache": obtener_cache_clientes().estadisticas()}), 200
@@ -1,11 +1,22 @@
 """
 Módulo de conexión a base de datos SQLite.
 Implementa context manager para manejo seguro de conexiones.
+Las conexiones se toman de un pool compartido (ver src/database/pool.py).
 """
 import sqlite3
 import os
+from config import Config
+from src.database.pool import obtener_pool
 from src.utils.logger import logger
-from src.exceptions.database_errors import ConexionDBError
+
+RAIZ_PROYECTO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def ruta_db_por_defecto() -> str:
+    """Ruta de la BD según Config.DB_PATH (relativa a la raíz del proyecto)."""
+    if os.path.isabs(Config.DB_PATH):
+        return Config.DB_PATH
+    return os.path.join(RAIZ_PROYECTO, Config.DB_PATH)
 
 
 class DatabaseConnection:
@@ -16,30 +27,40 @@ class DatabaseConnection:
         with DatabaseConnection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM clientes")
+
+    perfil (ver obtener_pool) solo puede elegirse antes de que exista el
+    pool de la BD; un perfil distinto al del pool lanza ValueError.
     """
 
-    def __init__(self, db_path: str = None):
-        self.db_path = db_path or os.path.join(
-            os.path.dirname(__file__), "gic.db"
-        )
+    def __init__(self, db_path: str = None, perfil=None):
+        self.db_path = db_path or ruta_db_por_defecto()
+        self.pool = obtener_pool(self.db_path, perfil=perfil)
         self.connection = None
 
     def __enter__(self):
-        try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row  # Acceso por nombre de columna
-            self.connection.execute("PRAGMA foreign_keys = ON")
-            return self.connection
-        except sqlite3.Error as e:
-            logger.error(f"Error al conectar a DB: {e}")
-            raise ConexionDBError(f"No se pudo conectar a '{self.db_path}': {e}")
+        self.connection = self.pool.obtener()
+        return self.connection
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.connection:
-            if exc_type is None:
-                self.connection.commit()
-            else:
-                self.connection.rollback()
-                logger.error(f"Rollback por error: {exc_val}")
-            self.connection.close()
+            descartar = False
+            try:
+                if exc_type is None:
+                    self.connection.commit()
+                else:
+                    self.connection.rollback()
+                    logger.error(f"Rollback por error: {exc_val}")
+            except sqlite3.Error as e:
+                logger.error(f"Error al cerrar transacción: {e}")
+                descartar = True
+                if exc_type is None:
+                    raise
+            finally:
+                self.pool.devolver(self.connection, descartar=descartar)
+                self.connection = None
         return False  # No suprimir excepciones
+
+    @staticmethod
+    def estadisticas_pool(db_path: str = None) -> dict:
+        """Métricas del pool asociado a la BD (checkouts, esperas, abiertas)."""
+        return obtener_pool(db_path or ruta_db_por_defecto()).estadisticas()
@@ -0,0 +1,154 @@
+"""
+Contadores de estadísticas de clientes mantenidos por triggers.
+
+La tabla clientes_stats guarda un contador por clave:
+    total, tipo:<tipo>, activo:<0|1>, nivel:<nivel premium>,
+    tamano:<banda de empleados> (solo corporativos)
+Los triggers de clientes la mantienen al día en cada INSERT/UPDATE/DELETE,
+por lo que leer las estadísticas es una sola consulta sobre pocas filas.
+
+Verificación de consistencia desde consola:
+    python -m src.database.estadisticas            # compara contra un recuento
+    python -m src.database.estadisticas --reparar  # recalcula los contadores
+"""
+import sys
+from src.database.connection import DatabaseConnection
+from src.utils.logger import logger
+
+# Bandas de tamaño corporativo (mismos cortes que el descuento por volumen)
+BANDAS_TAMANO = ("1-10", "11-50", "51-200", "201+")
+
+_BANDA_SQL = """
+    CASE WHEN {p}.tipo_cliente != 'Corporativo' THEN NULL
+         WHEN COALESCE({p}.cantidad_empleados, 1) <= 10 THEN 'tamano:1-10'
+         WHEN {p}.cantidad_empleados <= 50 THEN 'tamano:11-50'
+         WHEN {p}.cantidad_empleados <= 200 THEN 'tamano:51-200'
+         ELSE 'tamano:201+' END
+"""
+
+# Claves que aporta una fila ({p} = new/old en triggers, c en recuentos)
+_CLAVES_SQL = """
+    SELECT 'total' AS clave
+    UNION ALL SELECT 'tipo:' || {p}.tipo_cliente
+    UNION ALL SELECT 'activo:' || {p}.activo
+    UNION ALL SELECT CASE WHEN {p}.tipo_cliente = 'Premium'
+                          THEN 'nivel:' || {p}.nivel_premium END
+    UNION ALL SELECT """ + _BANDA_SQL
+
+
+def _sql_delta(p: str, delta: int) -> str:
+    """UPSERT que suma delta a cada contador de la fila {p}."""
+    return f"""
+        INSERT INTO clientes_stats (clave, cantidad)
+        SELECT clave, {delta} FROM ({_CLAVES_SQL.format(p=p)})
+        WHERE clave IS NOT NULL
+        ON CONFLICT(clave) DO UPDATE SET cantidad = cantidad + excluded.cantidad;
+    """
+
+
+def crear_contadores(conn):
+    """Crea clientes_stats, sus triggers y hace el recuento inicial."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS clientes_stats (
+            clave TEXT PRIMARY KEY,
+            cantidad INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS clientes_stats_insert
+        AFTER INSERT ON clientes BEGIN
+            {_sql_delta("new", 1)}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS clientes_stats_delete
+        AFTER DELETE ON clientes BEGIN
+            {_sql_delta("old", -1)}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS clientes_stats_update
+        AFTER UPDATE OF tipo_cliente, activo, nivel_premium, cantidad_empleados
+        ON clientes
+        WHEN old.tipo_cliente IS NOT new.tipo_cliente
+          OR old.activo IS NOT new.activo
+          OR old.nivel_premium IS NOT new.nivel_premium
+          OR old.cantidad_empleados IS NOT new.cantidad_empleados
+        BEGIN
+            {_sql_delta("old", -1)}
+            {_sql_delta("new", 1)}
+        END
+    """)
+    _recontar(conn)
+
+
+def _recuento_real(conn) -> dict:
+    """Recuento completo de cada clave (un solo scan de clientes)."""
+    filas = conn.execute(f"""
+        SELECT c.tipo_cliente, c.activo,
+               CASE WHEN c.tipo_cliente = 'Premium' THEN 'nivel:' || c.nivel_premium END,
+               {_BANDA_SQL.format(p="c")},
+               COUNT(*)
+        FROM clientes c GROUP BY 1, 2, 3, 4
+    """)
+    reales = {}
+    for tipo, activo, nivel, banda, cantidad in filas:
+        for clave in ("total", f"tipo:{tipo}", f"activo:{activo}", nivel, banda):
+            if clave is not None:
+                reales[clave] = reales.get(clave, 0) + cantidad
+    return reales
+
+
+def _recontar(conn):
+    conn.execute("DELETE FROM clientes_stats")
+    conn.executemany(
+        "INSERT INTO clientes_stats (clave, cantidad) VALUES (?, ?)",
+        _recuento_real(conn).items(),
+    )
+
+
+def leer_contadores(conn) -> dict:
+    """Lee todos los contadores (una consulta, pocas filas)."""
+    return {
+        row[0]: row[1]
+        for row in conn.execute("SELECT clave, cantidad FROM clientes_stats")
+    }
+
+
+def verificar_estadisticas(db_path: str = None) -> dict:
+    """
+    Compara los contadores contra un recuento completo.
+    Retorna {clave: (contador, real)} solo con las claves que difieren.
+    """
+    with DatabaseConnection(db_path) as conn:
+        conn.execute("BEGIN")  # Lectura consistente de ambas tablas
+        contadores = leer_contadores(conn)
+        reales = _recuento_real(conn)
+    diferencias = {}
+    for clave in set(contadores) | set(reales):
+        contador, real = contadores.get(clave, 0), reales.get(clave, 0)
+        if contador != real:
+            diferencias[clave] = (contador, real)
+    return diferencias
+
+
+def recontar_estadisticas(db_path: str = None):
+    """Recalcula todos los contadores desde la tabla clientes."""
+    with DatabaseConnection(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _recontar(conn)
+    logger.info("Contadores de estadísticas recalculados")
+
+
+if __name__ == "__main__":
+    diferencias = verificar_estadisticas()
+    if not diferencias:
+        print("✅ Contadores de estadísticas consistentes")
+        sys.exit(0)
+    for clave, (contador, real) in sorted(diferencias.items()):
+        print(f"⚠️  {clave}: contador={contador} real={real}")
+    if "--reparar" in sys.argv:
+        recontar_estadisticas()
+        print("✅ Contadores recalculados")
+    else:
+        sys.exit(1)
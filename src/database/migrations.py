@@ -1,76 +1,567 @@
 """
-Módulo de migraciones para crear las tablas del sistema GIC.
+Módulo de migraciones versionadas del sistema GIC.
+
+Cada migración tiene un número de versión, una descripción y una función
+que recibe la conexión. Las aplicadas se registran en la tabla
+schema_version, de modo que al arrancar basta una verificación rápida.
+
+Las migraciones que deben recorrer datos existentes (rellenar columnas
+derivadas, poblar índices) declaran un backfill: se ejecuta en lotes de
+tamaño acotado, cada uno en su propia transacción, guardando el avance en
+schema_backfills para poder reanudarlo si se interrumpe. Las que dependen
+de datos ya completos (p. ej. un índice UNIQUE sobre una columna derivada)
+declaran un paso final que corre tras los backfills anteriores.
+
+Uso desde consola:
+    python -m src.database.migrations            # aplica lo pendiente
+    python -m src.database.migrations --estado   # muestra versión y backfills
 """
-from src.database.connection import DatabaseConnection
+import sqlite3
+import sys
+from typing import Optional
+from config import Config
+from src.database.connection import DatabaseConnection, ruta_db_por_defecto
+from src.database.pool import obtener_pool
+from src.database.estadisticas import crear_contadores
+from src.utils.helpers import timestamp_actual
 from src.utils.logger import logger
+from src.utils.validators import normalizar_email, normalizar_rut, normalizar_telefono
+
+# (version, descripcion, funcion, backfill, finalizar)
+MIGRACIONES = []
+
+# Rutas de BD ya verificadas en este proceso (evita repetir la consulta)
+_verificadas = set()
+
+
+def migracion(version: int, descripcion: str, backfill=None, finalizar=None):
+    """
+    Decorador que registra una migración.
+
+    backfill (opcional): función (conn, desde, hasta) que procesa las filas
+    de clientes con rowid en el rango (desde, hasta].
+    finalizar (opcional): función (conn) -> bool que corre en la
+    transacción del último lote, cuando ya terminaron este backfill y los
+    de migraciones anteriores. Si retorna False la migración queda
+    pendiente y se reintenta en la próxima ejecución de migrar().
+    """
+    def registrar(funcion):
+        MIGRACIONES.append((version, descripcion, funcion, backfill, finalizar))
+        MIGRACIONES.sort(key=lambda m: m[0])
+        return funcion
+    return registrar
+
+
+def ultima_version() -> int:
+    return MIGRACIONES[-1][0] if MIGRACIONES else 0
+
+
+# ==================== UTILIDADES PARA MIGRACIONES ====================
+
+def agregar_columna(conn, tabla: str, columna: str, definicion: str):
+    """ALTER TABLE ADD COLUMN idempotente (no falla si la columna ya existe)."""
+    existentes = {row[1] for row in conn.execute(f"PRAGMA table_info({tabla})")}
+    if columna not in existentes:
+        conn.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+
+
+# ==================== MIGRACIONES ====================
+
+@migracion(1, "Tablas clientes y logs_actividad")
+def _m001_tablas_base(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS clientes (
+            id TEXT PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            telefono TEXT NOT NULL,
+            direccion TEXT NOT NULL,
+            activo INTEGER DEFAULT 1,
+            tipo_cliente TEXT NOT NULL DEFAULT 'Regular',
+            fecha_registro TEXT NOT NULL,
+            fecha_actualizacion TEXT NOT NULL,
+
+            -- Campos ClienteRegular
+            limite_credito REAL,
+            puntos_fidelidad INTEGER DEFAULT 0,
+
+            -- Campos ClientePremium
+            asesor_dedicado TEXT,
+            nivel_premium TEXT,
+            descuento REAL,
+
+            -- Campos ClienteCorporativo
+            rut_empresa TEXT,
+            razon_social TEXT,
+            rubro TEXT,
+            contacto_comercial TEXT,
+            cantidad_empleados INTEGER,
+            descuento_volumen REAL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS logs_actividad (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            accion TEXT NOT NULL,
+            entidad TEXT NOT NULL,
+            entidad_id TEXT,
+            detalle TEXT,
+            fecha TEXT NOT NULL
+        )
+    """)
+
 
+@migracion(2, "Índices para búsquedas frecuentes")
+def _m002_indices(conn):
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_clientes_email ON clientes(email)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_clientes_tipo ON clientes(tipo_cliente)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_clientes_activo ON clientes(activo)")
 
-def crear_tablas():
-    """Crea todas las tablas necesarias si no existen."""
-    with DatabaseConnection() as conn:
-        cursor = conn.cursor()
-
-        # Tabla principal de clientes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS clientes (
-                id TEXT PRIMARY KEY,
-                nombre TEXT NOT NULL,
-                email TEXT NOT NULL UNIQUE,
-                telefono TEXT NOT NULL,
-                direccion TEXT NOT NULL,
-                activo INTEGER DEFAULT 1,
-                tipo_cliente TEXT NOT NULL DEFAULT 'Regular',
-                fecha_registro TEXT NOT NULL,
-                fecha_actualizacion TEXT NOT NULL,
-
-                -- Campos ClienteRegular
-                limite_credito REAL,
-                puntos_fidelidad INTEGER DEFAULT 0,
-
-                -- Campos ClientePremium
-                asesor_dedicado TEXT,
-                nivel_premium TEXT,
-                descuento REAL,
-
-                -- Campos ClienteCorporativo
-                rut_empresa TEXT,
-                razon_social TEXT,
-                rubro TEXT,
-                contacto_comercial TEXT,
-                cantidad_empleados INTEGER,
-                descuento_volumen REAL
+
+# Columnas del índice de búsqueda full-text. Los teléfonos y RUT se indexan
+# también solo con dígitos para encontrar "944556677" o "76124890".
+_FTS_COLUMNAS = (
+    "nombre, email, telefono, razon_social, rut_empresa, "
+    "telefono_digitos, rut_digitos"
+)
+_FTS_VALORES = """
+    {p}.nombre, {p}.email, {p}.telefono, {p}.razon_social, {p}.rut_empresa,
+    replace(replace(replace({p}.telefono, ' ', ''), '+', ''), '-', '')
+        || ' ' ||
+    replace(replace(substr({p}.telefono, instr({p}.telefono, ' ') + 1), ' ', ''), '-', ''),
+    replace(replace({p}.rut_empresa, '.', ''), '-', '')
+"""
+
+
+def _fts_existe(conn) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clientes_fts'"
+    ).fetchone() is not None
+
+
+def _backfill_busqueda(conn, desde: int, hasta: int):
+    """Indexa en clientes_fts los clientes del rango de rowid (idempotente)."""
+    if not _fts_existe(conn):
+        return
+    conn.execute(f"""
+        INSERT OR REPLACE INTO clientes_fts (rowid, {_FTS_COLUMNAS})
+        SELECT c.rowid, {_FTS_VALORES.format(p="c")} FROM clientes c
+        WHERE c.rowid > ? AND c.rowid <= ?
+    """, (desde, hasta))
+
+
+@migracion(3, "Índice full-text clientes_fts (FTS5)", backfill=_backfill_busqueda)
+def _m003_busqueda_full_text(conn):
+    """
+    Tabla FTS5 de búsqueda (sin distinción de tildes ni mayúsculas) y
+    triggers que la mantienen sincronizada con clientes.
+
+    Nota: las filas se enlazan por rowid; tras un VACUUM usar
+    reconstruir_indice_busqueda().
+    """
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS clientes_fts USING fts5(
+                {_FTS_COLUMNAS},
+                tokenize = 'unicode61 remove_diacritics 2'
             )
         """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"FTS5 no disponible, la búsqueda usará LIKE: {e}")
+        return
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS clientes_fts_insert
+        AFTER INSERT ON clientes BEGIN
+            INSERT INTO clientes_fts (rowid, {_FTS_COLUMNAS})
+            VALUES (new.rowid, {_FTS_VALORES.format(p="new")});
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS clientes_fts_delete
+        AFTER DELETE ON clientes BEGIN
+            DELETE FROM clientes_fts WHERE rowid = old.rowid;
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS clientes_fts_update
+        AFTER UPDATE OF nombre, email, telefono, razon_social, rut_empresa
+        ON clientes BEGIN
+            DELETE FROM clientes_fts WHERE rowid = old.rowid;
+            INSERT INTO clientes_fts (rowid, {_FTS_COLUMNAS})
+            VALUES (new.rowid, {_FTS_VALORES.format(p="new")});
+        END
+    """)
+
+
+@migracion(4, "Índices de paginación keyset (fecha_registro, id)")
+def _m004_indices_paginacion(conn):
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_fecha_id
+        ON clientes(fecha_registro DESC, id DESC)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_tipo_fecha_id
+        ON clientes(tipo_cliente, fecha_registro DESC, id DESC)
+    """)
+
+
+@migracion(5, "Contadores de estadísticas clientes_stats (triggers)")
+def _m005_contadores_estadisticas(conn):
+    """
+    El recuento inicial se hace dentro de la misma transacción que crea los
+    triggers (un solo scan): un backfill por lotes no sería consistente con
+    las actualizaciones concurrentes de filas aún no contadas.
+    """
+    crear_contadores(conn)
+
+
+@migracion(6, "Índice de historial en logs_actividad")
+def _m006_indice_logs(conn):
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_logs_entidad
+        ON logs_actividad(entidad_id, id)
+    """)
+
+
+def _backfill_epoch(conn, desde: int, hasta: int):
+    """Completa fecha_registro_ts / fecha_actualizacion_ts desde el texto ISO."""
+    conn.execute("""
+        UPDATE clientes SET
+            fecha_registro_ts = COALESCE(
+                fecha_registro_ts,
+                CAST(strftime('%s', fecha_registro, 'utc') AS INTEGER)),
+            fecha_actualizacion_ts = COALESCE(
+                fecha_actualizacion_ts,
+                CAST(strftime('%s', fecha_actualizacion, 'utc') AS INTEGER))
+        WHERE rowid > ? AND rowid <= ?
+          AND (fecha_registro_ts IS NULL OR fecha_actualizacion_ts IS NULL)
+    """, (desde, hasta))
+
+
+@migracion(7, "Fechas en epoch (segundos) para filtros por rango", backfill=_backfill_epoch)
+def _m007_fechas_epoch(conn):
+    """
+    Las fechas ISO se conservan (to_dict, orden keyset); las columnas _ts
+    las escribe el repositorio en cada operación. El modificador 'utc' de
+    strftime interpreta el texto como hora local, igual que
+    datetime.timestamp() en epoch_desde_iso().
+    """
+    agregar_columna(conn, "clientes", "fecha_registro_ts", "INTEGER")
+    agregar_columna(conn, "clientes", "fecha_actualizacion_ts", "INTEGER")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_registro_ts
+        ON clientes(fecha_registro_ts)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_actualizacion_ts
+        ON clientes(fecha_actualizacion_ts)
+    """)
 
-        # Tabla de logs de actividad
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS logs_actividad (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                accion TEXT NOT NULL,
-                entidad TEXT NOT NULL,
-                entidad_id TEXT,
-                detalle TEXT,
-                fecha TEXT NOT NULL
+
+def _backfill_claves_normalizadas(conn, desde: int, hasta: int):
+    """Calcula email_normalizado, telefono_e164 y rut_digitos del rango."""
+    filas = conn.execute("""
+        SELECT rowid, email, telefono, rut_empresa FROM clientes
+        WHERE rowid > ? AND rowid <= ?
+    """, (desde, hasta)).fetchall()
+    conn.executemany("""
+        UPDATE clientes
+        SET email_normalizado = ?, telefono_e164 = ?, rut_digitos = ?
+        WHERE rowid = ?
+    """, [
+        (normalizar_email(email), normalizar_telefono(telefono), normalizar_rut(rut), rowid)
+        for rowid, email, telefono, rut in filas
+    ])
+
+
+@migracion(
+    8, "Claves normalizadas: email_normalizado, telefono_e164, rut_digitos",
+    backfill=_backfill_claves_normalizadas,
+)
+def _m008_claves_normalizadas(conn):
+    """
+    Columnas derivadas que el repositorio mantiene en cada escritura
+    (ver normalizar_* en src/utils/validators.py). El índice de email no
+    es UNIQUE: pueden existir registros previos que solo difieren en
+    mayúsculas.
+    """
+    agregar_columna(conn, "clientes", "email_normalizado", "TEXT")
+    agregar_columna(conn, "clientes", "telefono_e164", "TEXT")
+    agregar_columna(conn, "clientes", "rut_digitos", "TEXT")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_email_normalizado
+        ON clientes(email_normalizado)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_telefono_e164
+        ON clientes(telefono_e164)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clientes_rut_digitos
+        ON clientes(rut_digitos)
+    """)
+
+
+def _emails_repetidos(conn, limite: int = 20) -> list:
+    """Grupos de clientes cuyos emails solo difieren en mayúsculas."""
+    return [
+        {"email_normalizado": row[0], "ids": row[1].split(",")}
+        for row in conn.execute("""
+            SELECT email_normalizado, group_concat(id) FROM clientes
+            WHERE email_normalizado IS NOT NULL
+            GROUP BY email_normalizado HAVING COUNT(*) > 1
+            ORDER BY email_normalizado LIMIT ?
+        """, (limite,))
+    ]
+
+
+def _finalizar_email_unico(conn) -> bool:
+    """
+    Reemplaza el índice de email_normalizado por uno UNIQUE. Si hay
+    emails repetidos sin distinguir mayúsculas los reporta y deja la
+    migración pendiente: la aplicación arranca igual, pero el upsert por
+    email no está disponible hasta unificar esos clientes.
+    """
+    repetidos = _emails_repetidos(conn)
+    if repetidos:
+        logger.error(
+            "No se pudo crear el índice UNIQUE de email_normalizado; "
+            f"clientes con emails repetidos sin distinguir mayúsculas: {repetidos}"
+        )
+        return False
+    conn.execute("DROP INDEX IF EXISTS idx_clientes_email_normalizado")
+    conn.execute("""
+        CREATE UNIQUE INDEX idx_clientes_email_normalizado
+        ON clientes(email_normalizado)
+    """)
+    return True
+
+
+@migracion(
+    9, "Email único sin distinguir mayúsculas (email_normalizado)",
+    finalizar=_finalizar_email_unico,
+)
+def _m009_email_normalizado_unico(conn):
+    """
+    El upsert por email usa ON CONFLICT(email_normalizado), que exige un
+    índice UNIQUE. Se crea en el paso final, cuando el backfill de la
+    migración 8 ya calculó email_normalizado en todas las filas.
+    """
+
+
+# ==================== MOTOR DE MIGRACIONES ====================
+
+def _crear_tablas_control(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            descripcion TEXT NOT NULL,
+            aplicada TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_backfills (
+            version INTEGER PRIMARY KEY,
+            cursor INTEGER NOT NULL DEFAULT 0,
+            limite INTEGER NOT NULL DEFAULT 0,
+            completado INTEGER NOT NULL DEFAULT 0,
+            actualizado TEXT
+        )
+    """)
+
+
+def version_actual(conn) -> int:
+    """Versión de esquema aplicada (0 si la BD no tiene schema_version)."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
+
+
+def _backfills_pendientes(conn) -> list:
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT version FROM schema_backfills WHERE completado = 0 ORDER BY version"
+        )]
+    except sqlite3.OperationalError:
+        return []
+
+
+def _aplicar(db_path: str, version: int, descripcion: str, funcion, backfill, finalizar):
+    """Aplica una migración en una transacción (BEGIN IMMEDIATE)."""
+    with DatabaseConnection(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        # Otro proceso pudo aplicarla mientras esperábamos el lock
+        if version_actual(conn) >= version:
+            return
+        funcion(conn)
+        if backfill or finalizar:
+            limite = 0
+            if backfill:
+                limite = conn.execute("SELECT MAX(rowid) FROM clientes").fetchone()[0] or 0
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_backfills "
+                "(version, cursor, limite, completado, actualizado) VALUES (?, 0, ?, ?, ?)",
+                (version, limite, int(limite == 0 and not finalizar), timestamp_actual()),
             )
-        """)
+        conn.execute(
+            "INSERT INTO schema_version (version, descripcion, aplicada) VALUES (?, ?, ?)",
+            (version, descripcion, timestamp_actual()),
+        )
+    logger.info(f"Migración {version} aplicada: {descripcion}")
+
+
+def _ejecutar_lote(
+    db_path: str, version: int, backfill, finalizar, tam_lote: int
+) -> Optional[bool]:
+    """
+    Procesa un lote del backfill. Retorna True si quedó completado, False
+    si quedan lotes y None si el paso final no pudo completarse.
+    """
+    with DatabaseConnection(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        estado = conn.execute(
+            "SELECT cursor, limite, completado FROM schema_backfills WHERE version = ?",
+            (version,),
+        ).fetchone()
+        if estado is None or estado["completado"]:
+            return True
+        desde, limite = estado["cursor"], estado["limite"]
+        row = conn.execute(
+            "SELECT rowid FROM clientes WHERE rowid > ? AND rowid <= ? "
+            "ORDER BY rowid LIMIT 1 OFFSET ?",
+            (desde, limite, tam_lote - 1),
+        ).fetchone()
+        hasta = row[0] if row else limite
+        if backfill:
+            backfill(conn, desde, hasta)
+        completado = hasta >= limite
+        bloqueado = completado and finalizar is not None and not finalizar(conn)
+        conn.execute(
+            "UPDATE schema_backfills SET cursor = ?, completado = ?, actualizado = ? "
+            "WHERE version = ?",
+            (hasta, int(completado and not bloqueado), timestamp_actual(), version),
+        )
+    return None if bloqueado else completado
+
+
+def ejecutar_backfills(db_path: str = None, tam_lote: int = None, max_lotes: int = None) -> bool:
+    """
+    Ejecuta los backfills pendientes en lotes acotados, cada uno en su
+    propia transacción (no retiene el lock de escritura por minutos).
+    Con max_lotes se detiene antes y retorna False; se reanuda luego.
+    """
+    db_path = db_path or ruta_db_por_defecto()
+    tam_lote = tam_lote or Config.DB_MIGRATION_BATCH_SIZE
+    backfills = {m[0]: (m[3], m[4]) for m in MIGRACIONES if m[3] or m[4]}
+    lotes = 0
+
+    with DatabaseConnection(db_path) as conn:
+        pendientes = _backfills_pendientes(conn)
+
+    for version in pendientes:
+        if version not in backfills:
+            continue
+        backfill, finalizar = backfills[version]
+        while True:
+            if max_lotes is not None and lotes >= max_lotes:
+                return False
+            lotes += 1
+            completado = _ejecutar_lote(db_path, version, backfill, finalizar, tam_lote)
+            if completado is None:
+                # Las migraciones posteriores pueden depender de esta
+                logger.warning(f"Migración {version} pendiente: se reintentará al migrar")
+                return False
+            if completado:
+                logger.info(f"Backfill de la migración {version} completado")
+                break
+    return True
+
+
+def migrar(db_path: str = None, tam_lote: int = None):
+    """
+    Lleva la BD a la última versión: aplica las migraciones pendientes en
+    orden y luego sus backfills por lotes. Si la BD ya está al día solo se
+    consulta schema_version (una vez por proceso).
+    """
+    db_path = db_path or ruta_db_por_defecto()
+    if db_path in _verificadas:
+        return
+
+    with DatabaseConnection(db_path) as conn:
+        actual = version_actual(conn)
+        pendientes_bf = _backfills_pendientes(conn)
+    if actual >= ultima_version() and not pendientes_bf:
+        _verificadas.add(db_path)
+        return
+
+    with DatabaseConnection(db_path) as conn:
+        _crear_tablas_control(conn)
+
+    for version, descripcion, funcion, backfill, finalizar in MIGRACIONES:
+        if version > actual:
+            _aplicar(db_path, version, descripcion, funcion, backfill, finalizar)
+
+    if ejecutar_backfills(db_path, tam_lote):
+        _verificadas.add(db_path)
+
+
+def crear_tablas(db_path: str = None, perfil=None):
+    """
+    Crea/actualiza el esquema de la BD (aplica las migraciones pendientes).
+    El perfil de PRAGMA (p. ej. WAL) se aplica al crear el pool de la BD;
+    lanza ValueError si el pool ya existe con otro perfil.
+    """
+    db_path = db_path or ruta_db_por_defecto()
+    obtener_pool(db_path, perfil=perfil)
+    migrar(db_path)
+    logger.info("Tablas creadas/verificadas exitosamente")
+
+
+def reconstruir_indice_busqueda(db_path: str = None):
+    """Vacía y vuelve a poblar el índice full-text (p. ej. tras un VACUUM)."""
+    with DatabaseConnection(db_path) as conn:
+        if not _fts_existe(conn):
+            return
+        conn.execute("DELETE FROM clientes_fts")
+        limite = conn.execute("SELECT MAX(rowid) FROM clientes").fetchone()[0] or 0
+        _backfill_busqueda(conn, 0, limite)
+
+
+def estado(db_path: str = None) -> dict:
+    """Versión actual, última disponible y avance de los backfills."""
+    with DatabaseConnection(db_path) as conn:
+        actual = version_actual(conn)
+        try:
+            backfills = [dict(row) for row in conn.execute(
+                "SELECT * FROM schema_backfills ORDER BY version"
+            )]
+        except sqlite3.OperationalError:
+            backfills = []
+    return {"version": actual, "ultima": ultima_version(), "backfills": backfills}
 
-        # Índices para búsquedas frecuentes
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_clientes_email
-            ON clientes(email)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_clientes_tipo
-            ON clientes(tipo_cliente)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_clientes_activo
-            ON clientes(activo)
-        """)
 
-        logger.info("Tablas creadas/verificadas exitosamente")
+def emails_repetidos(db_path: str = None) -> list:
+    """
+    Clientes que impiden el índice UNIQUE de la migración 9:
+    [{"email_normalizado", "ids"}, ...] (a lo sumo 20 grupos).
+    """
+    with DatabaseConnection(db_path) as conn:
+        return _emails_repetidos(conn)
 
 
 if __name__ == "__main__":
-    crear_tablas()
-    print("✅ Base de datos inicializada correctamente")
+    if "--estado" in sys.argv:
+        info = estado()
+        print(f"Versión de esquema: {info['version']} (última: {info['ultima']})")
+        for bf in info["backfills"]:
+            avance = "completado" if bf["completado"] else f"{bf['cursor']}/{bf['limite']}"
+            print(f"  Backfill migración {bf['version']}: {avance}")
+        if any(bf["version"] == 9 and not bf["completado"] for bf in info["backfills"]):
+            for grupo in emails_repetidos():
+                print(f"  Email repetido {grupo['email_normalizado']}: {grupo['ids']}")
+    else:
+        crear_tablas()
+        print("✅ Base de datos inicializada correctamente")
@@ -0,0 +1,175 @@
+"""
+Pool de conexiones SQLite reutilizables y thread-safe.
+
+Evita abrir una conexión (y re-ejecutar los PRAGMA) en cada operación
+del repositorio. Las conexiones se prestan con obtener() y se devuelven
+con devolver(); DatabaseConnection encapsula ese ciclo.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from config import Config
+from src.database.pragmas import resolver_perfil, aplicar_pragmas
+from src.utils.logger import logger
+from src.exceptions.database_errors import ConexionDBError
+
+
+class ConnectionPool:
+    """
+    Pool acotado de conexiones a un archivo SQLite.
+
+    Atributos:
+        db_path (str): Ruta del archivo de base de datos.
+        tamano (int): Máximo de conexiones abiertas simultáneamente.
+        timeout (float): Segundos de espera por una conexión libre.
+        pragmas (dict): PRAGMA aplicados a cada conexión nueva.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        tamano: int = None,
+        timeout: float = None,
+        perfil=None,
+    ):
+        self.db_path = db_path
+        self.tamano = max(1, tamano or Config.DB_POOL_SIZE)
+        self.timeout = timeout if timeout is not None else Config.DB_POOL_TIMEOUT
+        self.pragmas = resolver_perfil(perfil)
+        self._lock = threading.Lock()
+        self._reiniciar()
+
+    def _reiniciar(self):
+        """Deja el pool vacío (también tras un fork: no se heredan conexiones)."""
+        self._pid = os.getpid()
+        self._libres = queue.LifoQueue()
+        self._abiertas = 0
+        self._en_uso = 0
+        self._checkouts = 0
+        self._esperas = 0
+        self._timeouts = 0
+        self._creadas = 0
+
+    def _crear_conexion(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Acceso por nombre de columna
+        conn.execute("PRAGMA foreign_keys = ON")
+        aplicar_pragmas(conn, self.pragmas)
+        return conn
+
+    def obtener(self) -> sqlite3.Connection:
+        """Presta una conexión libre, creando una nueva si hay cupo."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reiniciar()
+            try:
+                conn = self._libres.get_nowait()
+            except queue.Empty:
+                conn = None
+            crear = conn is None and self._abiertas < self.tamano
+            if crear:
+                self._abiertas += 1
+            elif conn is None:
+                self._esperas += 1
+
+        if crear:
+            try:
+                conn = self._crear_conexion()
+            except sqlite3.Error as e:
+                with self._lock:
+                    self._abiertas -= 1
+                logger.error(f"Error al conectar a DB: {e}")
+                raise ConexionDBError(f"No se pudo conectar a '{self.db_path}': {e}")
+            with self._lock:
+                self._creadas += 1
+        elif conn is None:
+            try:
+                conn = self._libres.get(timeout=self.timeout)
+            except queue.Empty:
+                with self._lock:
+                    self._timeouts += 1
+                raise ConexionDBError(
+                    f"Sin conexiones libres en el pool de '{self.db_path}' "
+                    f"tras {self.timeout}s"
+                )
+
+        with self._lock:
+            self._checkouts += 1
+            self._en_uso += 1
+        return conn
+
+    def devolver(self, conn: sqlite3.Connection, descartar: bool = False):
+        """Devuelve una conexión al pool (o la cierra si quedó inutilizable)."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return  # Conexión heredada de otro proceso: no reutilizar
+            self._en_uso -= 1
+            if descartar:
+                self._abiertas -= 1
+        if descartar:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return
+        self._libres.put(conn)
+
+    def cerrar(self):
+        """Cierra todas las conexiones libres del pool."""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._libres.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._abiertas -= 1
+
+    def estadisticas(self) -> dict:
+        """Retorna métricas del pool para diagnóstico."""
+        with self._lock:
+            return {
+                "db_path": self.db_path,
+                "tamano": self.tamano,
+                "abiertas": self._abiertas,
+                "en_uso": self._en_uso,
+                "libres": self._libres.qsize(),
+                "creadas": self._creadas,
+                "checkouts": self._checkouts,
+                "esperas": self._esperas,
+                "timeouts": self._timeouts,
+                "pragmas": dict(self.pragmas),
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def obtener_pool(db_path: str, perfil=None) -> ConnectionPool:
+    """
+    Retorna el pool compartido para una ruta de BD (uno por archivo).
+
+    El perfil de PRAGMA se aplica al crear el pool. Con perfil=None se
+    usa el pool existente tal cual; si se pide un perfil distinto al del
+    pool ya creado se lanza ValueError (sus conexiones no lo aplicarían).
+    """
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path, perfil=perfil)
+        elif perfil is not None and resolver_perfil(perfil) != pool.pragmas:
+            raise ValueError(
+                f"El pool de '{db_path}' ya usa otros PRAGMA ({pool.pragmas}); "
+                "cierre los pools (cerrar_pools) antes de cambiar de perfil"
+            )
+        return pool
+
+
+def cerrar_pools():
+    """Cierra las conexiones libres de todos los pools."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.cerrar()
+        _pools.clear()
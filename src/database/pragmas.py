@@ -0,0 +1,72 @@
+"""
+Perfiles de PRAGMA para las conexiones SQLite del sistema GIC.
+
+Cada perfil se aplica una sola vez por conexión, al crearla en el pool.
+El perfil activo se elige con Config.DB_PRAGMA_PROFILE.
+"""
+import re
+import sqlite3
+from config import Config
+
+PERFILES_PRAGMA = {
+    # Comportamiento por defecto de SQLite (rollback journal)
+    "default": {},
+    # Varios workers sobre un mismo archivo: lectores no bloquean al escritor
+    "wal": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,  # ~20 MB (valores negativos = KiB)
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+    },
+    # WAL con fsync en cada commit (máxima durabilidad)
+    "wal_durable": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -20000,
+        "temp_store": "MEMORY",
+    },
+}
+
+PRAGMAS_PERMITIDOS = (
+    "journal_mode",
+    "synchronous",
+    "busy_timeout",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+)
+
+_VALOR_VALIDO = re.compile(r"^-?\w+$")
+
+
+def resolver_perfil(perfil=None) -> dict:
+    """
+    Retorna el diccionario de PRAGMA a aplicar.
+    Acepta el nombre de un perfil, un dict explícito o None (usa Config).
+    """
+    if isinstance(perfil, dict):
+        pragmas = perfil
+    else:
+        nombre = perfil or Config.DB_PRAGMA_PROFILE
+        if nombre not in PERFILES_PRAGMA:
+            raise ValueError(
+                f"Perfil de PRAGMA inválido: '{nombre}'. "
+                f"Opciones: {list(PERFILES_PRAGMA.keys())}"
+            )
+        pragmas = PERFILES_PRAGMA[nombre]
+
+    for nombre, valor in pragmas.items():
+        if nombre not in PRAGMAS_PERMITIDOS:
+            raise ValueError(f"PRAGMA no permitido: '{nombre}'")
+        if not _VALOR_VALIDO.match(str(valor)):
+            raise ValueError(f"Valor inválido para PRAGMA {nombre}: '{valor}'")
+    return dict(pragmas)
+
+
+def aplicar_pragmas(conn: sqlite3.Connection, pragmas: dict):
+    """Ejecuta los PRAGMA indicados sobre una conexión recién abierta."""
+    for nombre, valor in pragmas.items():
+        conn.execute(f"PRAGMA {nombre} = {valor}")
@@ -2,7 +2,9 @@
 GUI Web del sistema GIC usando Flask.
 Reemplaza Tkinter por una interfaz web accesible desde el navegador.
 """
+from urllib.parse import urlencode
 from flask import Flask, render_template_string, request, redirect, url_for, flash
+from config import Config
 from src.services.cliente_service import ClienteService
 from src.database.migrations import crear_tablas
 from src.exceptions.validation_errors import GICValidationError
@@ -88,6 +90,8 @@ LIST_PAGE = """
     <div class="separator"></div>
     <a href="/exportar/json" class="btn btn-outline">Exportar JSON</a>
     <a href="/exportar/csv" class="btn btn-outline">Exportar CSV</a>
+    <a href="/exportar/ndjson" class="btn btn-outline">Exportar NDJSON</a>
+    <a href="/exportar/ndjson?compresion=gzip" class="btn btn-outline">Exportar NDJSON (.gz)</a>
     <div class="separator"></div>
     <form method="GET" action="/" style="display:flex; gap:8px; align-items:center;">
         <input type="text" name="busqueda" placeholder="Buscar..." class="search-box" value="{{ busqueda or '' }}">
@@ -126,6 +130,10 @@ LIST_PAGE = """
     {% endfor %}
     </tbody>
 </table>
+<div style="margin-top:16px; display:flex; gap:8px;">
+    {% if cursor %}<a href="/?{{ query_inicio }}" class="btn btn-outline">&laquo; Inicio</a>{% endif %}
+    {% if next_cursor %}<a href="/?{{ query_siguiente }}" class="btn btn-outline">Siguiente &raquo;</a>{% endif %}
+</div>
 {% else %}
 <div class="empty-state"><p>No hay clientes registrados. Crea el primero!</p></div>
 {% endif %}
@@ -200,10 +208,17 @@ def get_stats_text():
 def index():
     tipo = request.args.get("tipo")
     busqueda = request.args.get("busqueda")
-    clientes = service.listar_clientes(tipo=tipo, busqueda=busqueda)
-    clientes_data = [c.to_dict() for c in clientes]
+    cursor = request.args.get("cursor")
+    try:
+        clientes, next_cursor = service.listar_vistas(tipo=tipo, busqueda=busqueda, limite=Config.PAGE_SIZE, cursor=cursor)
+    except ValueError as e:
+        flash(str(e), "error")
+        return redirect("/")
+    filtros = {k: v for k, v in (("tipo", tipo), ("busqueda", busqueda)) if v}
+    query_inicio = urlencode(filtros)
+    query_siguiente = urlencode({**filtros, "cursor": next_cursor}) if next_cursor else ""
     template = HTML_TEMPLATE.replace("{% block content %}{% endblock %}", LIST_PAGE.replace('{% extends "base" %}\n{% block content %}', '').replace('{% endblock %}', ''))
-    return render_template_string(template, clientes=clientes_data, stats_text=get_stats_text(), tipo=tipo, busqueda=busqueda)
+    return render_template_string(template, clientes=clientes, stats_text=get_stats_text(), tipo=tipo, busqueda=busqueda, cursor=cursor, next_cursor=next_cursor, query_inicio=query_inicio, query_siguiente=query_siguiente)
 
 
 @app.route("/nuevo", methods=["GET", "POST"])
@@ -275,31 +290,20 @@ def eliminar(id):
 @app.route("/toggle/<id>")
 def toggle(id):
     try:
-        cliente = service.obtener_cliente(id)
-        if cliente.activo:
-            service.desactivar_cliente(id)
-            flash("Cliente desactivado", "success")
-        else:
-            cliente.activar()
-            from src.repositories.sqlite_repository import SQLiteRepository
-            SQLiteRepository().actualizar(cliente)
-            flash("Cliente activado", "success")
+        activo = service.alternar_activo(id)
+        flash("Cliente activado" if activo else "Cliente desactivado", "success")
     except Exception as e:
         flash(str(e), "error")
     return redirect("/")
 
 
-@app.route("/exportar/json")
-def exportar_json():
-    ruta = service.exportar_json()
-    flash(f"Exportado a JSON: {ruta}", "success")
-    return redirect("/")
-
-
-@app.route("/exportar/csv")
-def exportar_csv():
-    ruta = service.exportar_csv()
-    flash(f"Exportado a CSV: {ruta}", "success")
+@app.route("/exportar/<formato>")
+def exportar(formato):
+    try:
+        ruta = service.exportar(formato, compresion=request.args.get("compresion"))
+        flash(f"Exportado a {formato.upper()}: {ruta}", "success")
+    except ValueError as e:
+        flash(str(e), "error")
     return redirect("/")
 
 
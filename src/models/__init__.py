@@ -10,6 +10,9 @@ TIPOS_CLIENTE = {
     "Corporativo": ClienteCorporativo,
 }
 
+# Después de TIPOS_CLIENTE: cliente_vista lo importa
+from src.models.cliente_vista import ClienteVista  # noqa: E402
+
 
 def crear_cliente(tipo: str, **kwargs) -> Cliente:
     """
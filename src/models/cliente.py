@@ -6,6 +6,7 @@ Implementa:
 - Validaciones avanzadas en atributos
 - Métodos especiales (__str__, __repr__, __eq__)
 - Método to_dict() para serialización
+- Registro de campos modificados desde la carga (updates parciales)
 """
 from datetime import datetime
 from src.utils.helpers import generar_id, timestamp_actual
@@ -31,8 +32,39 @@ class Cliente:
         _activo (bool): Estado del cliente en el sistema.
         _fecha_registro (str): Timestamp de creación.
         _fecha_actualizacion (str): Timestamp de última actualización.
+        _cambios (set | tuple | None): Campos modificados desde la carga
+            (tupla vacía si no hay). None en instancias nuevas (aún sin
+            estado persistido que comparar).
     """
 
+    # Claves de to_dict() (= columnas de clientes) y las que, vacías en
+    # almacenamiento, _cargar() reemplaza por un valor por defecto
+    CAMPOS = (
+        "id",
+        "nombre",
+        "email",
+        "telefono",
+        "direccion",
+        "activo",
+        "tipo_cliente",
+        "fecha_registro",
+        "fecha_actualizacion",
+    )
+    _CAMPOS_CON_DEFECTO = ("fecha_registro", "fecha_actualizacion")
+
+    # Sin __dict__ por instancia: listar() materializa un objeto por fila
+    __slots__ = (
+        "_id",
+        "_nombre",
+        "_email",
+        "_telefono",
+        "_direccion",
+        "_activo",
+        "_fecha_registro",
+        "_fecha_actualizacion",
+        "_cambios",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -43,16 +75,18 @@ class Cliente:
         activo: bool = True,
         fecha_registro: str = None,
     ):
+        ahora = timestamp_actual()  # Un solo timestamp por construcción
+        self._cambios = None
         self._id = id or generar_id()
-        self._fecha_registro = fecha_registro or timestamp_actual()
-        self._fecha_actualizacion = timestamp_actual()
+        self._fecha_registro = fecha_registro or ahora
+        self._fecha_actualizacion = ahora
         self._activo = activo
 
-        # Validaciones al asignar (usan los setters con @property)
-        self.nombre = nombre
-        self.email = email
-        self.telefono = telefono
-        self.direccion = direccion
+        # Mismas validaciones que los setters, sin refrescar la fecha
+        self._nombre = validar_nombre(nombre)
+        self._email = validar_email(email)
+        self._telefono = validar_telefono(telefono)
+        self._direccion = validar_direccion(direccion)
 
         logger.info(f"Cliente creado: {self._nombre} ({self._id})")
 
@@ -69,7 +103,7 @@ class Cliente:
     @nombre.setter
     def nombre(self, valor: str):
         self._nombre = validar_nombre(valor)
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("nombre")
 
     @property
     def email(self) -> str:
@@ -78,7 +112,7 @@ class Cliente:
     @email.setter
     def email(self, valor: str):
         self._email = validar_email(valor)
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("email")
 
     @property
     def telefono(self) -> str:
@@ -87,7 +121,7 @@ class Cliente:
     @telefono.setter
     def telefono(self, valor: str):
         self._telefono = validar_telefono(valor)
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("telefono")
 
     @property
     def direccion(self) -> str:
@@ -96,7 +130,7 @@ class Cliente:
     @direccion.setter
     def direccion(self, valor: str):
         self._direccion = validar_direccion(valor)
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("direccion")
 
     @property
     def activo(self) -> bool:
@@ -115,18 +149,40 @@ class Cliente:
         """Retorna el tipo de cliente. Sobrescrito por subclases (polimorfismo)."""
         return "Regular"
 
+    # ==================== REGISTRO DE CAMBIOS ====================
+
+    @property
+    def cambios(self):
+        """
+        Campos (claves de to_dict) modificados desde que se cargó.
+        None si la instancia es nueva y debe persistirse completa.
+        """
+        return None if self._cambios is None else frozenset(self._cambios)
+
+    def _marcar(self, *campos: str):
+        """Registra campos modificados y actualiza fecha_actualizacion."""
+        if self._cambios is not None:
+            if not self._cambios:
+                self._cambios = set()  # Se crea recién al primer cambio
+            self._cambios.update(campos)
+        self._fecha_actualizacion = timestamp_actual()
+
+    def limpiar_cambios(self):
+        """Marca la instancia como sincronizada con lo persistido."""
+        self._cambios = ()
+
     # ==================== MÉTODOS DE NEGOCIO ====================
 
     def activar(self):
         """Activa el cliente en el sistema."""
         self._activo = True
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("activo")
         logger.info(f"Cliente activado: {self._nombre} ({self._id})")
 
     def desactivar(self):
         """Desactiva el cliente (borrado lógico)."""
         self._activo = False
-        self._fecha_actualizacion = timestamp_actual()
+        self._marcar("activo")
         logger.info(f"Cliente desactivado: {self._nombre} ({self._id})")
 
     def calcular_descuento(self, monto: float) -> float:
@@ -163,6 +219,33 @@ class Cliente:
             fecha_registro=datos.get("fecha_registro"),
         )
 
+    @classmethod
+    def from_storage(cls, datos: dict) -> "Cliente":
+        """
+        Reconstruye un cliente desde datos ya persistidos (ruta confiable).
+
+        A diferencia de from_dict(), no vuelve a ejecutar las validaciones
+        ni registra logs: los datos se validaron al crear/actualizar.
+        Conserva además la fecha_actualizacion almacenada.
+        """
+        cliente = cls.__new__(cls)
+        cliente._cargar(datos)
+        return cliente
+
+    def _cargar(self, datos: dict):
+        """Asigna directamente los campos almacenados, sin validar."""
+        self._cambios = ()
+        self._id = datos["id"]
+        self._nombre = datos["nombre"]
+        self._email = datos["email"]
+        self._telefono = datos["telefono"]
+        self._direccion = datos["direccion"]
+        self._activo = bool(datos.get("activo", True))
+        self._fecha_registro = datos.get("fecha_registro") or timestamp_actual()
+        self._fecha_actualizacion = (
+            datos.get("fecha_actualizacion") or self._fecha_registro
+        )
+
     # ==================== MÉTODOS ESPECIALES ====================
 
     def __str__(self) -> str:
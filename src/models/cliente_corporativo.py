@@ -22,6 +22,28 @@ class ClienteCorporativo(Cliente):
         _descuento_volumen (float): Descuento por volumen de compras.
     """
 
+    __slots__ = (
+        "_rut_empresa",
+        "_razon_social",
+        "_rubro",
+        "_contacto_comercial",
+        "_cantidad_empleados",
+        "_descuento_volumen",
+    )
+
+    CAMPOS = Cliente.CAMPOS + (
+        "rut_empresa",
+        "razon_social",
+        "rubro",
+        "contacto_comercial",
+        "cantidad_empleados",
+        "descuento_volumen",
+    )
+    _CAMPOS_CON_DEFECTO = Cliente._CAMPOS_CON_DEFECTO + (
+        "cantidad_empleados",
+        "descuento_volumen",
+    )
+
     DESCUENTO_BASE = 0.05  # 5%
 
     def __init__(
@@ -71,6 +93,7 @@ class ClienteCorporativo(Cliente):
     @contacto_comercial.setter
     def contacto_comercial(self, valor: str):
         self._contacto_comercial = valor.strip()
+        self._marcar("contacto_comercial")
 
     @property
     def cantidad_empleados(self) -> int:
@@ -111,6 +134,7 @@ class ClienteCorporativo(Cliente):
         """Actualiza cantidad de empleados y recalcula descuento."""
         self._cantidad_empleados = max(1, cantidad)
         self._descuento_volumen = self._calcular_descuento_volumen()
+        self._marcar("cantidad_empleados", "descuento_volumen")
         logger.info(
             f"{self._razon_social}: empleados={cantidad}, "
             f"descuento={self._descuento_volumen:.0%}"
@@ -146,6 +170,18 @@ class ClienteCorporativo(Cliente):
             descuento_volumen=datos.get("descuento_volumen"),
         )
 
+    def _cargar(self, datos: dict):
+        super()._cargar(datos)
+        self._rut_empresa = datos["rut_empresa"]
+        self._razon_social = datos["razon_social"]
+        rubro = datos.get("rubro")
+        self._rubro = "No especificado" if rubro is None else rubro
+        self._contacto_comercial = datos.get("contacto_comercial") or ""
+        self._cantidad_empleados = max(1, datos.get("cantidad_empleados") or 1)
+        self._descuento_volumen = (
+            datos.get("descuento_volumen") or self._calcular_descuento_volumen()
+        )
+
     def __str__(self) -> str:
         base = super().__str__()
         return (
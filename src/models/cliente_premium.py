@@ -18,6 +18,11 @@ class ClientePremium(Cliente):
         _nivel_premium (str): Nivel premium (Gold, Platinum, Diamond).
     """
 
+    __slots__ = ("_descuento", "_asesor_dedicado", "_nivel_premium")
+
+    CAMPOS = Cliente.CAMPOS + ("asesor_dedicado", "nivel_premium", "descuento")
+    _CAMPOS_CON_DEFECTO = Cliente._CAMPOS_CON_DEFECTO + ("nivel_premium", "descuento")
+
     DESCUENTO_BASE = 0.10  # 10%
     NIVELES_VALIDOS = ("Gold", "Platinum", "Diamond")
 
@@ -55,6 +60,7 @@ class ClientePremium(Cliente):
     @asesor_dedicado.setter
     def asesor_dedicado(self, valor: str):
         self._asesor_dedicado = valor.strip()
+        self._marcar("asesor_dedicado")
 
     @property
     def nivel_premium(self) -> str:
@@ -86,6 +92,7 @@ class ClientePremium(Cliente):
         if indice_actual < len(niveles) - 1:
             self._nivel_premium = niveles[indice_actual + 1]
             self._descuento = self._calcular_descuento_por_nivel()
+            self._marcar("nivel_premium", "descuento")
             logger.info(f"{self.nombre} subió a nivel {self._nivel_premium}")
         else:
             logger.warning(f"{self.nombre} ya está en el nivel máximo")
@@ -121,6 +128,15 @@ class ClientePremium(Cliente):
             descuento=datos.get("descuento"),
         )
 
+    def _cargar(self, datos: dict):
+        super()._cargar(datos)
+        asesor = datos.get("asesor_dedicado")
+        self._asesor_dedicado = "Sin asignar" if asesor is None else asesor
+        self._nivel_premium = datos.get("nivel_premium") or "Gold"
+        self._descuento = (
+            datos.get("descuento") or self._calcular_descuento_por_nivel()
+        )
+
     def __str__(self) -> str:
         base = super().__str__()
         return (
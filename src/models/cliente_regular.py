@@ -17,6 +17,11 @@ class ClienteRegular(Cliente):
         _puntos_fidelidad (int): Puntos acumulados por compras.
     """
 
+    __slots__ = ("_limite_credito", "_puntos_fidelidad")
+
+    CAMPOS = Cliente.CAMPOS + ("limite_credito", "puntos_fidelidad")
+    _CAMPOS_CON_DEFECTO = Cliente._CAMPOS_CON_DEFECTO + ("limite_credito",)
+
     DESCUENTO_BASE = 0.0  # 0%
     LIMITE_CREDITO_DEFAULT = 500_000  # CLP
 
@@ -58,6 +63,7 @@ class ClienteRegular(Cliente):
         if puntos < 0:
             raise ValueError("Los puntos no pueden ser negativos")
         self._puntos_fidelidad += puntos
+        self._marcar("puntos_fidelidad")
         logger.info(f"Puntos agregados a {self.nombre}: +{puntos} (Total: {self._puntos_fidelidad})")
 
     def calcular_descuento(self, monto: float) -> float:
@@ -92,6 +98,13 @@ class ClienteRegular(Cliente):
             puntos_fidelidad=datos.get("puntos_fidelidad", 0),
         )
 
+    def _cargar(self, datos: dict):
+        super()._cargar(datos)
+        self._limite_credito = (
+            datos.get("limite_credito") or self.LIMITE_CREDITO_DEFAULT
+        )
+        self._puntos_fidelidad = datos.get("puntos_fidelidad") or 0
+
     def __str__(self) -> str:
         base = super().__str__()
         return f"{base} | Puntos: {self._puntos_fidelidad}"
@@ -0,0 +1,72 @@
+"""
+ClienteVista - Vista de solo lectura sobre una fila de la tabla clientes.
+
+Para listados: expone los mismos atributos y el mismo to_dict() que el
+modelo de su tipo, leyendo directamente del sqlite3.Row. El modelo
+completo (ClienteRegular, ClientePremium o ClienteCorporativo) se
+construye recién cuando se usa algo más que los campos, por ejemplo
+calcular_descuento().
+"""
+from src.models import TIPOS_CLIENTE
+from src.models.cliente_regular import ClienteRegular
+
+
+class ClienteVista:
+    """
+    Envoltorio perezoso de una fila de clientes.
+
+    Atributos:
+        _row (sqlite3.Row): Fila leída de la BD.
+        _clase (type): Clase de modelo según tipo_cliente.
+        _modelo (Cliente | None): Modelo construido bajo demanda.
+    """
+
+    __slots__ = ("_row", "_clase", "_modelo")
+
+    def __init__(self, row):
+        self._row = row
+        self._clase = TIPOS_CLIENTE.get(row["tipo_cliente"], ClienteRegular)
+        self._modelo = None
+
+    @property
+    def modelo(self):
+        """Modelo completo (carga confiable, se construye una sola vez)."""
+        if self._modelo is None:
+            self._modelo = self._clase.from_storage(dict(self._row))
+        return self._modelo
+
+    def _requiere_modelo(self, campo: str, valor) -> bool:
+        # Valores que _cargar() reemplazaría por un defecto
+        return valor is None or (
+            not valor and campo in self._clase._CAMPOS_CON_DEFECTO
+        )
+
+    def __getattr__(self, nombre: str):
+        if nombre in self._clase.CAMPOS:
+            valor = self._row[nombre]
+            if nombre == "activo":
+                return bool(valor)
+            if self._requiere_modelo(nombre, valor):
+                return getattr(self.modelo, nombre)
+            return valor
+        # Métodos de negocio y demás atributos: se delega al modelo
+        return getattr(self.modelo, nombre)
+
+    def to_dict(self) -> dict:
+        """Mismo resultado que Cliente.to_dict() sin construir el modelo."""
+        if self._modelo is not None:
+            return self._modelo.to_dict()
+        datos = {campo: self._row[campo] for campo in self._clase.CAMPOS}
+        if any(self._requiere_modelo(c, v) for c, v in datos.items()):
+            return self.modelo.to_dict()
+        datos["activo"] = bool(datos["activo"])
+        return datos
+
+    def __str__(self) -> str:
+        return str(self.modelo)
+
+    def __repr__(self) -> str:
+        return (
+            f"ClienteVista(tipo='{self._row['tipo_cliente']}', "
+            f"email='{self._row['email']}', id='{self._row['id']}')"
+        )
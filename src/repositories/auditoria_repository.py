@@ -0,0 +1,46 @@
+"""
+Repositorio de auditoría - Persistencia de la tabla logs_actividad.
+"""
+import json
+from typing import List
+from src.database.connection import DatabaseConnection
+
+
+class AuditoriaRepository:
+    """Lectura/escritura de eventos de actividad en SQLite."""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path
+
+    def guardar_lote(self, eventos: List[tuple]) -> int:
+        """
+        Inserta eventos (accion, entidad, entidad_id, detalle, fecha) en una
+        sola transacción. Retorna la cantidad insertada.
+        """
+        with DatabaseConnection(self.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO logs_actividad (accion, entidad, entidad_id, detalle, fecha) "
+                "VALUES (?, ?, ?, ?, ?)",
+                eventos,
+            )
+        return len(eventos)
+
+    def historial(self, entidad_id: str, limite: int = 100) -> List[dict]:
+        """Eventos de una entidad, del más reciente al más antiguo."""
+        with DatabaseConnection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT * FROM logs_actividad WHERE entidad_id = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (entidad_id, limite),
+            ).fetchall()
+
+        eventos = []
+        for row in rows:
+            evento = dict(row)
+            if evento["detalle"]:
+                try:
+                    evento["detalle"] = json.loads(evento["detalle"])
+                except ValueError:
+                    pass  # Texto plano de filas anteriores: se devuelve tal cual
+            eventos.append(evento)
+        return eventos
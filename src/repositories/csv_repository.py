@@ -2,9 +2,12 @@
 Repositorio CSV - Exportación/importación de clientes en formato CSV.
 """
 import csv
+import io
 import os
-from typing import List
-from src.models import Cliente, ClienteRegular, ClientePremium, ClienteCorporativo
+from typing import Iterable, List
+from src.models import TIPOS_CLIENTE, Cliente, ClienteRegular
+from src.utils.compresion import abrir_lectura, extension
+from src.utils.helpers import escritura_atomica
 from src.utils.logger import logger
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
@@ -13,47 +16,64 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
 class CSVRepository:
     """Repositorio para leer/escribir clientes en archivos CSV."""
 
-    _CLASES = {
-        "Regular": ClienteRegular,
-        "Premium": ClientePremium,
-        "Corporativo": ClienteCorporativo,
-    }
+    # Esquema fijo: campos base y luego los de cada subtipo, sin repetir
+    COLUMNAS = tuple(dict.fromkeys(
+        campo for clase in TIPOS_CLIENTE.values() for campo in clase.CAMPOS
+    ))
 
     def __init__(self, archivo: str = "clientes.csv"):
         os.makedirs(DATA_DIR, exist_ok=True)
         self.ruta = os.path.join(DATA_DIR, archivo)
 
-    def exportar(self, clientes: List[Cliente]) -> str:
-        """Exporta lista de clientes a archivo CSV."""
-        if not clientes:
-            logger.warning("No hay clientes para exportar")
-            return self.ruta
+    def exportar(
+        self, clientes: Iterable[Cliente], columnas: List[str] = None, compresion: str = None
+    ) -> str:
+        """
+        Exporta clientes (modelos o ClienteVista) a archivo CSV.
 
-        datos = [c.to_dict() for c in clientes]
+        El encabezado es COLUMNAS (o la selección `columnas`, en ese orden):
+        no depende de los datos, así que cada cliente se escribe apenas se
+        lee. Los campos que no aplican al tipo quedan vacíos. El archivo se
+        reemplaza solo si la exportación termina completa. Con compresion
+        la ruta lleva la extensión del códec (clientes.csv.gz).
+        """
+        columnas = self.validar_columnas(columnas)
+        ruta = self.ruta + extension(compresion)
+        total = 0
+        with escritura_atomica(ruta, newline="", compresion=compresion) as f:
+            writer = csv.writer(f)
+            writer.writerow(columnas)
+            for cliente in clientes:
+                datos = cliente.to_dict()
+                writer.writerow([datos.get(columna) for columna in columnas])
+                total += 1
 
-        # Recopilar todos los campos posibles de todos los clientes
-        campos = []
-        for d in datos:
-            for k in d.keys():
-                if k not in campos:
-                    campos.append(k)
+        logger.info(f"Exportados {total} clientes a CSV: {ruta}")
+        return ruta
 
-        with open(self.ruta, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=campos, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(datos)
+    @classmethod
+    def validar_columnas(cls, columnas: List[str] = None) -> tuple:
+        """Retorna la selección de columnas; ValueError si alguna no existe."""
+        if not columnas:
+            return cls.COLUMNAS
+        desconocidas = [c for c in columnas if c not in cls.COLUMNAS]
+        if desconocidas:
+            raise ValueError(
+                f"Columnas desconocidas: {desconocidas}. Opciones: {list(cls.COLUMNAS)}"
+            )
+        return tuple(columnas)
 
-        logger.info(f"Exportados {len(clientes)} clientes a CSV: {self.ruta}")
-        return self.ruta
-
-    def importar(self) -> List[Cliente]:
-        """Importa clientes desde archivo CSV."""
+    def importar(self, validar: bool = True) -> List[Cliente]:
+        """
+        Importa clientes desde archivo CSV.
+        Con validar=False usa la carga confiable (archivos exportados por GIC).
+        """
         if not os.path.exists(self.ruta):
             logger.warning(f"Archivo CSV no encontrado: {self.ruta}")
             return []
 
         clientes = []
-        with open(self.ruta, "r", encoding="utf-8") as f:
+        with io.TextIOWrapper(abrir_lectura(self.ruta), encoding="utf-8", newline="") as f:
             reader = csv.DictReader(f)
             for row in reader:
                 # Convertir strings a tipos apropiados
@@ -66,8 +86,11 @@ class CSVRepository:
                         row[campo] = int(row[campo])
 
                 tipo = row.get("tipo_cliente", "Regular")
-                clase = self._CLASES.get(tipo, ClienteRegular)
-                clientes.append(clase.from_dict(row))
+                clase = TIPOS_CLIENTE.get(tipo, ClienteRegular)
+                if validar:
+                    clientes.append(clase.from_dict(row))
+                else:
+                    clientes.append(clase.from_storage(row))
 
         logger.info(f"Importados {len(clientes)} clientes desde CSV")
         return clientes
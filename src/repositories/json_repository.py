@@ -4,49 +4,74 @@ Alternativa a SQLite para exportación/importación de datos.
 """
 import json
 import os
-from typing import List
-from src.models import Cliente, ClienteRegular, ClientePremium, ClienteCorporativo
+from typing import Iterable, Iterator, List
+from src.models import TIPOS_CLIENTE, Cliente, ClienteRegular
+from src.utils.compresion import abrir_lectura, extension
+from src.utils.helpers import escritura_atomica
+from src.utils.json_incremental import iterar_arreglo_json
 from src.utils.logger import logger
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
 
+# to_dict() es plano (solo escalares): con estos separadores el codificador
+# en C produce las líneas de json.dump(indent=2) para un elemento de la
+# lista, sin pasar por el codificador Python que exige indent.
+_CODIFICADOR = json.JSONEncoder(ensure_ascii=False, separators=(",\n    ", ": "))
+
 
 class JSONRepository:
     """Repositorio para leer/escribir clientes en archivos JSON."""
 
-    _CLASES = {
-        "Regular": ClienteRegular,
-        "Premium": ClientePremium,
-        "Corporativo": ClienteCorporativo,
-    }
-
     def __init__(self, archivo: str = "clientes.json"):
         os.makedirs(DATA_DIR, exist_ok=True)
         self.ruta = os.path.join(DATA_DIR, archivo)
 
-    def exportar(self, clientes: List[Cliente]) -> str:
-        """Exporta lista de clientes a archivo JSON."""
-        datos = [c.to_dict() for c in clientes]
-        with open(self.ruta, "w", encoding="utf-8") as f:
-            json.dump(datos, f, ensure_ascii=False, indent=2)
+    def exportar(self, clientes: Iterable[Cliente], compresion: str = None) -> str:
+        """
+        Exporta clientes (modelos o ClienteVista) a archivo JSON.
+
+        Escribe cliente por cliente, con memoria constante, el mismo
+        formato que json.dump(lista, indent=2). El archivo anterior solo se
+        reemplaza si la exportación termina completa (escritura_atomica).
+        Con compresion la ruta lleva la extensión del códec (clientes.json.gz).
+        """
+        ruta = self.ruta + extension(compresion)
+        total = 0
+        with escritura_atomica(ruta, compresion=compresion) as f:
+            f.write("[")
+            for cliente in clientes:
+                f.write(",\n  {\n    " if total else "\n  {\n    ")
+                f.write(_CODIFICADOR.encode(cliente.to_dict())[1:-1])
+                f.write("\n  }")
+                total += 1
+            f.write("\n]" if total else "]")
 
-        logger.info(f"Exportados {len(clientes)} clientes a {self.ruta}")
-        return self.ruta
+        logger.info(f"Exportados {total} clientes a {ruta}")
+        return ruta
 
-    def importar(self) -> List[Cliente]:
-        """Importa clientes desde archivo JSON."""
+    def importar(self, validar: bool = True) -> List[Cliente]:
+        """
+        Importa clientes desde archivo JSON.
+        Con validar=False usa la carga confiable (archivos exportados por GIC).
+        """
         if not os.path.exists(self.ruta):
             logger.warning(f"Archivo no encontrado: {self.ruta}")
             return []
 
-        with open(self.ruta, "r", encoding="utf-8") as f:
-            datos = json.load(f)
-
-        clientes = []
-        for item in datos:
-            tipo = item.get("tipo_cliente", "Regular")
-            clase = self._CLASES.get(tipo, ClienteRegular)
-            clientes.append(clase.from_dict(item))
-
+        clientes = list(self.iterar(validar))
         logger.info(f"Importados {len(clientes)} clientes desde {self.ruta}")
         return clientes
+
+    def iterar(self, validar: bool = True) -> Iterator[Cliente]:
+        """
+        Recorre los clientes del archivo uno a uno (parser incremental,
+        memoria acotada aunque el archivo sea enorme; acepta gzip/zstd).
+        """
+        with abrir_lectura(self.ruta) as f:
+            for item, _ in iterar_arreglo_json(f):
+                tipo = item.get("tipo_cliente", "Regular")
+                clase = TIPOS_CLIENTE.get(tipo, ClienteRegular)
+                if validar:
+                    yield clase.from_dict(item)
+                else:
+                    yield clase.from_storage(item)
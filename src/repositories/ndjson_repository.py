@@ -0,0 +1,66 @@
+"""
+Repositorio NDJSON - Un cliente por línea (JSON compacto).
+Formato de intercambio entre ambientes: se escribe y se lee en streaming,
+opcionalmente comprimido (gzip, o zstd si está instalado).
+"""
+import json
+import os
+from typing import Iterable, Iterator, List
+from src.models import TIPOS_CLIENTE, Cliente, ClienteRegular
+from src.utils.compresion import abrir_lectura, extension
+from src.utils.helpers import escritura_atomica
+from src.utils.json_incremental import iterar_lineas_json
+from src.utils.logger import logger
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+
+_CODIFICADOR = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class NDJSONRepository:
+    """Repositorio para leer/escribir clientes en archivos NDJSON."""
+
+    def __init__(self, archivo: str = "clientes.ndjson"):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        self.ruta = os.path.join(DATA_DIR, archivo)
+
+    def exportar(self, clientes: Iterable[Cliente], compresion: str = None) -> str:
+        """
+        Exporta clientes (modelos o ClienteVista) con memoria constante.
+        Con compresion el archivo lleva su extensión (clientes.ndjson.gz).
+        Retorna la ruta escrita.
+        """
+        ruta = self.ruta + extension(compresion)
+        total = 0
+        with escritura_atomica(ruta, newline="\n", compresion=compresion) as f:
+            for cliente in clientes:
+                f.write(_CODIFICADOR.encode(cliente.to_dict()))
+                f.write("\n")
+                total += 1
+
+        logger.info(f"Exportados {total} clientes a NDJSON: {ruta}")
+        return ruta
+
+    def importar(self, validar: bool = True) -> List[Cliente]:
+        """
+        Importa clientes desde archivo NDJSON (comprimido o no).
+        Con validar=False usa la carga confiable (archivos exportados por GIC).
+        """
+        if not os.path.exists(self.ruta):
+            logger.warning(f"Archivo NDJSON no encontrado: {self.ruta}")
+            return []
+
+        clientes = list(self.iterar(validar))
+        logger.info(f"Importados {len(clientes)} clientes desde {self.ruta}")
+        return clientes
+
+    def iterar(self, validar: bool = True) -> Iterator[Cliente]:
+        """Recorre los clientes del archivo línea por línea."""
+        with abrir_lectura(self.ruta) as f:
+            for item, _ in iterar_lineas_json(f):
+                tipo = item.get("tipo_cliente", "Regular")
+                clase = TIPOS_CLIENTE.get(tipo, ClienteRegular)
+                if validar:
+                    yield clase.from_dict(item)
+                else:
+                    yield clase.from_storage(item)
@@ -2,46 +2,328 @@
 Repositorio SQLite - Capa de persistencia para clientes.
 Implementa el patrón Repository para desacoplar lógica de negocio de la BD.
 """
-from typing import List, Optional
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
 from src.database.connection import DatabaseConnection
-from src.models import Cliente, ClienteRegular, ClientePremium, ClienteCorporativo
+from src.database.estadisticas import leer_contadores
+from src.models import TIPOS_CLIENTE, Cliente, ClienteRegular, ClienteVista
 from src.exceptions.database_errors import (
     RegistroNoEncontradoError,
     RegistroDuplicadoError,
 )
 from src.utils.logger import logger
-from src.utils.helpers import timestamp_actual
+from src.utils.validators import normalizar_email, normalizar_rut, normalizar_telefono
+from src.utils.helpers import (
+    a_epoch,
+    codificar_cursor,
+    decodificar_cursor,
+    epoch_desde_iso,
+    marca_tiempo,
+)
 import sqlite3
 
 
 class SQLiteRepository:
     """Repositorio para operaciones CRUD de clientes en SQLite."""
 
-    # Mapeo tipo_cliente -> clase
-    _CLASES = {
-        "Regular": ClienteRegular,
-        "Premium": ClientePremium,
-        "Corporativo": ClienteCorporativo,
+    # Columnas de la tabla clientes (orden fijo para inserciones en lote)
+    _COLUMNAS = (
+        "id", "nombre", "email", "telefono", "direccion", "activo",
+        "tipo_cliente", "fecha_registro", "fecha_actualizacion",
+        "limite_credito", "puntos_fidelidad",
+        "asesor_dedicado", "nivel_premium", "descuento",
+        "rut_empresa", "razon_social", "rubro", "contacto_comercial",
+        "cantidad_empleados", "descuento_volumen",
+        "fecha_registro_ts", "fecha_actualizacion_ts",
+        "email_normalizado", "telefono_e164", "rut_digitos",
+    )
+
+    # Columnas derivadas (claves de búsqueda) de cada campo del modelo
+    _DERIVADAS = {
+        "email": "email_normalizado",
+        "telefono": "telefono_e164",
+        "rut_empresa": "rut_digitos",
     }
 
+    TAM_LOTE = 500
+
+    def __init__(self, auditoria=None):
+        # Destino de auditoría con registrar(accion, entidad, entidad_id,
+        # detalle), p. ej. AuditoriaService; sin destino no se audita
+        self.auditoria = auditoria
+
+    def _auditar(self, accion: str, id: str, detalle: dict = None):
+        """Registra el evento en el destino de auditoría, si hay uno."""
+        if self.auditoria is not None:
+            self.auditoria.registrar(accion, "Cliente", id, detalle)
+
     def crear(self, cliente: Cliente) -> Cliente:
-        """Inserta un nuevo cliente en la BD."""
-        datos = cliente.to_dict()
+        """
+        Inserta un nuevo cliente en la BD.
+
+        La verificación de duplicados va en la misma sentencia (INSERT ...
+        SELECT ... WHERE NOT EXISTS sobre email_normalizado), por lo que es
+        atómica entre workers y no distingue mayúsculas en el email.
+        """
+        datos = self._datos_fila(cliente)
         columnas = ", ".join(datos.keys())
         placeholders = ", ".join(["?"] * len(datos))
 
         try:
             with DatabaseConnection() as conn:
-                conn.execute(
-                    f"INSERT INTO clientes ({columnas}) VALUES ({placeholders})",
-                    list(datos.values()),
+                cursor = conn.execute(
+                    f"INSERT INTO clientes ({columnas}) SELECT {placeholders} "
+                    "WHERE NOT EXISTS "
+                    "(SELECT 1 FROM clientes WHERE email_normalizado = ?)",
+                    [*datos.values(), datos["email_normalizado"]],
                 )
-                logger.info(f"Cliente guardado en BD: {cliente.nombre} ({cliente.id})")
-                return cliente
         except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed: clientes.email" in str(e):
+            if "clientes.email" in str(e):
                 raise RegistroDuplicadoError("email", cliente.email)
+            if "UNIQUE constraint failed: clientes.id" in str(e):
+                raise RegistroDuplicadoError("id", cliente.id)
             raise
+        if cursor.rowcount == 0:
+            raise RegistroDuplicadoError("email", cliente.email)
+
+        cliente.limpiar_cambios()
+        logger.info(f"Cliente guardado en BD: {cliente.nombre} ({cliente.id})")
+        self._auditar("crear", cliente.id, {"tipo": cliente.tipo_cliente})
+        return cliente
+
+    def crear_lote(self, clientes: Iterable[Cliente], tam_lote: int = None) -> dict:
+        """
+        Inserta clientes en lotes: una transacción y un executemany por lote.
+
+        Los duplicados (email o id, ya existentes o repetidos dentro del
+        mismo lote) se reportan por fila sin abortar el resto del lote.
+
+        Retorna:
+            {"insertados": int, "conflictos": [{"indice", "id", "email", "campo"}]}
+        """
+        tam_lote = tam_lote or self.TAM_LOTE
+        resultado = {"insertados": 0, "conflictos": []}
+        lote = []
+        for indice, cliente in enumerate(clientes):
+            lote.append((indice, cliente))
+            if len(lote) >= tam_lote:
+                self._insertar_lote(lote, resultado)
+                lote = []
+        if lote:
+            self._insertar_lote(lote, resultado)
+
+        logger.info(
+            f"Lote guardado en BD: {resultado['insertados']} insertados, "
+            f"{len(resultado['conflictos'])} conflictos"
+        )
+        return resultado
+
+    def _insertar_lote(self, lote: list, resultado: dict):
+        """Inserta un lote en una sola transacción, apartando los conflictos."""
+        insertados = []
+        columnas = ", ".join(self._COLUMNAS)
+        placeholders = ", ".join(["?"] * len(self._COLUMNAS))
+        sql = f"INSERT INTO clientes ({columnas}) VALUES ({placeholders})"
+
+        def conflicto(indice, cliente, campo):
+            resultado["conflictos"].append({
+                "indice": indice,
+                "id": cliente.id,
+                "email": cliente.email,
+                "campo": campo,
+            })
+
+        with DatabaseConnection() as conn:
+            # El email se compara sin distinguir mayúsculas, igual que crear()
+            filas = {indice: self._valores_fila(c) for indice, c in lote}
+            posicion_email = self._COLUMNAS.index("email_normalizado")
+            claves = {indice: valores[posicion_email] for indice, valores in filas.items()}
+            ids = [c.id for _, c in lote]
+            marcas = ", ".join(["?"] * len(lote))
+            emails_existentes = {
+                row[0] for row in conn.execute(
+                    f"SELECT email_normalizado FROM clientes "
+                    f"WHERE email_normalizado IN ({marcas})",
+                    list(claves.values()),
+                )
+            }
+            ids_existentes = {
+                row[0] for row in conn.execute(
+                    f"SELECT id FROM clientes WHERE id IN ({marcas})", ids
+                )
+            }
+
+            pendientes = []
+            for indice, cliente in lote:
+                if claves[indice] in emails_existentes:
+                    conflicto(indice, cliente, "email")
+                elif cliente.id in ids_existentes:
+                    conflicto(indice, cliente, "id")
+                else:
+                    emails_existentes.add(claves[indice])
+                    ids_existentes.add(cliente.id)
+                    pendientes.append((indice, cliente))
+
+            filas = [filas[indice] for indice, _ in pendientes]
+            try:
+                conn.executemany(sql, filas)
+                insertados = [c for _, c in pendientes]
+            except sqlite3.IntegrityError:
+                # Otro proceso insertó alguna fila entre la verificación y el
+                # INSERT: se reintenta fila a fila dentro de la transacción
+                conn.rollback()
+                for (indice, cliente), valores in zip(pendientes, filas):
+                    try:
+                        conn.execute(sql, valores)
+                        insertados.append(cliente)
+                    except sqlite3.IntegrityError as e:
+                        campo = "email" if "clientes.email" in str(e) else "id"
+                        conflicto(indice, cliente, campo)
+
+        resultado["insertados"] += len(insertados)
+        # Un evento por fila (historial por cliente); el escritor de
+        # auditoría ya los agrupa en una transacción por lote
+        for cliente in insertados:
+            cliente.limpiar_cambios()
+            self._auditar("crear", cliente.id, {"tipo": cliente.tipo_cliente, "lote": True})
+
+    # ==================== UPSERT POR EMAIL ====================
+
+    # Columnas que conserva la fila existente al fusionar por email
+    _INMUTABLES_UPSERT = ("id", "email", "fecha_registro", "fecha_registro_ts")
+    # Columnas que la rama UPDATE toma del instante de la sentencia
+    _MARCA_UPSERT = ("fecha_actualizacion", "fecha_actualizacion_ts")
+
+    def _sql_upsert(self) -> str:
+        columnas = ", ".join(self._COLUMNAS)
+        placeholders = ", ".join(["?"] * len(self._COLUMNAS))
+        sets = ", ".join(
+            f"{columna} = excluded.{columna}"
+            for columna in self._COLUMNAS
+            if columna not in self._INMUTABLES_UPSERT + self._MARCA_UPSERT
+        )
+        return (
+            f"INSERT INTO clientes ({columnas}) VALUES ({placeholders}) "
+            f"ON CONFLICT(email_normalizado) DO UPDATE SET {sets}, "
+            "fecha_actualizacion = ?, fecha_actualizacion_ts = ? RETURNING *"
+        )
+
+    def _upsert(self, conn, cliente: Cliente) -> Tuple[Cliente, bool]:
+        """
+        Ejecuta el upsert de un cliente; retorna (guardado, creado).
+        Debe correr dentro de una transacción BEGIN IMMEDIATE: la lectura
+        previa que decide `creado` y el upsert ven la misma fila.
+        """
+        datos = self._datos_fila(cliente)
+        existe = conn.execute(
+            "SELECT 1 FROM clientes WHERE email_normalizado = ?",
+            (datos["email_normalizado"],),
+        ).fetchone() is not None
+        # La fecha_actualizacion de la entrada puede ser antigua (p. ej. copia
+        # de fecha_registro en filas importadas): al actualizar vale "ahora"
+        valores = [*(datos.get(c) for c in self._COLUMNAS), *marca_tiempo()]
+        row = dict(conn.execute(self._sql_upsert(), valores).fetchone())
+        return self._row_to_cliente(row), not existe
+
+    def crear_o_actualizar(self, cliente: Cliente) -> Tuple[Cliente, bool]:
+        """
+        Inserta el cliente o, si ya existe su email, sobrescribe la fila
+        existente con sus datos (INSERT ... ON CONFLICT DO UPDATE, una sola
+        sentencia). Se conservan id, email y fecha_registro originales;
+        las columnas de otros tipos quedan en NULL si cambia tipo_cliente.
+
+        El conflicto es sobre el índice UNIQUE de email_normalizado: el
+        email no distingue mayúsculas, igual que en crear().
+
+        Retorna (cliente_guardado, creado).
+        """
+        try:
+            with DatabaseConnection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                guardado, creado = self._upsert(conn, cliente)
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed: clientes.id" in str(e):
+                raise RegistroDuplicadoError("id", cliente.id)
+            raise
+
+        cliente.limpiar_cambios()
+        accion = "crear" if creado else "actualizar"
+        logger.info(f"Upsert por email ({accion}): {guardado.email} ({guardado.id})")
+        self._auditar(accion, guardado.id, {"tipo": guardado.tipo_cliente, "upsert": True})
+        return guardado, creado
+
+    def crear_o_actualizar_lote(
+        self, clientes: Iterable[Cliente], tam_lote: int = None
+    ) -> dict:
+        """
+        Upsert por email en lotes: una transacción por lote.
+
+        Las filas cuyo id ya pertenece a otro email se reportan como
+        conflicto sin abortar el resto del lote. Si un email se repite en la
+        entrada, la última fila gana.
+
+        Retorna:
+            {"insertados": int, "actualizados": int,
+             "conflictos": [{"indice", "id", "email", "campo"}]}
+        """
+        tam_lote = tam_lote or self.TAM_LOTE
+        resultado = {"insertados": 0, "actualizados": 0, "conflictos": []}
+        lote = []
+        for indice, cliente in enumerate(clientes):
+            lote.append((indice, cliente))
+            if len(lote) >= tam_lote:
+                self._upsert_lote(lote, resultado)
+                lote = []
+        if lote:
+            self._upsert_lote(lote, resultado)
+
+        logger.info(
+            f"Lote fusionado en BD: {resultado['insertados']} insertados, "
+            f"{resultado['actualizados']} actualizados, "
+            f"{len(resultado['conflictos'])} conflictos"
+        )
+        return resultado
+
+    def _upsert_lote(self, lote: list, resultado: dict):
+        """Fusiona un lote en una sola transacción, apartando los conflictos."""
+        guardados = []
+        with DatabaseConnection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for indice, cliente in lote:
+                try:
+                    guardados.append((cliente, *self._upsert(conn, cliente)))
+                except sqlite3.IntegrityError:
+                    # Solo se revierte la sentencia fallida, no la transacción
+                    resultado["conflictos"].append({
+                        "indice": indice,
+                        "id": cliente.id,
+                        "email": cliente.email,
+                        "campo": "id",
+                    })
+
+        for cliente, guardado, creado in guardados:
+            cliente.limpiar_cambios()
+            resultado["insertados" if creado else "actualizados"] += 1
+            self._auditar(
+                "crear" if creado else "actualizar", guardado.id,
+                {"tipo": guardado.tipo_cliente, "upsert": True, "lote": True},
+            )
+
+    def _valores_fila(self, cliente: Cliente) -> list:
+        """Valores de un cliente en el orden de _COLUMNAS."""
+        datos = self._datos_fila(cliente)
+        return [datos.get(columna) for columna in self._COLUMNAS]
+
+    @staticmethod
+    def _datos_fila(cliente: Cliente) -> dict:
+        """to_dict() más las columnas derivadas que mantiene el repositorio."""
+        datos = cliente.to_dict()
+        datos["fecha_registro_ts"] = epoch_desde_iso(datos["fecha_registro"])
+        datos["fecha_actualizacion_ts"] = epoch_desde_iso(datos["fecha_actualizacion"])
+        datos["email_normalizado"] = normalizar_email(datos["email"])
+        datos["telefono_e164"] = normalizar_telefono(datos["telefono"])
+        datos["rut_digitos"] = normalizar_rut(datos.get("rut_empresa"))
+        return datos
 
     def obtener_por_id(self, id: str) -> Cliente:
         """Busca un cliente por su ID."""
@@ -56,10 +338,35 @@ class SQLiteRepository:
         return self._row_to_cliente(dict(row))
 
     def obtener_por_email(self, email: str) -> Optional[Cliente]:
-        """Busca un cliente por su email."""
+        """
+        Busca un cliente por su email, sin distinguir mayúsculas (índice
+        UNIQUE idx_clientes_email_normalizado). En BD anteriores a la
+        migración 9 podía haber varios: se prefiere el exacto.
+        """
+        return self._obtener_por_clave(
+            "email_normalizado", normalizar_email(email),
+            orden="email = ? DESC, fecha_registro", params_orden=(email,),
+        )
+
+    def obtener_por_telefono(self, telefono: str) -> Optional[Cliente]:
+        """Busca un cliente por teléfono escrito en cualquier formato (E.164)."""
+        return self._obtener_por_clave("telefono_e164", normalizar_telefono(telefono))
+
+    def obtener_por_rut(self, rut: str) -> Optional[Cliente]:
+        """Busca un cliente corporativo por RUT, con o sin puntos y guion."""
+        return self._obtener_por_clave("rut_digitos", normalizar_rut(rut))
+
+    def _obtener_por_clave(
+        self, columna: str, clave: Optional[str],
+        orden: str = "fecha_registro", params_orden: tuple = (),
+    ) -> Optional[Cliente]:
+        """Búsqueda exacta por una columna normalizada indexada (el más antiguo primero)."""
+        if clave is None:
+            return None
         with DatabaseConnection() as conn:
             row = conn.execute(
-                "SELECT * FROM clientes WHERE email = ?", (email,)
+                f"SELECT * FROM clientes WHERE {columna} = ? ORDER BY {orden} LIMIT 1",
+                (clave, *params_orden),
             ).fetchone()
 
         if not row:
@@ -71,35 +378,231 @@ class SQLiteRepository:
         activos_solo: bool = False,
         tipo: str = None,
         busqueda: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
     ) -> List[Cliente]:
-        """Lista clientes con filtros opcionales."""
-        query = "SELECT * FROM clientes WHERE 1=1"
+        """
+        Lista clientes con filtros opcionales.
+        Con búsqueda usa el índice full-text (FTS5) y ordena por relevancia.
+        Los filtros de fecha aceptan epoch, datetime/date o texto ISO
+        (ver a_epoch) y usan los índices de fecha_*_ts.
+        """
+        with DatabaseConnection() as conn:
+            query, params = self._consulta_listado(
+                conn, activos_solo, tipo, busqueda, por_relevancia=True,
+                registrado_desde=registrado_desde,
+                registrado_hasta=registrado_hasta,
+                actualizado_desde=actualizado_desde,
+            )
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._row_to_cliente(dict(row)) for row in rows]
+
+    def listar_pagina(
+        self,
+        activos_solo: bool = False,
+        tipo: str = None,
+        busqueda: str = None,
+        limite: int = 50,
+        cursor: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
+    ) -> Tuple[List[Cliente], Optional[str]]:
+        """
+        Lista una página de clientes con paginación por cursor (keyset).
+
+        Ordena por (fecha_registro, id) descendente usando el índice
+        idx_clientes_fecha_id; la búsqueda full-text solo filtra.
+        Retorna (clientes, siguiente_cursor); el cursor es None en la
+        última página. Lanza ValueError si el cursor o una fecha no es
+        válida. Filtros de fecha: ver listar().
+        """
+        rows, siguiente = self._pagina(
+            activos_solo, tipo, busqueda, limite, cursor,
+            dict(
+                registrado_desde=registrado_desde,
+                registrado_hasta=registrado_hasta,
+                actualizado_desde=actualizado_desde,
+            ),
+        )
+        return [self._row_to_cliente(dict(row)) for row in rows], siguiente
+
+    def listar_vistas(
+        self,
+        activos_solo: bool = False,
+        tipo: str = None,
+        busqueda: str = None,
+        limite: int = 50,
+        cursor: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
+    ) -> Tuple[List[ClienteVista], Optional[str]]:
+        """
+        Igual que listar_pagina() pero retorna vistas de solo lectura
+        (ClienteVista) sobre las filas: el modelo completo solo se
+        construye si se usan sus métodos de negocio.
+        """
+        rows, siguiente = self._pagina(
+            activos_solo, tipo, busqueda, limite, cursor,
+            dict(
+                registrado_desde=registrado_desde,
+                registrado_hasta=registrado_hasta,
+                actualizado_desde=actualizado_desde,
+            ),
+        )
+        return [ClienteVista(row) for row in rows], siguiente
+
+    def iterar_vistas(
+        self,
+        activos_solo: bool = False,
+        tipo: str = None,
+        tam_lote: int = None,
+        activo: bool = None,
+    ) -> Iterator[ClienteVista]:
+        """
+        Recorre todos los clientes (orden de listar()) sin cargarlos en
+        memoria: lee de a tam_lote filas con fetchmany y entrega vistas.
+        `activo` filtra por estado (True/False); None no filtra.
+        La conexión queda tomada del pool mientras se consume el iterador.
+        """
+        tam_lote = tam_lote or self.TAM_LOTE
+        with DatabaseConnection() as conn:
+            query, params = self._consulta_listado(
+                conn, activos_solo, tipo, activo=activo
+            )
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(tam_lote)
+                if not rows:
+                    break
+                for row in rows:
+                    yield ClienteVista(row)
+
+    def _pagina(self, activos_solo, tipo, busqueda, limite, cursor, fechas: dict) -> Tuple[list, Optional[str]]:
+        """Ejecuta el listado keyset y retorna (rows, siguiente_cursor)."""
+        # Se decodifica antes de abrir la conexión: un cursor inválido no
+        # debe registrarse como rollback por error
+        desde = decodificar_cursor(cursor) if cursor else None
+        with DatabaseConnection() as conn:
+            query, params = self._consulta_listado(
+                conn, activos_solo, tipo, busqueda, desde=desde, **fechas,
+            )
+            query += " LIMIT ?"
+            params.append(limite + 1)
+            rows = conn.execute(query, params).fetchall()
+
+        siguiente = None
+        if len(rows) > limite:
+            rows = rows[:limite]
+            ultimo = rows[-1]
+            siguiente = codificar_cursor(ultimo["fecha_registro"], ultimo["id"])
+        return rows, siguiente
+
+    def _consulta_listado(
+        self,
+        conn,
+        activos_solo: bool = False,
+        tipo: str = None,
+        busqueda: str = None,
+        desde: tuple = None,
+        por_relevancia: bool = False,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
+        activo: bool = None,
+    ) -> Tuple[str, list]:
+        """Arma el SELECT del listado con sus filtros y orden."""
+        query = "SELECT c.* FROM clientes c"
+        condiciones = []
         params = []
+        orden = "c.fecha_registro DESC, c.id DESC"
 
+        if busqueda:
+            consulta = self._consulta_fts(busqueda)
+            if consulta and self._fts_disponible(conn):
+                query += " JOIN clientes_fts f ON f.rowid = c.rowid"
+                condiciones.append("clientes_fts MATCH ?")
+                params.append(consulta)
+                if por_relevancia:
+                    orden = "f.rank, " + orden
+            else:
+                # Sin FTS5 o sin palabras (p. ej. "@"): subcadena literal
+                condiciones.append(
+                    "(c.nombre LIKE ? ESCAPE '\\' OR c.email LIKE ? ESCAPE '\\' "
+                    "OR c.telefono LIKE ? ESCAPE '\\')"
+                )
+                patron = "%" + re.sub(r"([\\%_])", r"\\\1", busqueda) + "%"
+                params.extend([patron, patron, patron])
         if activos_solo:
-            query += " AND activo = 1"
+            condiciones.append("c.activo = 1")
+        elif activo is not None:
+            condiciones.append("c.activo = ?")
+            params.append(int(activo))
         if tipo:
-            query += " AND tipo_cliente = ?"
+            condiciones.append("c.tipo_cliente = ?")
             params.append(tipo)
-        if busqueda:
-            query += " AND (nombre LIKE ? OR email LIKE ? OR telefono LIKE ?)"
-            patron = f"%{busqueda}%"
-            params.extend([patron, patron, patron])
+        if registrado_desde is not None:
+            condiciones.append("c.fecha_registro_ts >= ?")
+            params.append(a_epoch(registrado_desde))
+        if registrado_hasta is not None:
+            condiciones.append("c.fecha_registro_ts <= ?")
+            params.append(a_epoch(registrado_hasta, fin_de_dia=True))
+        if actualizado_desde is not None:
+            condiciones.append("c.fecha_actualizacion_ts >= ?")
+            params.append(a_epoch(actualizado_desde))
+        if desde:
+            condiciones.append("(c.fecha_registro, c.id) < (?, ?)")
+            params.extend(desde)
 
-        query += " ORDER BY fecha_registro DESC"
+        if condiciones:
+            query += " WHERE " + " AND ".join(condiciones)
+        query += f" ORDER BY {orden}"
+        return query, params
 
-        with DatabaseConnection() as conn:
-            rows = conn.execute(query, params).fetchall()
+    @staticmethod
+    def _consulta_fts(busqueda: str) -> Optional[str]:
+        """
+        Convierte el texto buscado en una consulta FTS5: cada palabra se
+        busca como prefijo y todas deben coincidir ("mar lop" -> María López).
+        Retorna None si el texto no tiene palabras (solo puntuación).
+        """
+        terminos = re.findall(r"\w+", busqueda)
+        if not terminos:
+            return None
+        return " ".join(f'"{t}"*' for t in terminos)
 
-        return [self._row_to_cliente(dict(row)) for row in rows]
+    @staticmethod
+    def _fts_disponible(conn) -> bool:
+        """Indica si la BD tiene el índice full-text (requiere FTS5)."""
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clientes_fts'"
+        ).fetchone() is not None
 
     def actualizar(self, cliente: Cliente) -> Cliente:
-        """Actualiza un cliente existente."""
-        datos = cliente.to_dict()
-        datos["fecha_actualizacion"] = timestamp_actual()
+        """
+        Actualiza un cliente existente.
 
-        sets = ", ".join([f"{k} = ?" for k in datos.keys() if k != "id"])
-        valores = [v for k, v in datos.items() if k != "id"]
+        Solo escribe las columnas modificadas desde la carga (ver
+        Cliente.cambios); las instancias nuevas se escriben completas.
+        Sin cambios pendientes no se ejecuta ningún UPDATE.
+        """
+        datos = self._datos_fila(cliente)
+        cambios = cliente.cambios
+        if cambios is None:
+            campos = [k for k in datos if k != "id"]
+        elif not cambios:
+            return cliente
+        else:
+            derivadas = {self._DERIVADAS[c] for c in cambios if c in self._DERIVADAS}
+            campos = sorted(
+                cambios | derivadas | {"fecha_actualizacion", "fecha_actualizacion_ts"}
+            )
+
+        sets = ", ".join(f"{campo} = ?" for campo in campos)
+        valores = [datos[campo] for campo in campos]
         valores.append(datos["id"])
 
         with DatabaseConnection() as conn:
@@ -109,7 +612,9 @@ class SQLiteRepository:
             if cursor.rowcount == 0:
                 raise RegistroNoEncontradoError("Cliente", datos["id"])
 
+        cliente.limpiar_cambios()
         logger.info(f"Cliente actualizado: {cliente.nombre} ({cliente.id})")
+        self._auditar("actualizar", cliente.id, {"campos": campos})
         return cliente
 
     def eliminar(self, id: str) -> bool:
@@ -120,21 +625,73 @@ class SQLiteRepository:
                 raise RegistroNoEncontradoError("Cliente", id)
 
         logger.info(f"Cliente eliminado de BD: {id}")
+        self._auditar("eliminar", id)
         return True
 
     def desactivar(self, id: str) -> bool:
         """Desactiva un cliente (borrado lógico)."""
         with DatabaseConnection() as conn:
             cursor = conn.execute(
-                "UPDATE clientes SET activo = 0, fecha_actualizacion = ? WHERE id = ?",
-                (timestamp_actual(), id),
+                "UPDATE clientes SET activo = 0, fecha_actualizacion = ?, "
+                "fecha_actualizacion_ts = ? WHERE id = ?",
+                (*marca_tiempo(), id),
             )
             if cursor.rowcount == 0:
                 raise RegistroNoEncontradoError("Cliente", id)
 
         logger.info(f"Cliente desactivado: {id}")
+        self._auditar("desactivar", id)
+        return True
+
+    def activar(self, id: str) -> bool:
+        """Reactiva un cliente desactivado."""
+        with DatabaseConnection() as conn:
+            cursor = conn.execute(
+                "UPDATE clientes SET activo = 1, fecha_actualizacion = ?, "
+                "fecha_actualizacion_ts = ? WHERE id = ?",
+                (*marca_tiempo(), id),
+            )
+            if cursor.rowcount == 0:
+                raise RegistroNoEncontradoError("Cliente", id)
+
+        logger.info(f"Cliente activado: {id}")
+        self._auditar("activar", id)
         return True
 
+    def alternar_activo(self, id: str) -> bool:
+        """Invierte el estado activo en una sola sentencia. Retorna el nuevo estado."""
+        with DatabaseConnection() as conn:
+            row = conn.execute(
+                "UPDATE clientes SET activo = 1 - activo, fecha_actualizacion = ?, "
+                "fecha_actualizacion_ts = ? WHERE id = ? RETURNING activo",
+                (*marca_tiempo(), id),
+            ).fetchone()
+            if row is None:
+                raise RegistroNoEncontradoError("Cliente", id)
+
+        activo = bool(row[0])
+        logger.info(f"Cliente {'activado' if activo else 'desactivado'}: {id}")
+        self._auditar("activar" if activo else "desactivar", id)
+        return activo
+
+    def agregar_puntos(self, id: str, puntos: int) -> int:
+        """Suma puntos de fidelidad a un cliente regular. Retorna el nuevo total."""
+        if puntos < 0:
+            raise ValueError("Los puntos no pueden ser negativos")
+        with DatabaseConnection() as conn:
+            row = conn.execute(
+                "UPDATE clientes SET puntos_fidelidad = COALESCE(puntos_fidelidad, 0) + ?, "
+                "fecha_actualizacion = ?, fecha_actualizacion_ts = ? "
+                "WHERE id = ? AND tipo_cliente = 'Regular' RETURNING puntos_fidelidad",
+                (puntos, *marca_tiempo(), id),
+            ).fetchone()
+            if row is None:
+                raise RegistroNoEncontradoError("Cliente Regular", id)
+
+        logger.info(f"Puntos agregados a {id}: +{puntos} (Total: {row[0]})")
+        self._auditar("agregar_puntos", id, {"puntos": puntos, "total": row[0]})
+        return row[0]
+
     def contar(self, tipo: str = None) -> int:
         """Cuenta clientes, opcionalmente por tipo."""
         query = "SELECT COUNT(*) FROM clientes"
@@ -147,8 +704,19 @@ class SQLiteRepository:
             row = conn.execute(query, params).fetchone()
         return row[0]
 
+    def obtener_estadisticas(self) -> dict:
+        """
+        Contadores mantenidos por triggers (total, tipo:, activo:, nivel:,
+        tamano:) leídos en una sola consulta.
+        """
+        with DatabaseConnection() as conn:
+            return leer_contadores(conn)
+
     def _row_to_cliente(self, datos: dict) -> Cliente:
-        """Convierte un row de BD a la clase de cliente correspondiente."""
+        """
+        Convierte un row de BD a la clase de cliente correspondiente.
+        Usa la ruta de carga confiable: los datos ya se validaron al escribir.
+        """
         tipo = datos.get("tipo_cliente", "Regular")
-        clase = self._CLASES.get(tipo, ClienteRegular)
-        return clase.from_dict(datos)
+        clase = TIPOS_CLIENTE.get(tipo, ClienteRegular)
+        return clase.from_storage(datos)
@@ -0,0 +1,182 @@
+"""
+Servicio de analítica - Snapshot columnar de la cartera de clientes.
+
+Carga la tabla clientes en arreglos numpy (un arreglo tipado por campo,
+tipo y nivel codificados como categorías) y aplica las reglas de
+descuento de Regular, Premium y Corporativo de forma vectorizada, sin
+instanciar modelos. Pensado para preguntas de cartera completa:
+
+    snapshot = SnapshotClientes.desde_bd()
+    mascara = snapshot.mascara(tipo="Premium", activo=True)
+    snapshot.descuentos(100_000)[mascara].sum()
+    snapshot.agregar(snapshot.descuentos(100_000), por="nivel", mascara=mascara)
+"""
+import numpy as np
+from src.database.connection import DatabaseConnection
+from src.database.estadisticas import BANDAS_TAMANO
+from src.models import ClienteRegular, ClientePremium
+
+TIPOS = ("Regular", "Premium", "Corporativo")
+NIVELES = ClientePremium.NIVELES_VALIDOS
+
+# Mismas tasas que ClientePremium._calcular_descuento_por_nivel (orden de NIVELES)
+_DESCUENTO_NIVEL = np.array([0.10, 0.15, 0.20])
+# Cortes y tasas de ClienteCorporativo._calcular_descuento_volumen
+_CORTES_EMPLEADOS = np.array([10, 50, 200])
+_DESCUENTO_VOLUMEN = np.array([0.05, 0.10, 0.15, 0.20])
+
+PERCENTILES = (50, 90, 99)
+
+_SELECT = f"""
+    SELECT
+        CASE tipo_cliente {" ".join(f"WHEN '{t}' THEN {i}" for i, t in enumerate(TIPOS))}
+            ELSE 0 END,
+        CASE nivel_premium {" ".join(f"WHEN '{n}' THEN {i}" for i, n in enumerate(NIVELES))}
+            ELSE -1 END,
+        activo,
+        COALESCE(puntos_fidelidad, 0),
+        COALESCE(limite_credito, 0),
+        COALESCE(descuento, 0),
+        COALESCE(cantidad_empleados, 1),
+        COALESCE(descuento_volumen, 0)
+    FROM clientes
+"""
+
+
+class SnapshotClientes:
+    """
+    Vista columnar e inmutable de la tabla clientes.
+
+    Atributos (un arreglo por campo, misma longitud):
+        tipo (int8): Índice en TIPOS.
+        nivel (int8): Índice en NIVELES, -1 si no es Premium.
+        activo (bool)
+        puntos_fidelidad (int64)
+        limite_credito (float64)
+        descuento (float64): Descuento Premium almacenado (0 = por nivel).
+        cantidad_empleados (int32)
+        descuento_volumen (float64): Almacenado (0 = por empleados).
+    """
+
+    def __init__(self, columnas: dict):
+        self.tipo = columnas["tipo"].astype(np.int8)
+        self.nivel = columnas["nivel"].astype(np.int8)
+        self.activo = columnas["activo"].astype(bool)
+        self.puntos_fidelidad = columnas["puntos_fidelidad"].astype(np.int64)
+        self.limite_credito = columnas["limite_credito"].astype(np.float64)
+        self.descuento = columnas["descuento"].astype(np.float64)
+        self.cantidad_empleados = np.maximum(
+            columnas["cantidad_empleados"], 1
+        ).astype(np.int32)
+        self.descuento_volumen = columnas["descuento_volumen"].astype(np.float64)
+        self._tasas = None
+
+    @classmethod
+    def desde_bd(cls, db_path: str = None, tam_lote: int = 100_000) -> "SnapshotClientes":
+        """Lee la tabla completa en bloques (una lectura consistente)."""
+        bloques = []
+        with DatabaseConnection(db_path) as conn:
+            cursor = conn.execute(_SELECT)
+            while True:
+                filas = cursor.fetchmany(tam_lote)
+                if not filas:
+                    break
+                bloques.append(np.array(filas, dtype=np.float64))
+
+        matriz = np.concatenate(bloques) if bloques else np.empty((0, 8))
+        nombres = (
+            "tipo", "nivel", "activo", "puntos_fidelidad", "limite_credito",
+            "descuento", "cantidad_empleados", "descuento_volumen",
+        )
+        return cls({nombre: matriz[:, i] for i, nombre in enumerate(nombres)})
+
+    def __len__(self) -> int:
+        return len(self.tipo)
+
+    # ==================== DESCUENTOS ====================
+
+    def tasas_descuento(self) -> np.ndarray:
+        """Tasa de descuento de cada cliente según las reglas de su tipo."""
+        if self._tasas is not None:
+            return self._tasas
+
+        # Regular: 1% cada 1000 puntos, máximo 5%
+        regular = ClienteRegular.DESCUENTO_BASE + np.minimum(
+            (self.puntos_fidelidad // 1000) * 0.01, 0.05
+        )
+        # Premium: descuento almacenado o el de su nivel
+        por_nivel = _DESCUENTO_NIVEL[np.clip(self.nivel, 0, len(NIVELES) - 1)]
+        por_nivel = np.where(self.nivel >= 0, por_nivel, ClientePremium.DESCUENTO_BASE)
+        premium = np.where(self.descuento > 0, self.descuento, por_nivel)
+        # Corporativo: descuento almacenado o por tramo de empleados
+        por_volumen = _DESCUENTO_VOLUMEN[self.bandas_tamano(todos=True)]
+        corporativo = np.where(self.descuento_volumen > 0, self.descuento_volumen, por_volumen)
+
+        self._tasas = np.select(
+            [self.tipo == 1, self.tipo == 2], [premium, corporativo], regular
+        )
+        return self._tasas
+
+    def descuentos(self, monto: float) -> np.ndarray:
+        """Equivalente vectorizado de calcular_descuento(monto) por cliente."""
+        return np.round(monto * self.tasas_descuento(), 2)
+
+    # ==================== FILTROS Y AGRUPACIONES ====================
+
+    def bandas_tamano(self, todos: bool = False) -> np.ndarray:
+        """Índice en BANDAS_TAMANO (-1 para no corporativos salvo todos=True)."""
+        bandas = np.searchsorted(_CORTES_EMPLEADOS, self.cantidad_empleados)
+        if todos:
+            return bandas
+        return np.where(self.tipo == 2, bandas, -1)
+
+    def mascara(self, tipo: str = None, nivel: str = None, activo: bool = None) -> np.ndarray:
+        """Filtro booleano por tipo, nivel premium y estado."""
+        mascara = np.ones(len(self), dtype=bool)
+        if tipo is not None:
+            mascara &= self.tipo == TIPOS.index(tipo)
+        if nivel is not None:
+            mascara &= self.nivel == NIVELES.index(nivel)
+        if activo is not None:
+            mascara &= self.activo == activo
+        return mascara
+
+    def agregar(self, valores: np.ndarray, por: str = "tipo", mascara: np.ndarray = None) -> dict:
+        """
+        Agrupa valores (un arreglo alineado con el snapshot) por
+        "tipo", "nivel" o "tamano". Retorna por grupo: cantidad, suma,
+        media y percentiles PERCENTILES (p50, p90, p99).
+        """
+        grupos = {
+            "tipo": (self.tipo, TIPOS),
+            "nivel": (self.nivel, NIVELES),
+            "tamano": (self.bandas_tamano(), BANDAS_TAMANO),
+        }
+        if por not in grupos:
+            raise ValueError(f"Agrupación inválida: '{por}'. Opciones: {list(grupos)}")
+        codigos, etiquetas = grupos[por]
+
+        if mascara is not None:
+            codigos, valores = codigos[mascara], valores[mascara]
+        validos = codigos >= 0
+        codigos, valores = codigos[validos], valores[validos]
+
+        # Un solo ordenamiento por (grupo, valor) sirve para sumas y percentiles
+        orden = np.lexsort((valores, codigos))
+        codigos, valores = codigos[orden], valores[orden]
+        limites = np.searchsorted(codigos, np.arange(len(etiquetas) + 1))
+
+        resultado = {}
+        for i, etiqueta in enumerate(etiquetas):
+            grupo = valores[limites[i]:limites[i + 1]]
+            if not len(grupo):
+                continue
+            fila = {
+                "cantidad": int(len(grupo)),
+                "suma": float(grupo.sum()),
+                "media": float(grupo.mean()),
+            }
+            for p, valor in zip(PERCENTILES, np.percentile(grupo, PERCENTILES)):
+                fila[f"p{p}"] = float(valor)
+            resultado[etiqueta] = fila
+        return resultado
@@ -0,0 +1,163 @@
+"""
+Servicio de auditoría - Registro asíncrono de actividad en logs_actividad.
+
+Los eventos se encolan en memoria (cola acotada) y un hilo escritor los
+persiste en lotes, una transacción por lote, para no sumar una escritura
+síncrona a cada operación. Al terminar el proceso se vacía la cola.
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+from typing import List
+from config import Config
+from src.repositories.auditoria_repository import AuditoriaRepository
+from src.utils.helpers import timestamp_actual
+from src.utils.logger import logger
+
+
+class AuditoriaService:
+    """
+    Escritor en segundo plano de eventos de auditoría.
+
+    Atributos:
+        repositorio (AuditoriaRepository): Destino de los lotes.
+        tam_lote (int): Máximo de eventos por transacción.
+        intervalo (float): Segundos máximos que un evento espera en la cola.
+    """
+
+    def __init__(
+        self,
+        repositorio: AuditoriaRepository = None,
+        tam_cola: int = None,
+        tam_lote: int = None,
+        intervalo: float = None,
+    ):
+        self.repositorio = repositorio or AuditoriaRepository()
+        self.tam_lote = tam_lote or Config.AUDIT_BATCH_SIZE
+        self.intervalo = intervalo if intervalo is not None else Config.AUDIT_FLUSH_INTERVAL
+        self._cola = queue.Queue(maxsize=tam_cola or Config.AUDIT_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self._encolados = 0
+        self._escritos = 0
+        self._descartados = 0
+        self._lotes = 0
+
+    # ==================== PRODUCTORES ====================
+
+    def registrar(self, accion: str, entidad: str, entidad_id: str = None, detalle=None):
+        """
+        Encola un evento. Si la cola está llena espera hasta
+        Config.AUDIT_PUT_TIMEOUT segundos y luego lo descarta (y lo cuenta).
+        El detalle se guarda siempre como JSON (también si es texto).
+        """
+        if detalle is not None:
+            detalle = json.dumps(detalle, ensure_ascii=False, default=str)
+        evento = (accion, entidad, entidad_id, detalle, timestamp_actual())
+        self._iniciar()
+        try:
+            self._cola.put(evento, timeout=Config.AUDIT_PUT_TIMEOUT)
+        except queue.Full:
+            with self._lock:
+                self._descartados += 1
+            logger.warning(f"Cola de auditoría llena, evento descartado: {accion} {entidad_id}")
+            return
+        with self._lock:
+            self._encolados += 1
+
+    # ==================== ESCRITOR ====================
+
+    def _iniciar(self):
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        with self._lock:
+            if self._hilo is None or not self._hilo.is_alive():
+                self._detener.clear()
+                self._hilo = threading.Thread(
+                    target=self._bucle, name="auditoria-writer", daemon=True
+                )
+                self._hilo.start()
+
+    def _bucle(self):
+        while True:
+            try:
+                primero = self._cola.get(timeout=self.intervalo)
+            except queue.Empty:
+                if self._detener.is_set():
+                    return
+                continue
+
+            lote = [primero]
+            while len(lote) < self.tam_lote:
+                try:
+                    lote.append(self._cola.get_nowait())
+                except queue.Empty:
+                    break
+            self._escribir(lote)
+
+    def _escribir(self, lote: List[tuple]):
+        try:
+            self.repositorio.guardar_lote(lote)
+            with self._lock:
+                self._escritos += len(lote)
+                self._lotes += 1
+        except Exception as e:
+            with self._lock:
+                self._descartados += len(lote)
+            logger.error(f"No se pudo guardar lote de auditoría ({len(lote)} eventos): {e}")
+        finally:
+            for _ in lote:
+                self._cola.task_done()
+
+    def flush(self):
+        """Bloquea hasta que todos los eventos encolados estén escritos."""
+        if self._hilo is not None and self._hilo.is_alive():
+            self._cola.join()
+
+    def cerrar(self):
+        """Vacía la cola y detiene el hilo escritor."""
+        self.flush()
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout=self.intervalo + 1)
+
+    # ==================== CONSULTAS ====================
+
+    def historial(self, entidad_id: str, limite: int = 100) -> List[dict]:
+        """Historial de una entidad (incluye los eventos aún en cola)."""
+        self.flush()
+        return self.repositorio.historial(entidad_id, limite)
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            return {
+                "encolados": self._encolados,
+                "escritos": self._escritos,
+                "descartados": self._descartados,
+                "lotes": self._lotes,
+                "en_cola": self._cola.qsize(),
+            }
+
+
+_auditoria = None
+_auditoria_pid = None
+_auditoria_lock = threading.Lock()
+
+
+def obtener_auditoria() -> AuditoriaService:
+    """Instancia compartida del servicio de auditoría (una por proceso)."""
+    global _auditoria, _auditoria_pid
+    with _auditoria_lock:
+        if _auditoria is None or _auditoria_pid != os.getpid():
+            _auditoria = AuditoriaService()
+            _auditoria_pid = os.getpid()
+        return _auditoria
+
+
+@atexit.register
+def _cerrar_al_salir():
+    if _auditoria is not None and _auditoria_pid == os.getpid():
+        _auditoria.cerrar()
@@ -0,0 +1,155 @@
+"""
+Caché de lectura de clientes por id y por email (una por proceso).
+
+ClienteService.obtener_cliente y buscar_por_email la consultan antes de
+ir a SQLite; cada ruta de escritura del servicio invalida al cliente
+afectado. Las escrituras hechas desde otros procesos (u otras conexiones
+del pool) se detectan con PRAGMA data_version sobre una conexión dedicada:
+si el valor cambió desde la última consulta, la caché se vacía completa.
+
+Las entradas expiran además tras Config.CLIENT_CACHE_TTL segundos.
+"""
+import copy
+import os
+import sqlite3
+import threading
+from typing import Callable, Optional
+from config import Config
+from src.database.connection import ruta_db_por_defecto
+from src.models import Cliente
+from src.utils.cache import CacheLRU
+from src.utils.validators import normalizar_email
+
+
+class CacheClientes:
+    """
+    Caché read-through de modelos Cliente.
+
+    Se guardan y entregan copias: quien recibe un cliente puede modificarlo
+    (p. ej. antes de actualizarlo) sin alterar la entrada cacheada.
+    """
+
+    def __init__(self, db_path: str = None, tamano: int = None, ttl: float = None):
+        self.db_path = db_path or ruta_db_por_defecto()
+        tamano = Config.CLIENT_CACHE_SIZE if tamano is None else tamano
+        ttl = (Config.CLIENT_CACHE_TTL if ttl is None else ttl) or None
+        self._por_id = CacheLRU(tamano, ttl)
+        self._por_email = CacheLRU(tamano, ttl)  # email consultado -> id
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._version = self._data_version()
+        self._generacion = 0
+        self._invalidaciones = 0
+        self._vaciados = 0
+
+    def _data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _vigente(self) -> int:
+        """
+        Vacía la caché si otra conexión escribió en la BD desde la última
+        consulta. Retorna la generación vigente: un resultado leído de la BD
+        solo se guarda si la generación no cambió mientras se leía.
+        """
+        with self._lock:
+            version = self._data_version()
+            if version != self._version:
+                self._version = version
+                self._vaciar()
+            return self._generacion
+
+    def _vaciar(self):
+        self._generacion += 1
+        self._vaciados += 1
+        self._por_id.vaciar()
+        self._por_email.vaciar()
+
+    def _guardar(self, cliente: Cliente, generacion: int, email: str = None):
+        with self._lock:
+            if generacion != self._generacion:
+                return
+            self._por_id.guardar(cliente.id, copy.copy(cliente))
+            if email is not None:
+                self._por_email.guardar(email, cliente.id)
+
+    # ==================== LECTURA ====================
+
+    def por_id(self, id: str, cargar: Callable[[str], Cliente]) -> Cliente:
+        """Cliente por id; en un miss lo lee con cargar(id) y lo guarda."""
+        generacion = self._vigente()
+        cliente = self._por_id.obtener(id)
+        if cliente is not None:
+            return copy.copy(cliente)
+        cliente = cargar(id)
+        self._guardar(cliente, generacion)
+        return cliente
+
+    def por_email(
+        self, email: str, cargar: Callable[[str], Optional[Cliente]]
+    ) -> Optional[Cliente]:
+        """Cliente por email; los emails sin cliente no se cachean."""
+        generacion = self._vigente()
+        id = self._por_email.obtener(email)
+        if id is not None:
+            cliente = self._por_id.obtener(id)
+            # El cliente pudo cambiar de email desde que se cacheó la clave
+            if cliente is not None and (
+                normalizar_email(cliente.email) == normalizar_email(email)
+            ):
+                return copy.copy(cliente)
+
+        cliente = cargar(email)
+        if cliente is not None:
+            self._guardar(cliente, generacion, email)
+        return cliente
+
+    # ==================== INVALIDACIÓN ====================
+
+    def invalidar(self, id: str):
+        """Descarta un cliente tras escribirlo (sus claves de email se revalidan)."""
+        with self._lock:
+            self._generacion += 1
+            self._invalidaciones += 1
+            self._por_id.descartar(id)
+
+    def invalidar_todo(self):
+        """Vacía la caché (escrituras masivas: importaciones, merge)."""
+        with self._lock:
+            self._vaciar()
+
+    def estadisticas(self) -> dict:
+        """Hits, misses y tasa de aciertos de cada índice, más invalidaciones."""
+        resultado = {}
+        for nombre, cache in (("por_id", self._por_id), ("por_email", self._por_email)):
+            stats = cache.estadisticas()
+            consultas = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / consultas, 4) if consultas else 0.0
+            resultado[nombre] = stats
+        with self._lock:
+            resultado.update({
+                "ttl": self._por_id.ttl,
+                "invalidaciones": self._invalidaciones,
+                "vaciados": self._vaciados,
+                "data_version": self._version,
+            })
+        return resultado
+
+    def cerrar(self):
+        """Cierra la conexión dedicada a PRAGMA data_version."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_cache_pid = None
+_cache_lock = threading.Lock()
+
+
+def obtener_cache_clientes() -> CacheClientes:
+    """Instancia compartida de la caché de clientes (una por proceso)."""
+    global _cache, _cache_pid
+    with _cache_lock:
+        if _cache is None or _cache_pid != os.getpid():
+            _cache = CacheClientes()
+            _cache_pid = os.getpid()
+        return _cache
@@ -2,13 +2,21 @@
 Servicio de gestión de clientes - Capa de lógica de negocio.
 Orquesta operaciones entre repositorios e integraciones.
 """
-from typing import List, Optional
-from src.models import Cliente, crear_cliente
+import os
+from typing import List, Optional, Tuple
+from src.models import TIPOS_CLIENTE, Cliente, ClientePremium, ClienteVista, crear_cliente
 from src.repositories.sqlite_repository import SQLiteRepository
 from src.repositories.json_repository import JSONRepository
 from src.repositories.csv_repository import CSVRepository
-from src.exceptions.database_errors import RegistroDuplicadoError
+from src.repositories.ndjson_repository import NDJSONRepository
+from src.services.auditoria_service import obtener_auditoria
+from src.services.cache_clientes import obtener_cache_clientes
+from src.services.importacion_csv import ImportadorCSV
+from src.services.importacion_json import ImportadorJSON
+from src.database.estadisticas import BANDAS_TAMANO
+from src.utils.compresion import validar_compresion
 from src.utils.logger import logger
+from src.utils.validacion_lote import validar_lote
 
 
 class ClienteService:
@@ -18,93 +26,316 @@ class ClienteService:
     """
 
     def __init__(self):
-        self.db = SQLiteRepository()
+        self.auditoria = obtener_auditoria()
+        self.db = SQLiteRepository(auditoria=self.auditoria)
         self.json_repo = JSONRepository()
         self.csv_repo = CSVRepository()
+        self.ndjson_repo = NDJSONRepository()
+        self.cache = obtener_cache_clientes()
 
     def crear_cliente(self, tipo: str, **datos) -> Cliente:
         """
         Crea un nuevo cliente y lo persiste en la BD.
-        Valida duplicados por email antes de crear.
+        El INSERT verifica el email duplicado en la misma sentencia
+        (lanza RegistroDuplicadoError).
         """
-        # Verificar duplicados
-        existente = self.db.obtener_por_email(datos.get("email", ""))
-        if existente:
-            raise RegistroDuplicadoError("email", datos["email"])
-
-        # Crear instancia usando el factory
         cliente = crear_cliente(tipo, **datos)
-
-        # Persistir
         self.db.crear(cliente)
         logger.info(f"Servicio: cliente creado ({tipo}) - {cliente.nombre}")
         return cliente
 
+    def guardar_por_email(
+        self, email: str, tipo: str = "Regular", **datos
+    ) -> Tuple[Cliente, bool]:
+        """
+        Crea el cliente o sobrescribe el existente con ese email (upsert).
+        Retorna (cliente, creado).
+        """
+        cliente = crear_cliente(tipo, **{**datos, "email": email})
+        guardado, creado = self.db.crear_o_actualizar(cliente)
+        self.cache.invalidar(guardado.id)
+        return guardado, creado
+
+    def fusionar_lote(self, filas: List[dict], region: str = "CL") -> dict:
+        """
+        Upsert por email de un lote de filas crudas (sincronización con
+        sistemas externos). Cada fila se valida completa con validar_lote;
+        las inválidas se reportan y no se escriben.
+
+        Retorna {"total", "insertados", "actualizados", "errores", "conflictos"}.
+        """
+        validacion = validar_lote(filas, region)
+        clientes = [
+            TIPOS_CLIENTE[datos["tipo_cliente"]].from_storage(datos)
+            for _, datos in validacion["validos"]
+        ]
+        indices = [indice for indice, _ in validacion["validos"]]
+
+        resultado = self.db.crear_o_actualizar_lote(clientes)
+        self.cache.invalidar_todo()
+        for conflicto in resultado["conflictos"]:
+            # Índice de la fila de entrada, no de la lista de válidos
+            conflicto["indice"] = indices[conflicto["indice"]]
+        return {
+            "total": validacion["total"],
+            "insertados": resultado["insertados"],
+            "actualizados": resultado["actualizados"],
+            "errores": validacion["errores"],
+            "conflictos": resultado["conflictos"],
+        }
+
     def obtener_cliente(self, id: str) -> Cliente:
-        """Obtiene un cliente por su ID."""
-        return self.db.obtener_por_id(id)
+        """Obtiene un cliente por su ID (caché de lectura, ver cache_clientes)."""
+        return self.cache.por_id(id, self.db.obtener_por_id)
 
     def buscar_por_email(self, email: str) -> Optional[Cliente]:
-        """Busca un cliente por email."""
-        return self.db.obtener_por_email(email)
+        """Busca un cliente por email (sin distinguir mayúsculas; con caché)."""
+        return self.cache.por_email(email, self.db.obtener_por_email)
+
+    def buscar_por_telefono(self, telefono: str) -> Optional[Cliente]:
+        """Busca un cliente por teléfono en cualquier formato."""
+        return self.db.obtener_por_telefono(telefono)
+
+    def buscar_por_rut(self, rut: str) -> Optional[Cliente]:
+        """Busca un cliente corporativo por RUT."""
+        return self.db.obtener_por_rut(rut)
 
     def listar_clientes(
         self,
         activos_solo: bool = False,
         tipo: str = None,
         busqueda: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
     ) -> List[Cliente]:
-        """Lista clientes con filtros opcionales."""
-        return self.db.listar(activos_solo=activos_solo, tipo=tipo, busqueda=busqueda)
+        """Lista clientes con filtros opcionales (incluye rangos de fecha)."""
+        return self.db.listar(
+            activos_solo=activos_solo,
+            tipo=tipo,
+            busqueda=busqueda,
+            registrado_desde=registrado_desde,
+            registrado_hasta=registrado_hasta,
+            actualizado_desde=actualizado_desde,
+        )
+
+    def listar_pagina(
+        self,
+        activos_solo: bool = False,
+        tipo: str = None,
+        busqueda: str = None,
+        limite: int = 50,
+        cursor: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
+    ) -> Tuple[List[Cliente], Optional[str]]:
+        """Lista una página de clientes. Retorna (clientes, siguiente_cursor)."""
+        return self.db.listar_pagina(
+            activos_solo=activos_solo,
+            tipo=tipo,
+            busqueda=busqueda,
+            limite=limite,
+            cursor=cursor,
+            registrado_desde=registrado_desde,
+            registrado_hasta=registrado_hasta,
+            actualizado_desde=actualizado_desde,
+        )
+
+    def listar_vistas(
+        self,
+        activos_solo: bool = False,
+        tipo: str = None,
+        busqueda: str = None,
+        limite: int = 50,
+        cursor: str = None,
+        registrado_desde=None,
+        registrado_hasta=None,
+        actualizado_desde=None,
+    ) -> Tuple[List[ClienteVista], Optional[str]]:
+        """Como listar_pagina() pero con vistas de solo lectura (para listados)."""
+        return self.db.listar_vistas(
+            activos_solo=activos_solo,
+            tipo=tipo,
+            busqueda=busqueda,
+            limite=limite,
+            cursor=cursor,
+            registrado_desde=registrado_desde,
+            registrado_hasta=registrado_hasta,
+            actualizado_desde=actualizado_desde,
+        )
 
     def actualizar_cliente(self, id: str, **datos) -> Cliente:
         """Actualiza los datos de un cliente existente."""
         cliente = self.db.obtener_por_id(id)
 
-        # Actualizar atributos proporcionados
+        # Actualizar atributos proporcionados (solo los que cambian)
         for campo, valor in datos.items():
             if hasattr(cliente, campo) and valor is not None:
-                setattr(cliente, campo, valor)
+                if getattr(cliente, campo) != valor:
+                    setattr(cliente, campo, valor)
 
         self.db.actualizar(cliente)
+        self.cache.invalidar(id)
         logger.info(f"Servicio: cliente actualizado - {cliente.nombre}")
         return cliente
 
     def eliminar_cliente(self, id: str) -> bool:
         """Elimina un cliente (borrado físico)."""
-        return self.db.eliminar(id)
+        eliminado = self.db.eliminar(id)
+        self.cache.invalidar(id)
+        return eliminado
 
     def desactivar_cliente(self, id: str) -> bool:
         """Desactiva un cliente (borrado lógico)."""
-        return self.db.desactivar(id)
-
-    def exportar_json(self) -> str:
-        """Exporta todos los clientes a JSON."""
-        clientes = self.db.listar()
-        return self.json_repo.exportar(clientes)
-
-    def exportar_csv(self) -> str:
-        """Exporta todos los clientes a CSV."""
-        clientes = self.db.listar()
-        return self.csv_repo.exportar(clientes)
-
-    def importar_json(self) -> int:
-        """Importa clientes desde JSON a la BD."""
-        clientes = self.json_repo.importar()
-        count = 0
-        for cliente in clientes:
-            try:
-                self.db.crear(cliente)
-                count += 1
-            except RegistroDuplicadoError:
-                logger.warning(f"Duplicado al importar: {cliente.email}")
-        return count
+        resultado = self.db.desactivar(id)
+        self.cache.invalidar(id)
+        return resultado
+
+    def activar_cliente(self, id: str) -> bool:
+        """Reactiva un cliente desactivado."""
+        resultado = self.db.activar(id)
+        self.cache.invalidar(id)
+        return resultado
+
+    def alternar_activo(self, id: str) -> bool:
+        """Activa o desactiva el cliente. Retorna el nuevo estado."""
+        activo = self.db.alternar_activo(id)
+        self.cache.invalidar(id)
+        return activo
+
+    def agregar_puntos(self, id: str, puntos: int) -> int:
+        """Suma puntos de fidelidad a un cliente regular."""
+        total = self.db.agregar_puntos(id, puntos)
+        self.cache.invalidar(id)
+        return total
+
+    def historial_cliente(self, id: str, limite: int = 100) -> List[dict]:
+        """Eventos de auditoría del cliente, del más reciente al más antiguo."""
+        return self.auditoria.historial(id, limite)
+
+    FORMATOS_EXPORTACION = ("json", "ndjson", "csv")
+
+    def exportar(self, formato: str = "json", compresion: str = None, **opciones) -> str:
+        """
+        Exporta en el formato pedido ("json", "ndjson" o "csv"), con
+        compresion opcional ("gzip" o "zstd"). Las opciones (columnas,
+        tipo, activo) se pasan al exportador del formato. Lanza ValueError
+        si el formato o la compresión no existen.
+        """
+        exportadores = {
+            "json": self.exportar_json,
+            "ndjson": self.exportar_ndjson,
+            "csv": self.exportar_csv,
+        }
+        if formato not in exportadores:
+            raise ValueError(
+                f"Formato desconocido: '{formato}' (opciones: {', '.join(self.FORMATOS_EXPORTACION)})"
+            )
+        return exportadores[formato](compresion=compresion, **opciones)
+
+    def exportar_json(self, compresion: str = None) -> str:
+        """Exporta todos los clientes a JSON (en streaming desde la BD)."""
+        compresion = validar_compresion(compresion)
+        return self.json_repo.exportar(self.db.iterar_vistas(), compresion)
+
+    def exportar_ndjson(
+        self, compresion: str = None, tipo: str = None, activo: bool = None
+    ) -> str:
+        """
+        Exporta clientes a NDJSON (un cliente por línea) en streaming desde
+        la BD, opcionalmente filtrados y comprimidos.
+        """
+        compresion = validar_compresion(compresion)
+        clientes = self.db.iterar_vistas(tipo=tipo, activo=activo)
+        return self.ndjson_repo.exportar(clientes, compresion)
+
+    def exportar_csv(
+        self,
+        columnas: List[str] = None,
+        tipo: str = None,
+        activo: bool = None,
+        compresion: str = None,
+    ) -> str:
+        """
+        Exporta clientes a CSV en streaming desde la BD, opcionalmente
+        filtrados por tipo y estado, con una selección de columnas y
+        comprimido (ValueError si una columna o la compresión no existen).
+        """
+        columnas = self.csv_repo.validar_columnas(columnas)
+        compresion = validar_compresion(compresion)
+        clientes = self.db.iterar_vistas(tipo=tipo, activo=activo)
+        return self.csv_repo.exportar(clientes, columnas, compresion)
+
+    def importar_json(self, ruta: str = None) -> int:
+        """
+        Importa clientes desde JSON o NDJSON (según la extensión; gzip/zstd
+        se detectan solos) a la BD en streaming (ImportadorJSON): memoria
+        acotada, lotes con checkpoint y reanudación si se interrumpe.
+        Retorna la cantidad de clientes insertados.
+        """
+        ruta = ruta or self.json_repo.ruta
+        if not os.path.exists(ruta):
+            logger.warning(f"Archivo no encontrado: {ruta}")
+            return 0
+        resumen = ImportadorJSON(ruta, self.db).ejecutar()
+        self.cache.invalidar_todo()
+        for error in resumen["muestra_errores"]:
+            logger.warning(
+                f"Fila {error['indice']} inválida ({error['campo']}): {error['mensaje']}"
+            )
+        return resumen["insertados"]
+
+    def importar_ndjson(self, ruta: str = None) -> int:
+        """Importa clientes desde NDJSON (comprimido o no) en streaming."""
+        return self.importar_json(ruta or self.ndjson_repo.ruta)
+
+    def importar_csv(self) -> int:
+        """Importa clientes desde CSV a la BD (inserción en lotes)."""
+        return self._importar(self.csv_repo.importar())
+
+    def importar_csv_paralelo(self, ruta: str = None, procesos: int = None) -> dict:
+        """
+        Importa un CSV grande repartiendo parseo y validación entre procesos
+        (ImportadorCSV). Los errores y duplicados quedan en <ruta>.errores.csv.
+        Retorna el resumen de la importación ({} si el archivo no existe).
+        """
+        ruta = ruta or self.csv_repo.ruta
+        if not os.path.exists(ruta):
+            logger.warning(f"Archivo no encontrado: {ruta}")
+            return {}
+        resumen = ImportadorCSV(ruta, self.db, procesos=procesos).ejecutar()
+        self.cache.invalidar_todo()
+        return resumen
+
+    def _importar(self, clientes: List[Cliente]) -> int:
+        """Persiste clientes importados con crear_lote y reporta duplicados."""
+        resultado = self.db.crear_lote(clientes)
+        self.cache.invalidar_todo()
+        for conflicto in resultado["conflictos"]:
+            logger.warning(
+                f"Duplicado al importar ({conflicto['campo']}): {conflicto['email']}"
+            )
+        return resultado["insertados"]
 
     def estadisticas(self) -> dict:
-        """Retorna estadísticas generales del sistema."""
+        """
+        Retorna estadísticas generales del sistema.
+        Se leen de los contadores que mantienen los triggers (una consulta).
+        """
+        c = self.db.obtener_estadisticas()
         return {
-            "total": self.db.contar(),
-            "regulares": self.db.contar("Regular"),
-            "premium": self.db.contar("Premium"),
-            "corporativos": self.db.contar("Corporativo"),
+            "total": c.get("total", 0),
+            "regulares": c.get("tipo:Regular", 0),
+            "premium": c.get("tipo:Premium", 0),
+            "corporativos": c.get("tipo:Corporativo", 0),
+            "activos": c.get("activo:1", 0),
+            "inactivos": c.get("activo:0", 0),
+            "por_nivel": {
+                nivel: c.get(f"nivel:{nivel}", 0)
+                for nivel in ClientePremium.NIVELES_VALIDOS
+            },
+            "por_tamano": {
+                banda: c.get(f"tamano:{banda}", 0) for banda in BANDAS_TAMANO
+            },
         }
@@ -0,0 +1,237 @@
+"""
+Importación paralela de clientes desde un archivo CSV.
+
+El archivo se mapea en memoria (mmap) y se divide en rangos de bytes que
+empiezan y terminan en un límite de registro: un salto de línea cuenta
+como fin de registro solo si la cantidad de comillas desde el inicio del
+rango es par (los campos entre comillas pueden contener saltos de
+línea; las comillas escapadas "" no alteran la paridad).
+
+Cada rango se parsea y valida (iterar_validacion) en un proceso del pool;
+los resultados se consumen en el orden del archivo y un único escritor
+los inserta con crear_lote. El resultado es el mismo con 1 o N procesos:
+mismo orden de inserción, mismos conflictos y mismo reporte de errores.
+
+Uso desde consola:
+    python -m src.services.importacion_csv data/socios.csv [procesos]
+"""
+import csv
+import io
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+from config import Config
+from src.models import TIPOS_CLIENTE
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.services.auditoria_service import obtener_auditoria
+from src.utils.compresion import detectar_compresion
+from src.utils.helpers import escritura_atomica
+from src.utils.logger import logger
+from src.utils.validacion_lote import iterar_validacion
+
+TAM_RANGO = 1024 * 1024  # Bytes por tarea (acota la memoria en vuelo)
+
+_COLUMNAS_REPORTE = ("indice", "campo", "mensaje")
+
+
+def _limite_de_registro(mm, desde: int, dentro_de_comillas: bool) -> int:
+    """Posición siguiente al primer salto de línea fuera de comillas desde `desde`."""
+    pos = desde
+    while True:
+        salto = mm.find(b"\n", pos)
+        if salto == -1:
+            return len(mm)
+        if mm[pos:salto].count(b'"') % 2:
+            dentro_de_comillas = not dentro_de_comillas
+        if not dentro_de_comillas:
+            return salto + 1
+        pos = salto + 1
+
+
+def dividir_en_rangos(mm, inicio: int, tam_rango: int = TAM_RANGO) -> List[Tuple[int, int]]:
+    """
+    Divide mm[inicio:] en rangos (inicio, fin) de ~tam_rango bytes
+    alineados a registros completos. `inicio` debe ser un inicio de registro.
+    """
+    rangos = []
+    pos = inicio
+    while pos < len(mm):
+        objetivo = pos + tam_rango
+        if objetivo >= len(mm):
+            rangos.append((pos, len(mm)))
+            break
+        dentro = mm[pos:objetivo].count(b'"') % 2 == 1
+        corte = _limite_de_registro(mm, objetivo, dentro)
+        rangos.append((pos, corte))
+        pos = corte
+    return rangos
+
+
+def _procesar_rango(ruta: str, inicio: int, fin: int, columnas: list, region: str) -> dict:
+    """
+    Tarea del pool: parsea y valida un rango. Los índices son locales al
+    rango; el escritor les suma la cantidad de filas de los rangos previos.
+    """
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        texto = mm[inicio:fin].decode("utf-8")
+
+    filas, errores_formato = [], []
+    for registro in csv.reader(io.StringIO(texto, newline="")):
+        if not registro:
+            continue  # Línea en blanco
+        if len(registro) != len(columnas):
+            errores_formato.append(len(filas))
+        filas.append(dict(zip(columnas, registro)))
+
+    validos, errores = [], []
+    for indice, datos, errores_fila in iterar_validacion(
+        filas, region, detectar_repetidos=False
+    ):
+        if errores_formato and indice == errores_formato[0]:
+            errores_formato.pop(0)
+            errores_fila = [{
+                "indice": indice, "campo": "",
+                "mensaje": f"Se esperaban {len(columnas)} columnas",
+            }]
+        if errores_fila:
+            errores.extend(errores_fila)
+        else:
+            validos.append((indice, datos))
+    return {"filas": len(filas), "validos": validos, "errores": errores}
+
+
+class ImportadorCSV:
+    """
+    Importa un CSV a la BD repartiendo parseo y validación entre procesos.
+
+    Atributos:
+        ruta (str): Archivo CSV (UTF-8, con encabezado).
+        procesos (int): Procesos del pool (1 = todo en el proceso actual).
+        tam_rango (int): Bytes por tarea.
+        ruta_reporte (str): CSV de errores (por defecto <ruta>.errores.csv).
+    """
+
+    def __init__(
+        self,
+        ruta: str,
+        repo: SQLiteRepository = None,
+        procesos: int = None,
+        tam_rango: int = TAM_RANGO,
+        ruta_reporte: str = None,
+        region: str = "CL",
+    ):
+        self.ruta = ruta
+        self.repo = repo or SQLiteRepository(auditoria=obtener_auditoria())
+        self.procesos = max(1, procesos or Config.IMPORT_WORKERS or os.cpu_count() or 1)
+        self.tam_rango = tam_rango
+        self.ruta_reporte = ruta_reporte or f"{ruta}.errores.csv"
+        self.region = region
+
+    def _encabezado_y_rangos(self) -> Tuple[list, List[Tuple[int, int]]]:
+        if os.path.getsize(self.ruta) == 0:
+            return [], []
+        if detectar_compresion(self.ruta):
+            # Los rangos de bytes requieren el archivo plano (mmap)
+            raise ValueError(
+                f"{self.ruta} está comprimido: descomprímalo o use CSVRepository.importar"
+            )
+        with open(self.ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            fin_encabezado = _limite_de_registro(mm, 0, False)
+            linea = mm[:fin_encabezado].decode("utf-8-sig")
+            columnas = next(csv.reader(io.StringIO(linea, newline="")), [])
+            return columnas, dividir_en_rangos(mm, fin_encabezado, self.tam_rango)
+
+    def _resultados(self, columnas: list, rangos: list):
+        """Resultados por rango, en el orden del archivo."""
+        if self.procesos == 1 or len(rangos) <= 1:
+            for inicio, fin in rangos:
+                yield _procesar_rango(self.ruta, inicio, fin, columnas, self.region)
+            return
+
+        # spawn: los workers no heredan hilos ni conexiones del proceso padre
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.procesos, mp_context=contexto) as pool:
+            pendientes = deque()
+            rangos = iter(rangos)
+            # A lo sumo 2 tareas por proceso en vuelo: memoria acotada
+            for inicio, fin in rangos:
+                pendientes.append(pool.submit(
+                    _procesar_rango, self.ruta, inicio, fin, columnas, self.region
+                ))
+                if len(pendientes) >= 2 * self.procesos:
+                    yield pendientes.popleft().result()
+            while pendientes:
+                yield pendientes.popleft().result()
+
+    def ejecutar(self) -> dict:
+        """
+        Importa el archivo completo.
+
+        Retorna {"procesados", "insertados", "errores", "conflictos",
+        "reporte", "procesos", "segundos", "filas_por_segundo"}. El reporte
+        lista (indice, campo, mensaje) de cada error de validación y de
+        cada duplicado, con índices de fila 0-based sin el encabezado.
+        """
+        inicio = time.perf_counter()
+        columnas, rangos = self._encabezado_y_rangos()
+        resumen = {"procesados": 0, "insertados": 0, "errores": 0, "conflictos": 0}
+
+        with escritura_atomica(self.ruta_reporte, newline="") as reporte:
+            escritor = csv.writer(reporte)
+            escritor.writerow(_COLUMNAS_REPORTE)
+
+            for resultado in self._resultados(columnas, rangos):
+                base = resumen["procesados"]
+                filas_con_error = set()
+                for error in resultado["errores"]:
+                    filas_con_error.add(error["indice"])
+                    escritor.writerow((base + error["indice"], error["campo"], error["mensaje"]))
+
+                indices = [base + indice for indice, _ in resultado["validos"]]
+                clientes = [
+                    TIPOS_CLIENTE[datos["tipo_cliente"]].from_storage(datos)
+                    for _, datos in resultado["validos"]
+                ]
+                insercion = self.repo.crear_lote(clientes)
+                for conflicto in insercion["conflictos"]:
+                    escritor.writerow((
+                        indices[conflicto["indice"]], conflicto["campo"],
+                        f"Duplicado: ya existe un cliente con ese {conflicto['campo']}",
+                    ))
+
+                resumen["procesados"] += resultado["filas"]
+                resumen["insertados"] += insercion["insertados"]
+                resumen["errores"] += len(filas_con_error)
+                resumen["conflictos"] += len(insercion["conflictos"])
+
+        segundos = time.perf_counter() - inicio
+        resumen.update({
+            "reporte": self.ruta_reporte,
+            "procesos": self.procesos,
+            "segundos": round(segundos, 3),
+            "filas_por_segundo": resumen["procesados"] / segundos if segundos > 0 else 0.0,
+        })
+        logger.info(
+            f"Importación CSV de {self.ruta} ({self.procesos} procesos): "
+            f"{resumen['insertados']} insertados, {resumen['errores']} filas con errores, "
+            f"{resumen['conflictos']} conflictos ({resumen['filas_por_segundo']:,.0f} filas/s)"
+        )
+        return resumen
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Uso: python -m src.services.importacion_csv <archivo.csv> [procesos]")
+        sys.exit(2)
+    procesos = int(sys.argv[2]) if len(sys.argv) == 3 else None
+    resumen = ImportadorCSV(sys.argv[1], procesos=procesos).ejecutar()
+    print(
+        f"✅ {resumen['insertados']} insertados, {resumen['errores']} con errores, "
+        f"{resumen['conflictos']} conflictos ({resumen['filas_por_segundo']:,.0f} filas/s)"
+    )
+    print(f"Reporte de errores: {resumen['reporte']}")
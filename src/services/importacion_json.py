@@ -0,0 +1,229 @@
+"""
+Importación incremental y reanudable de clientes desde JSON o NDJSON.
+
+El archivo (un arreglo de clientes, o un cliente por línea en NDJSON) se
+lee elemento por elemento con iterar_arreglo_json / iterar_lineas_json,
+descomprimiendo en streaming si viene en gzip o zstd. Cada fila se valida con iterar_validacion y las
+válidas se insertan en lotes con crear_lote. Tras cada lote se guarda un
+checkpoint (offset en bytes y contadores) junto al archivo: si la
+importación se interrumpe, la siguiente ejecución continúa desde el
+último lote confirmado. Un lote que se reintenta no duplica clientes:
+crear_lote reporta como conflicto los emails que ya están en la BD.
+
+Uso desde consola:
+    python -m src.services.importacion_json data/socios.json
+    python -m src.services.importacion_json data/socios.ndjson.gz
+"""
+import json
+import os
+import sys
+import time
+from typing import Callable, Optional
+from src.models import TIPOS_CLIENTE
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.services.auditoria_service import obtener_auditoria
+from src.utils.compresion import abrir_lectura, detectar_compresion
+from src.utils.helpers import escritura_atomica
+from src.utils.json_incremental import iterar_arreglo_json, iterar_lineas_json
+from src.utils.logger import logger
+from src.utils.validacion_lote import iterar_validacion
+
+FORMATOS = ("json", "ndjson")
+_EXTENSIONES_NDJSON = (".ndjson", ".jsonl")
+
+
+def formato_por_ruta(ruta: str) -> str:
+    """"ndjson" para .ndjson/.jsonl (con o sin .gz/.zst); "json" en otro caso."""
+    base = ruta.lower()
+    for sufijo in (".gz", ".zst"):
+        base = base.removesuffix(sufijo)
+    return "ndjson" if base.endswith(_EXTENSIONES_NDJSON) else "json"
+
+
+class ImportadorJSON:
+    """
+    Importa un archivo JSON a la BD en memoria acotada.
+
+    Atributos:
+        ruta (str): Archivo JSON o NDJSON a importar (puede estar comprimido).
+        formato (str): "json" o "ndjson" (por defecto según la extensión).
+        tam_lote (int): Filas por lote (y por checkpoint).
+        ruta_checkpoint (str): Estado para reanudar (por defecto <ruta>.checkpoint).
+        progreso (callable): Recibe un dict de avance tras cada lote.
+    """
+
+    MAX_MUESTRA_ERRORES = 100
+    INTERVALO_LOG = 5.0  # Segundos entre logs de avance (progreso por defecto)
+
+    def __init__(
+        self,
+        ruta: str,
+        repo: SQLiteRepository = None,
+        tam_lote: int = None,
+        ruta_checkpoint: str = None,
+        region: str = "CL",
+        progreso: Callable[[dict], None] = None,
+        formato: str = None,
+    ):
+        self.ruta = ruta
+        self.formato = formato or formato_por_ruta(ruta)
+        if self.formato not in FORMATOS:
+            raise ValueError(f"Formato desconocido: '{self.formato}' (opciones: {FORMATOS})")
+        self.repo = repo or SQLiteRepository(auditoria=obtener_auditoria())
+        self.tam_lote = tam_lote or SQLiteRepository.TAM_LOTE
+        self.ruta_checkpoint = ruta_checkpoint or f"{ruta}.checkpoint"
+        self.region = region
+        self.progreso = progreso or self._registrar_progreso
+        self._ultimo_log = 0.0
+
+    # ==================== CHECKPOINT ====================
+
+    def _firma(self) -> dict:
+        """Identifica el archivo: un checkpoint solo vale para la misma versión."""
+        stat = os.stat(self.ruta)
+        return {
+            "archivo": os.path.abspath(self.ruta),
+            "tamano": stat.st_size,
+            "modificado": stat.st_mtime_ns,
+        }
+
+    def _cargar_checkpoint(self, firma: dict) -> Optional[dict]:
+        if not os.path.exists(self.ruta_checkpoint):
+            return None
+        try:
+            with open(self.ruta_checkpoint, encoding="utf-8") as f:
+                estado = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint ilegible ({e}): se importa desde el inicio")
+            return None
+        if estado.get("firma") != firma:
+            logger.warning("El archivo cambió desde el checkpoint: se importa desde el inicio")
+            return None
+        return estado
+
+    def _guardar_checkpoint(self, estado: dict):
+        with escritura_atomica(self.ruta_checkpoint) as f:
+            json.dump(estado, f)
+
+    # ==================== IMPORTACIÓN ====================
+
+    def ejecutar(self) -> dict:
+        """
+        Importa (o reanuda) el archivo completo.
+
+        Retorna {"procesados", "insertados", "errores", "conflictos",
+        "reanudado", "segundos", "filas_por_segundo", "muestra_errores"}.
+        Los contadores incluyen lo importado antes de reanudar; errores
+        cuenta filas inválidas y muestra_errores guarda los primeros
+        MAX_MUESTRA_ERRORES errores de esta ejecución.
+        """
+        firma = self._firma()
+        estado = self._cargar_checkpoint(firma)
+        reanudado = estado is not None
+        if estado is None:
+            estado = {
+                "firma": firma, "offset": 0, "procesados": 0,
+                "insertados": 0, "errores": 0, "conflictos": 0,
+            }
+        else:
+            logger.info(
+                f"Reanudando importación de {self.ruta} desde el byte "
+                f"{estado['offset']} ({estado['procesados']} filas ya procesadas)"
+            )
+
+        self._inicio = time.perf_counter()
+        self._procesados_inicio = estado["procesados"]
+        # En archivos comprimidos el offset es del contenido descomprimido
+        self._comprimido = detectar_compresion(self.ruta) is not None
+        muestra = []
+        offset = estado["offset"]
+        iterar = iterar_lineas_json if self.formato == "ndjson" else iterar_arreglo_json
+
+        with abrir_lectura(self.ruta) as f:
+            def elementos():
+                nonlocal offset
+                for elemento, fin in iterar(f, desde=estado["offset"]):
+                    offset = fin
+                    yield elemento
+
+            filas = iterar_validacion(
+                elementos(), self.region,
+                inicio=estado["procesados"], detectar_repetidos=False,
+            )
+            lote, pendientes = [], 0
+            for _, datos, errores in filas:
+                pendientes += 1
+                if errores:
+                    estado["errores"] += 1
+                    if len(muestra) < self.MAX_MUESTRA_ERRORES:
+                        muestra.extend(errores[:self.MAX_MUESTRA_ERRORES - len(muestra)])
+                else:
+                    lote.append(TIPOS_CLIENTE[datos["tipo_cliente"]].from_storage(datos))
+                if pendientes >= self.tam_lote:
+                    self._confirmar_lote(lote, pendientes, offset, estado)
+                    lote, pendientes = [], 0
+            if pendientes:
+                self._confirmar_lote(lote, pendientes, offset, estado)
+
+        if os.path.exists(self.ruta_checkpoint):
+            os.remove(self.ruta_checkpoint)
+
+        resumen = self._avance(estado)
+        resumen.update({"reanudado": reanudado, "muestra_errores": muestra})
+        logger.info(
+            f"Importación de {self.ruta} terminada: {resumen['insertados']} insertados, "
+            f"{resumen['errores']} filas con errores, {resumen['conflictos']} conflictos "
+            f"({resumen['filas_por_segundo']:,.0f} filas/s)"
+        )
+        return resumen
+
+    def _confirmar_lote(self, lote: list, pendientes: int, offset: int, estado: dict):
+        """Inserta el lote y luego guarda el checkpoint que lo incluye."""
+        if lote:
+            resultado = self.repo.crear_lote(lote, tam_lote=self.tam_lote)
+            estado["insertados"] += resultado["insertados"]
+            estado["conflictos"] += len(resultado["conflictos"])
+        estado["procesados"] += pendientes
+        estado["offset"] = offset
+        self._guardar_checkpoint(estado)
+        self.progreso(self._avance(estado))
+
+    def _avance(self, estado: dict) -> dict:
+        segundos = time.perf_counter() - self._inicio
+        procesados = estado["procesados"] - self._procesados_inicio
+        return {
+            "procesados": estado["procesados"],
+            "insertados": estado["insertados"],
+            "errores": estado["errores"],
+            "conflictos": estado["conflictos"],
+            "bytes_leidos": estado["offset"],
+            "bytes_totales": None if self._comprimido else estado["firma"]["tamano"],
+            "segundos": round(segundos, 3),
+            "filas_por_segundo": procesados / segundos if segundos > 0 else 0.0,
+        }
+
+    def _registrar_progreso(self, avance: dict):
+        ahora = time.perf_counter()
+        if ahora - self._ultimo_log < self.INTERVALO_LOG:
+            return
+        self._ultimo_log = ahora
+        porcentaje = ""
+        if avance["bytes_totales"] is not None:
+            porcentaje = f"{100 * avance['bytes_leidos'] / max(avance['bytes_totales'], 1):.1f}% - "
+        logger.info(
+            f"Importando {self.ruta}: {porcentaje}{avance['procesados']} filas, "
+            f"{avance['errores']} con errores, {avance['filas_por_segundo']:,.0f} filas/s"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python -m src.services.importacion_json <archivo.json|.ndjson[.gz]>")
+        sys.exit(2)
+    resumen = ImportadorJSON(sys.argv[1]).ejecutar()
+    print(
+        f"✅ {resumen['insertados']} insertados, {resumen['errores']} con errores, "
+        f"{resumen['conflictos']} conflictos ({resumen['filas_por_segundo']:,.0f} filas/s)"
+    )
+    for error in resumen["muestra_errores"]:
+        print(f"⚠️  fila {error['indice']} [{error['campo']}]: {error['mensaje']}")
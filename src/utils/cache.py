@@ -0,0 +1,147 @@
+"""
+Caché LRU acotada (con expiración opcional) y decorador de memoización
+para funciones puras.
+
+Uso:
+    @memoizar(tamano=1024, errores=(GICValidationError,))
+    def validar(valor): ...
+
+    validar.cache.estadisticas()  # hits, misses, evictions
+    validar.cache.limpiar()
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+_FALTA = object()
+
+
+class CacheLRU:
+    """
+    Diccionario acotado que descarta la entrada usada hace más tiempo.
+    Seguro entre hilos (la app Flask atiende requests concurrentes).
+
+    Atributos:
+        tamano (int): Máximo de entradas. 0 desactiva la caché.
+        ttl (float): Segundos de vida de cada entrada (None = sin expiración).
+    """
+
+    def __init__(self, tamano: int, ttl: float = None):
+        if tamano < 0:
+            raise ValueError("El tamaño de la caché no puede ser negativo")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("El ttl de la caché debe ser positivo")
+        self.tamano = tamano
+        self.ttl = ttl
+        self._datos = OrderedDict()  # clave -> (valor, expira)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expiradas = 0
+
+    def obtener(self, clave, default=None):
+        """Retorna el valor guardado (y lo marca como reciente) o default."""
+        with self._lock:
+            entrada = self._datos.get(clave, _FALTA)
+            if entrada is _FALTA:
+                self._misses += 1
+                return default
+            valor, expira = entrada
+            if expira is not None and time.monotonic() >= expira:
+                del self._datos[clave]
+                self._expiradas += 1
+                self._misses += 1
+                return default
+            self._datos.move_to_end(clave)
+            self._hits += 1
+            return valor
+
+    def guardar(self, clave, valor):
+        """Guarda un valor, descartando el menos reciente si está llena."""
+        if self.tamano == 0:
+            return
+        expira = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._datos[clave] = (valor, expira)
+            self._datos.move_to_end(clave)
+            if len(self._datos) > self.tamano:
+                self._datos.popitem(last=False)
+                self._evictions += 1
+
+    def descartar(self, clave):
+        """Elimina una entrada si existe."""
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores."""
+        with self._lock:
+            self._datos.clear()
+            self._hits = self._misses = self._evictions = self._expiradas = 0
+
+    def vaciar(self):
+        """Vacía la caché conservando los contadores (invalidación)."""
+        with self._lock:
+            self._datos.clear()
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            return {
+                "tamano": self.tamano,
+                "entradas": len(self._datos),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expiradas": self._expiradas,
+            }
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+
+class _Error:
+    """Envoltorio de una excepción memorizada (se relanza una copia)."""
+
+    __slots__ = ("excepcion",)
+
+    def __init__(self, excepcion: Exception):
+        self.excepcion = excepcion
+
+
+def memoizar(tamano: int, errores: tuple = ()):
+    """
+    Decorador que memoriza resultados en una CacheLRU (accesible como
+    funcion.cache). Las excepciones de los tipos en `errores` también se
+    memorizan: la siguiente llamada con los mismos argumentos relanza una
+    copia sin volver a ejecutar la función.
+    Argumentos no hasheables omiten la caché.
+    """
+    def decorador(funcion):
+        cache = CacheLRU(tamano)
+
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            clave = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                resultado = cache.obtener(clave, _FALTA)
+            except TypeError:  # Argumentos no hasheables
+                return funcion(*args, **kwargs)
+
+            if resultado is _FALTA:
+                try:
+                    resultado = funcion(*args, **kwargs)
+                except errores as e:
+                    resultado = _Error(e)
+                cache.guardar(clave, resultado)
+
+            if isinstance(resultado, _Error):
+                raise copy.copy(resultado.excepcion)
+            return resultado
+
+        envoltura.cache = cache
+        return envoltura
+
+    return decorador
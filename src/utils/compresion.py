@@ -0,0 +1,91 @@
+"""
+Compresión de archivos de exportación/importación.
+
+gzip viene con Python; zstd se usa solo si está instalado el paquete
+`zstandard` (más rápido a igual tasa de compresión). Al leer, el códec se
+detecta por los bytes mágicos del archivo, no por la extensión.
+
+Uso:
+    ruta = "data/clientes.ndjson" + extension("gzip")   # .ndjson.gz
+    with abrir_lectura(ruta) as f:                      # binario, descomprimido
+        ...
+"""
+import gzip
+import io
+from typing import BinaryIO, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # Opcional: pip install zstandard
+    zstandard = None
+
+NIVEL_GZIP = 6
+NIVEL_ZSTD = 3
+
+_EXTENSIONES = {"gzip": ".gz", "zstd": ".zst"}
+_MAGICOS = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+
+def compresiones_disponibles() -> List[str]:
+    """Códecs utilizables en este entorno."""
+    return ["gzip"] + (["zstd"] if zstandard is not None else [])
+
+
+def validar_compresion(compresion: Optional[str]) -> Optional[str]:
+    """
+    Normaliza el nombre del códec (None, "" o "none" = sin compresión).
+    Lanza ValueError si no existe o no está disponible.
+    """
+    if not compresion or compresion.lower() == "none":
+        return None
+    compresion = compresion.lower()
+    if compresion not in _EXTENSIONES:
+        raise ValueError(
+            f"Compresión desconocida: '{compresion}' (opciones: {', '.join(_EXTENSIONES)})"
+        )
+    if compresion not in compresiones_disponibles():
+        raise ValueError(f"Compresión '{compresion}' no disponible: instale el paquete zstandard")
+    return compresion
+
+
+def extension(compresion: Optional[str]) -> str:
+    """Sufijo de archivo del códec ("" sin compresión)."""
+    return _EXTENSIONES.get(validar_compresion(compresion), "")
+
+
+def comprimir(binario: BinaryIO, compresion: Optional[str]) -> BinaryIO:
+    """
+    Envuelve un archivo binario de escritura. Cerrar el envoltorio termina
+    el stream comprimido pero no cierra `binario`.
+    """
+    compresion = validar_compresion(compresion)
+    if compresion == "gzip":
+        # mtime=0: el mismo contenido produce el mismo archivo
+        return gzip.GzipFile(fileobj=binario, mode="wb", compresslevel=NIVEL_GZIP, mtime=0)
+    if compresion == "zstd":
+        compresor = zstandard.ZstdCompressor(level=NIVEL_ZSTD)
+        return compresor.stream_writer(binario, closefd=False)
+    return binario
+
+
+def detectar_compresion(ruta: str) -> Optional[str]:
+    """Códec del archivo según sus primeros bytes (None si es texto plano)."""
+    with open(ruta, "rb") as f:
+        inicio = f.read(4)
+    for magico, compresion in _MAGICOS.items():
+        if inicio.startswith(magico):
+            return compresion
+    return None
+
+
+def abrir_lectura(ruta: str) -> BinaryIO:
+    """Abre `ruta` en binario, descomprimiendo en streaming si corresponde."""
+    compresion = detectar_compresion(ruta)
+    if compresion == "gzip":
+        return gzip.open(ruta, "rb")
+    if compresion == "zstd":
+        if zstandard is None:
+            raise ValueError(f"{ruta} está comprimido con zstd: instale el paquete zstandard")
+        lector = zstandard.ZstdDecompressor().stream_reader(open(ruta, "rb"))
+        return io.BufferedReader(lector)
+    return open(ruta, "rb")
@@ -1,13 +1,73 @@
 """
 Funciones auxiliares de uso general para el proyecto GIC.
 """
+import base64
+import binascii
+import io
+import json
+import os
+import tempfile
+import threading
+import time
 import uuid
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime, time as hora
+from typing import Tuple
+from config import Config
+from src.utils.compresion import comprimir
+
+ESQUEMAS_ID = ("uuid7", "uuid4")
+
+_uuid7_lock = threading.Lock()
+_uuid7_ultimo_ms = 0
+_uuid7_contador = 0
 
 
 def generar_id() -> str:
-    """Genera un ID único basado en UUID4."""
-    return str(uuid.uuid4())
+    """
+    Genera un ID único según Config.ID_SCHEME:
+    "uuid7" (ordenado por tiempo, inserciones contiguas en el índice) o
+    "uuid4" (aleatorio). Ambos son UUID en texto de 36 caracteres.
+    """
+    if Config.ID_SCHEME == "uuid7":
+        return generar_uuid7()
+    if Config.ID_SCHEME == "uuid4":
+        return str(uuid.uuid4())
+    raise ValueError(
+        f"Esquema de ID inválido: '{Config.ID_SCHEME}'. Opciones: {ESQUEMAS_ID}"
+    )
+
+
+def generar_uuid7() -> str:
+    """
+    UUID versión 7 (RFC 9562): 48 bits de milisegundos Unix, 12 bits de
+    contador y 62 bits aleatorios. El contador hace que los IDs generados
+    en un mismo proceso sean estrictamente crecientes aun dentro del mismo
+    milisegundo.
+    """
+    global _uuid7_ultimo_ms, _uuid7_contador
+    aleatorio = int.from_bytes(os.urandom(8), "big")
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _uuid7_ultimo_ms:
+            _uuid7_ultimo_ms = ms
+            _uuid7_contador = aleatorio >> 53  # Semilla de 11 bits: deja margen
+        else:
+            _uuid7_contador += 1
+            if _uuid7_contador > 0xFFF:
+                # Contador agotado: se avanza el reloj lógico un milisegundo
+                _uuid7_ultimo_ms += 1
+                _uuid7_contador = 0
+        ms, contador = _uuid7_ultimo_ms, _uuid7_contador
+
+    valor = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | contador << 64
+        | 0b10 << 62
+        | aleatorio & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return str(uuid.UUID(int=valor))
 
 
 def timestamp_actual() -> str:
@@ -15,6 +75,101 @@ def timestamp_actual() -> str:
     return datetime.now().isoformat()
 
 
+def marca_tiempo() -> Tuple[str, int]:
+    """Instante actual como (ISO, epoch en segundos), calculado una sola vez."""
+    ahora = datetime.now()
+    return ahora.isoformat(), int(ahora.timestamp())
+
+
+def epoch_desde_iso(fecha: str) -> int:
+    """Convierte un timestamp ISO (hora local, como timestamp_actual) a epoch."""
+    return int(datetime.fromisoformat(fecha).timestamp())
+
+
+def a_epoch(valor, fin_de_dia: bool = False) -> int:
+    """
+    Normaliza un filtro de fecha a epoch en segundos.
+    Acepta epoch (int), datetime, date o texto ISO ("2024-05-01" o
+    "2024-05-01T10:00:00"). Con fin_de_dia=True una fecha sin hora se
+    toma hasta las 23:59:59. Lanza ValueError si no es válido.
+    """
+    if isinstance(valor, bool):
+        raise ValueError(f"Fecha inválida: '{valor}'")
+    if isinstance(valor, int):
+        return valor
+    if isinstance(valor, str):
+        texto = valor.strip()
+        if texto.lstrip("-").isdigit():
+            return int(texto)
+        try:
+            valor = datetime.fromisoformat(texto)
+        except ValueError:
+            raise ValueError(f"Fecha inválida: '{valor}'")
+        if fin_de_dia and "T" not in texto and " " not in texto:
+            valor = valor.date()
+    if isinstance(valor, datetime):
+        return int(valor.timestamp())
+    if isinstance(valor, date):
+        return int(datetime.combine(valor, hora.max if fin_de_dia else hora.min).timestamp())
+    raise ValueError(f"Fecha inválida: '{valor}'")
+
+
 def formatear_fecha(fecha: datetime) -> str:
     """Formatea una fecha a formato legible DD/MM/YYYY HH:MM."""
     return fecha.strftime("%d/%m/%Y %H:%M")
+
+
+def codificar_cursor(*valores) -> str:
+    """Codifica valores de paginación keyset en un cursor opaco (base64 URL)."""
+    crudo = json.dumps(valores, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(crudo).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> tuple:
+    """
+    Decodifica un cursor de paginación: (fecha_registro, id), ambos texto.
+    Lanza ValueError si es inválido.
+    """
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError(f"Cursor de paginación inválido: '{cursor}'")
+    if (
+        not isinstance(valores, list)
+        or len(valores) != 2
+        or not all(isinstance(v, str) for v in valores)
+    ):
+        raise ValueError(f"Cursor de paginación inválido: '{cursor}'")
+    return tuple(valores)
+
+
+@contextmanager
+def escritura_atomica(ruta: str, newline: str = None, compresion: str = None):
+    """
+    Abre un temporal de texto UTF-8 junto a `ruta` y, si el bloque termina
+    sin errores, lo renombra sobre `ruta` (os.replace, atómico). Ante un
+    error se borra el temporal y el archivo anterior queda intacto.
+    Con compresion ("gzip" o "zstd") el texto se comprime al escribirse.
+
+    Uso:
+        with escritura_atomica("data/clientes.json") as f:
+            f.write(...)
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    fd, temporal = tempfile.mkstemp(
+        dir=directorio, prefix=f".{os.path.basename(ruta)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as binario, io.TextIOWrapper(
+            comprimir(binario, compresion), encoding="utf-8", newline=newline
+        ) as f:
+            yield f
+        # mkstemp crea el archivo con permisos 0600: se conservan los del destino
+        modo = os.stat(ruta).st_mode if os.path.exists(ruta) else 0o644
+        os.chmod(temporal, modo & 0o777)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
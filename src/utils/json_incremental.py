@@ -0,0 +1,177 @@
+"""
+Lectura incremental de un arreglo JSON de nivel superior o de NDJSON.
+
+Parsea `[elem, elem, ...]` elemento por elemento con JSONDecoder.raw_decode
+sobre un buffer acotado, sin cargar el archivo completo. Cada elemento se
+entrega junto al offset en bytes donde termina: guardando ese offset se
+puede reanudar la lectura más tarde (desde=offset). iterar_lineas_json
+hace lo mismo para NDJSON (un valor JSON por línea).
+
+Uso:
+    with open("clientes.json", "rb") as f:
+        for elemento, offset in iterar_arreglo_json(f):
+            ...
+"""
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, Tuple
+
+TAM_BLOQUE = 64 * 1024
+MAX_ELEMENTO = 16 * 1024 * 1024  # Un elemento no puede superar 16 MB
+
+_ESPACIOS = " \t\r\n"
+
+
+def _posicionar(archivo: BinaryIO, desde: int):
+    """
+    Deja el archivo en el byte `desde`. Los flujos que no admiten seek
+    (p. ej. el lector zstd) avanzan leyendo y descartando.
+    """
+    if desde <= 0:
+        return
+    if archivo.seekable():
+        archivo.seek(desde)
+        return
+    restante = desde
+    while restante > 0:
+        bloque = archivo.read(min(restante, TAM_BLOQUE))
+        if not bloque:
+            raise ValueError(f"El archivo termina antes del byte {desde}")
+        restante -= len(bloque)
+
+
+class _Lector:
+    """Buffer de texto sobre el archivo binario con offsets en bytes."""
+
+    def __init__(self, archivo: BinaryIO, desde: int, tam_bloque: int, max_elemento: int):
+        self.archivo = archivo
+        self.tam_bloque = tam_bloque
+        self.max_elemento = max_elemento
+        self.decodificador = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.offset = desde  # Bytes del archivo hasta buffer[pos]
+        self.fin_archivo = False
+        _posicionar(archivo, desde)
+
+    def leer_mas(self) -> bool:
+        """Agrega un bloque al buffer (descartando lo consumido)."""
+        if self.fin_archivo:
+            return False
+        if len(self.buffer) - self.pos > self.max_elemento:
+            raise ValueError(
+                f"Elemento JSON mayor a {self.max_elemento} bytes (offset {self.offset})"
+            )
+        # Se lee al menos lo pendiente: un elemento grande no se re-parsea
+        # una vez por bloque (crecimiento geométrico del buffer)
+        bloque = self.archivo.read(max(self.tam_bloque, len(self.buffer) - self.pos))
+        self.fin_archivo = not bloque
+        self.buffer = self.buffer[self.pos:] + self.decodificador.decode(
+            bloque, final=self.fin_archivo
+        )
+        self.pos = 0
+        return True
+
+    def avanzar(self, nueva_pos: int):
+        # Solo se codifica el tramo consumido para llevar el offset en bytes
+        self.offset += len(self.buffer[self.pos:nueva_pos].encode("utf-8"))
+        self.pos = nueva_pos
+
+    def siguiente_caracter(self) -> str:
+        """Salta espacios y retorna el siguiente carácter ("" al final)."""
+        while True:
+            pos = self.pos
+            while pos < len(self.buffer) and self.buffer[pos] in _ESPACIOS:
+                pos += 1
+            self.avanzar(pos)
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.leer_mas():
+                return ""
+
+    def error(self, mensaje: str) -> ValueError:
+        return ValueError(f"JSON inválido en el byte {self.offset}: {mensaje}")
+
+
+def iterar_arreglo_json(
+    archivo: BinaryIO,
+    desde: int = 0,
+    tam_bloque: int = TAM_BLOQUE,
+    max_elemento: int = MAX_ELEMENTO,
+) -> Iterator[Tuple[Any, int]]:
+    """
+    Entrega (elemento, offset_fin) por cada elemento del arreglo.
+
+    `archivo` debe abrirse en modo binario. Con desde=0 se espera el "["
+    inicial; con un offset entregado antes se continúa tras ese elemento.
+    Lanza ValueError si el JSON está mal formado o un elemento excede
+    max_elemento.
+    """
+    lector = _Lector(archivo, desde, tam_bloque, max_elemento)
+    decodificador = json.JSONDecoder()
+
+    if desde == 0:
+        if lector.siguiente_caracter() == "\ufeff":  # BOM UTF-8
+            lector.avanzar(lector.pos + 1)
+        if lector.siguiente_caracter() != "[":
+            raise lector.error("se esperaba '[' al inicio")
+        lector.avanzar(lector.pos + 1)
+        if lector.siguiente_caracter() == "]":
+            return
+        esperar_elemento = True
+    else:
+        esperar_elemento = False
+
+    while True:
+        if not esperar_elemento:
+            caracter = lector.siguiente_caracter()
+            if caracter == "]":
+                return
+            if caracter != ",":
+                raise lector.error("se esperaba ',' o ']'" if caracter else "arreglo sin cerrar")
+            lector.avanzar(lector.pos + 1)
+
+        if not lector.siguiente_caracter():
+            raise lector.error("arreglo sin cerrar")
+        while True:
+            try:
+                elemento, fin = decodificador.raw_decode(lector.buffer, lector.pos)
+            except json.JSONDecodeError as e:
+                if lector.leer_mas():
+                    continue
+                raise lector.error(e.msg)
+            # Un número al borde del buffer podría continuar en el siguiente bloque
+            if fin == len(lector.buffer) and lector.leer_mas():
+                continue
+            break
+        lector.avanzar(fin)
+        yield elemento, lector.offset
+        esperar_elemento = False
+
+
+def iterar_lineas_json(
+    archivo: BinaryIO,
+    desde: int = 0,
+    max_elemento: int = MAX_ELEMENTO,
+) -> Iterator[Tuple[Any, int]]:
+    """
+    Entrega (elemento, offset_fin) por cada línea de un archivo NDJSON
+    abierto en binario. Las líneas en blanco se ignoran. Lanza ValueError
+    si una línea no es JSON válido o excede max_elemento (json.loads sobre
+    bytes ya tolera el BOM UTF-8 de la primera línea).
+    """
+    _posicionar(archivo, desde)
+    offset = desde
+    while True:
+        linea = archivo.readline(max_elemento + 1)
+        if not linea:
+            return
+        if len(linea) > max_elemento:
+            raise ValueError(f"Línea JSON mayor a {max_elemento} bytes (offset {offset})")
+        inicio, offset = offset, offset + len(linea)
+        if not linea.strip():
+            continue
+        try:
+            yield json.loads(linea), offset
+        except ValueError as e:
+            raise ValueError(f"JSON inválido en el byte {inicio}: {e}") from None
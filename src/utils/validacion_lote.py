@@ -0,0 +1,199 @@
+"""
+Validación por lotes de clientes crudos (importaciones masivas).
+
+A diferencia de los setters de Cliente, que lanzan al primer campo
+inválido, aquí cada fila se valida completa y se reportan TODOS sus
+errores. Las filas válidas salen normalizadas, listas para
+TIPOS_CLIENTE[tipo].from_storage(datos) sin volver a validar.
+
+Uso:
+    resultado = validar_lote(filas)
+    resultado["validos"]   # [(indice, datos_normalizados), ...]
+    resultado["errores"]   # [{"indice", "campo", "mensaje"}, ...]
+
+    for indice, datos, errores in iterar_validacion(lector):  # streaming
+        ...
+"""
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+import phonenumbers
+from src.exceptions.validation_errors import GICValidationError
+from src.models import TIPOS_CLIENTE, ClientePremium
+from src.utils.helpers import generar_id
+from src.utils.validators import (
+    normalizar_email,
+    validar_email,
+    validar_telefono,
+    validar_direccion,
+    validar_nombre,
+    validar_rut,
+)
+
+CAMPOS_BASE = ("nombre", "email", "telefono", "direccion")
+
+_VALIDADORES_BASE = {
+    "nombre": validar_nombre,
+    "email": validar_email,
+    "direccion": validar_direccion,
+}
+
+
+def _error(indice: int, campo: str, mensaje: str) -> dict:
+    return {"indice": indice, "campo": campo, "mensaje": mensaje}
+
+
+def _numero(fila: dict, campo: str, tipo, minimo=None):
+    """Convierte un campo opcional (str de CSV o número); None si está vacío."""
+    valor = fila.get(campo)
+    if valor is None or valor == "":
+        return None
+    try:
+        numero = tipo(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"{campo} debe ser numérico: '{valor}'")
+    if minimo is not None and numero < minimo:
+        raise ValueError(f"{campo} debe ser mayor o igual a {minimo}")
+    return numero
+
+
+def _fecha(valor) -> Optional[str]:
+    """Normaliza una fecha ISO opcional a datetime.isoformat(); None si está vacía."""
+    if valor is None or valor == "":
+        return None
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    try:
+        return datetime.fromisoformat(str(valor).strip()).isoformat()
+    except ValueError:
+        raise ValueError(f"Fecha inválida (se espera ISO 8601): '{valor}'")
+
+
+def _booleano(valor) -> bool:
+    if isinstance(valor, str):
+        return valor.strip().lower() in ("true", "1", "si", "sí")
+    return True if valor is None else bool(valor)
+
+
+class _ValidadorLote:
+    """Estado compartido por todas las filas de un lote."""
+
+    def __init__(self, region: str, detectar_repetidos: bool = True):
+        # Solo se verifica que la región exista: una región inválida falla
+        # una vez para el lote y no como error en cada fila. Cada teléfono
+        # se parsea en validar_telefono (memorizada por (telefono, region))
+        if phonenumbers.PhoneMetadata.metadata_for_region(region) is None:
+            raise ValueError(f"Región telefónica desconocida: '{region}'")
+        self.region = region
+        self.emails = {} if detectar_repetidos else None
+
+    def validar(self, indice: int, fila: dict) -> Tuple[dict, List[dict]]:
+        if not isinstance(fila, dict):
+            return {}, [_error(indice, "", "La fila no es un objeto")]
+        errores = []
+        datos = {}
+
+        def campo(nombre: str, funcion, *args):
+            try:
+                datos[nombre] = funcion(*args)
+            except GICValidationError as e:
+                errores.append(_error(indice, nombre, e.mensaje))
+            except (TypeError, ValueError, AttributeError) as e:
+                errores.append(_error(indice, nombre, str(e)))
+
+        tipo = fila.get("tipo_cliente") or fila.get("tipo") or "Regular"
+        if tipo not in TIPOS_CLIENTE:
+            errores.append(_error(
+                indice, "tipo_cliente",
+                f"Tipo de cliente inválido: '{tipo}'. "
+                f"Opciones: {list(TIPOS_CLIENTE.keys())}",
+            ))
+
+        for nombre in CAMPOS_BASE:
+            if not fila.get(nombre):
+                errores.append(_error(indice, nombre, f"Falta el campo {nombre}"))
+            elif nombre == "telefono":
+                campo(nombre, validar_telefono, fila[nombre], self.region)
+            else:
+                campo(nombre, _VALIDADORES_BASE[nombre], fila[nombre])
+
+        email = datos.get("email")
+        if email is not None and self.emails is not None:
+            previo = self.emails.setdefault(normalizar_email(email), indice)
+            if previo != indice:
+                errores.append(_error(
+                    indice, "email", f"Email repetido en el lote (fila {previo})"
+                ))
+
+        if tipo == "Regular":
+            campo("limite_credito", _numero, fila, "limite_credito", float, 0)
+            campo("puntos_fidelidad", _numero, fila, "puntos_fidelidad", int, 0)
+        elif tipo == "Premium":
+            nivel = fila.get("nivel_premium") or "Gold"
+            if nivel not in ClientePremium.NIVELES_VALIDOS:
+                errores.append(_error(
+                    indice, "nivel_premium",
+                    f"Nivel premium inválido: '{nivel}'. "
+                    f"Opciones: {ClientePremium.NIVELES_VALIDOS}",
+                ))
+            datos["nivel_premium"] = nivel
+            datos["asesor_dedicado"] = str(
+                fila.get("asesor_dedicado") or "Sin asignar"
+            ).strip()
+            campo("descuento", _numero, fila, "descuento", float, 0)
+        elif tipo == "Corporativo":
+            if not fila.get("rut_empresa"):
+                errores.append(_error(indice, "rut_empresa", "Falta el campo rut_empresa"))
+            else:
+                campo("rut_empresa", validar_rut, fila["rut_empresa"])
+            razon_social = str(fila.get("razon_social") or "").strip()
+            if not razon_social:
+                errores.append(_error(indice, "razon_social", "Falta el campo razon_social"))
+            datos["razon_social"] = razon_social
+            datos["rubro"] = str(fila.get("rubro") or "No especificado").strip()
+            datos["contacto_comercial"] = str(fila.get("contacto_comercial") or "").strip()
+            campo("cantidad_empleados", _numero, fila, "cantidad_empleados", int, 1)
+            campo("descuento_volumen", _numero, fila, "descuento_volumen", float, 0)
+
+        campo("fecha_registro", _fecha, fila.get("fecha_registro"))
+        datos.update({
+            "id": fila.get("id") or generar_id(),
+            "tipo_cliente": tipo,
+            "activo": _booleano(fila.get("activo")),
+        })
+        return datos, errores
+
+
+def iterar_validacion(
+    filas: Iterable[dict],
+    region: str = "CL",
+    inicio: int = 0,
+    detectar_repetidos: bool = True,
+) -> Iterator[Tuple[int, dict, List[dict]]]:
+    """
+    Valida filas de forma perezosa (memoria constante salvo el registro de
+    emails vistos). Entrega (indice, datos_normalizados, errores) por fila;
+    una fila es válida si su lista de errores está vacía.
+
+    Los índices parten en `inicio`. Con detectar_repetidos=False no se
+    lleva el registro de emails (memoria constante en archivos enormes;
+    los duplicados los reporta la BD al insertar).
+    """
+    validador = _ValidadorLote(region, detectar_repetidos)
+    for indice, fila in enumerate(filas, inicio):
+        datos, errores = validador.validar(indice, fila)
+        yield indice, datos, errores
+
+
+def validar_lote(filas: Iterable[dict], region: str = "CL") -> dict:
+    """
+    Valida un lote completo.
+    Retorna {"total", "validos": [(indice, datos)], "errores": [...]}.
+    """
+    resultado = {"total": 0, "validos": [], "errores": []}
+    for indice, datos, errores in iterar_validacion(filas, region):
+        resultado["total"] += 1
+        if errores:
+            resultado["errores"].extend(errores)
+        else:
+            resultado["validos"].append((indice, datos))
+    return resultado
@@ -1,19 +1,32 @@
 """
 Módulo de validaciones avanzadas para el proyecto GIC.
 Valida email, teléfono y dirección usando librerías especializadas.
+
+validar_email, validar_telefono y validar_rut son puras y costosas: se
+memorizan (resultados y errores) en una caché LRU de
+Config.VALIDATOR_CACHE_SIZE entradas por función.
 """
 import re
+from typing import Optional
 from email_validator import validate_email, EmailNotValidError
 import phonenumbers
+from config import Config
 from src.exceptions.validation_errors import (
+    GICValidationError,
     EmailInvalidoError,
     TelefonoInvalidoError,
     DireccionInvalidaError,
     NombreInvalidoError,
     RutInvalidoError,
 )
+from src.utils.cache import memoizar
+
+_PATRON_NOMBRE = re.compile(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$")
+
+_memoizar = memoizar(Config.VALIDATOR_CACHE_SIZE, errores=(GICValidationError,))
 
 
+@_memoizar
 def validar_email(email: str) -> str:
     """
     Valida formato de email usando email-validator.
@@ -27,6 +40,7 @@ def validar_email(email: str) -> str:
         raise EmailInvalidoError(f"Email inválido '{email}': {str(e)}")
 
 
+@_memoizar
 def validar_telefono(telefono: str, region: str = "CL") -> str:
     """
     Valida número de teléfono usando phonenumbers.
@@ -71,14 +85,14 @@ def validar_nombre(nombre: str) -> str:
         raise NombreInvalidoError("El nombre no puede estar vacío")
     if len(nombre) < 2:
         raise NombreInvalidoError("El nombre debe tener al menos 2 caracteres")
-    patron = r"^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$"
-    if not re.match(patron, nombre):
+    if not _PATRON_NOMBRE.match(nombre):
         raise NombreInvalidoError(
             "El nombre solo puede contener letras, espacios y tildes"
         )
     return nombre.title()
 
 
+@_memoizar
 def validar_rut(rut: str) -> str:
     """
     Valida RUT chileno (formato XX.XXX.XXX-X o XXXXXXXX-X).
@@ -116,3 +130,55 @@ def validar_rut(rut: str) -> str:
     # Formatear
     cuerpo_formateado = f"{int(cuerpo):,}".replace(",", ".")
     return f"{cuerpo_formateado}-{dv_calculado}"
+
+
+# ==================== CLAVES DE BÚSQUEDA NORMALIZADAS ====================
+
+def normalizar_email(email: str) -> Optional[str]:
+    """Clave de búsqueda de email: sin espacios y en minúsculas (casefold)."""
+    if not email:
+        return None
+    return email.strip().casefold()
+
+
+def normalizar_telefono(telefono: str, region: str = "CL") -> Optional[str]:
+    """
+    Clave de búsqueda de teléfono en formato E.164 ("+56944556677").
+    Acepta cualquier formato que phonenumbers pueda parsear; None si no.
+    """
+    if not telefono:
+        return None
+    try:
+        numero = phonenumbers.parse(telefono, region)
+    except phonenumbers.NumberParseException:
+        return None
+    return phonenumbers.format_number(numero, phonenumbers.PhoneNumberFormat.E164)
+
+
+def normalizar_rut(rut: str) -> Optional[str]:
+    """Clave de búsqueda de RUT: solo dígitos y DV ("76.124.890-k" -> "76124890K")."""
+    if not rut:
+        return None
+    clave = re.sub(r"[^0-9kK]", "", rut).upper()
+    return clave or None
+
+
+VALIDADORES_MEMOIZADOS = {
+    "email": validar_email,
+    "telefono": validar_telefono,
+    "rut": validar_rut,
+}
+
+
+def estadisticas_cache_validadores() -> dict:
+    """Hits, misses y evictions de la caché de cada validador."""
+    return {
+        nombre: funcion.cache.estadisticas()
+        for nombre, funcion in VALIDADORES_MEMOIZADOS.items()
+    }
+
+
+def limpiar_cache_validadores():
+    """Vacía las cachés de los validadores memorizados."""
+    for funcion in VALIDADORES_MEMOIZADOS.values():
+        funcion.cache.limpiar()
@@ -3,6 +3,24 @@ Configuración global de pytest para el proyecto GIC.
 """
 import sys
 import os
+import pytest
 
 # Asegurar que el directorio raíz esté en el path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.database.connection import DatabaseConnection  # noqa: E402
+from src.database.migrations import crear_tablas  # noqa: E402
+
+
+@pytest.fixture
+def limpiar_bd():
+    """
+    BD por defecto migrada y sin clientes antes y después de la prueba.
+    Uso por módulo: pytestmark = pytest.mark.usefixtures("limpiar_bd")
+    """
+    crear_tablas()
+    with DatabaseConnection() as conn:
+        conn.execute("DELETE FROM clientes")
+    yield
+    with DatabaseConnection() as conn:
+        conn.execute("DELETE FROM clientes")
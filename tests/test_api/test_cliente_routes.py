@@ -29,12 +29,14 @@ def client():
 
 _counter = 0
 
+
 def crear_regular(client, nombre="Test User", email=None):
     global _counter
     _counter += 1
     if not email:
         email = f"test{_counter}@example.com"
-    return client.post("/api/clientes",
+    return client.post(
+        "/api/clientes",
         data=json.dumps({
             "tipo": "Regular",
             "nombre": nombre,
@@ -57,6 +59,12 @@ class TestHealthRoutes:
         assert resp.status_code == 200
         assert resp.get_json()["status"] == "ok"
 
+    def test_health_cache(self, client):
+        resp = client.get("/health/cache")
+        data = resp.get_json()
+        assert resp.status_code == 200
+        assert "hit_rate" in data["cache"]["por_id"]
+
 
 class TestCrearCliente:
 
@@ -69,7 +77,8 @@ class TestCrearCliente:
         assert data["cliente"]["tipo_cliente"] == "Regular"
 
     def test_crear_premium(self, client):
-        resp = client.post("/api/clientes",
+        resp = client.post(
+            "/api/clientes",
             data=json.dumps({
                 "tipo": "Premium",
                 "nombre": "Premium User",
@@ -84,7 +93,8 @@ class TestCrearCliente:
         assert data["cliente"]["nivel_premium"] == "Platinum"
 
     def test_crear_corporativo(self, client):
-        resp = client.post("/api/clientes",
+        resp = client.post(
+            "/api/clientes",
             data=json.dumps({
                 "tipo": "Corporativo",
                 "nombre": "Corp User",
@@ -104,7 +114,8 @@ class TestCrearCliente:
         assert resp.status_code == 400
 
     def test_crear_email_invalido(self, client):
-        resp = client.post("/api/clientes",
+        resp = client.post(
+            "/api/clientes",
             data=json.dumps({
                 "tipo": "Regular",
                 "nombre": "Bad Email",
@@ -150,6 +161,48 @@ class TestListarClientes:
         assert resp.get_json()["total"] == 0
 
 
+class TestPaginacion:
+
+    def test_recorre_paginas_con_cursor(self, client):
+        for _ in range(5):
+            crear_regular(client)
+        ids, cursor, paginas = [], None, 0
+        while True:
+            url = "/api/clientes?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            data = client.get(url).get_json()
+            ids.extend(c["id"] for c in data["clientes"])
+            paginas += 1
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        assert paginas == 3
+        assert len(set(ids)) == 5
+
+    def test_cursor_invalido(self, client):
+        resp = client.get("/api/clientes?cursor=no-es-un-cursor")
+        assert resp.status_code == 400
+
+    @pytest.mark.parametrize("valores", [("x",), ("a", "b", "c"), ("2024-01-01", 5)])
+    def test_cursor_con_valores_invalidos(self, client, valores):
+        from src.utils.helpers import codificar_cursor
+        crear_regular(client)
+        resp = client.get(f"/api/clientes?cursor={codificar_cursor(*valores)}")
+        assert resp.status_code == 400
+
+    def test_limit_invalido(self, client):
+        resp = client.get("/api/clientes?limit=0")
+        assert resp.status_code == 400
+
+    def test_filtros_de_fecha(self, client):
+        crear_regular(client)
+        data = client.get("/api/clientes?registrado_desde=2000-01-01").get_json()
+        assert data["total"] == 1
+        data = client.get("/api/clientes?registrado_hasta=2000-01-01").get_json()
+        assert data["total"] == 0
+        resp = client.get("/api/clientes?actualizado_desde=mañana")
+        assert resp.status_code == 400
+
+
 class TestObtenerCliente:
 
     def test_obtener_por_id(self, client):
@@ -164,19 +217,108 @@ class TestObtenerCliente:
         assert resp.status_code == 404
 
 
+class TestBusquedaPorClave:
+
+    def test_por_email_y_telefono(self, client):
+        id_cliente = crear_regular(client, email="Mixto@Example.com").get_json()["cliente"]["id"]
+        resp = client.get("/api/clientes/by-email/mixto@EXAMPLE.com")
+        assert resp.get_json()["cliente"]["id"] == id_cliente
+        resp = client.get("/api/clientes/by-telefono/%2B56944556677")
+        assert resp.status_code == 200
+
+    def test_no_encontrado(self, client):
+        assert client.get("/api/clientes/by-email/nadie@example.com").status_code == 404
+        assert client.get("/api/clientes/by-rut/76124890-1").status_code == 404
+
+
+class TestUpsert:
+
+    def _put(self, client, email, **datos):
+        datos.setdefault("nombre", "Cliente ERP")
+        datos.setdefault("telefono", "+56944556677")
+        datos.setdefault("direccion", "Calle ERP 123")
+        return client.put(
+            f"/api/clientes/by-email/{email}",
+            data=json.dumps(datos), content_type="application/json",
+        )
+
+    def test_put_crea_y_actualiza(self, client):
+        resp = self._put(client, "erp@example.com")
+        assert resp.status_code == 201
+        assert resp.get_json()["creado"] is True
+        id_cliente = resp.get_json()["cliente"]["id"]
+
+        resp = self._put(client, "erp@example.com", nombre="Nombre Nuevo")
+        data = resp.get_json()
+        assert resp.status_code == 200
+        assert data["creado"] is False
+        assert data["cliente"]["id"] == id_cliente
+        assert data["cliente"]["nombre"] == "Nombre Nuevo"
+
+    def test_put_invalido(self, client):
+        assert self._put(client, "no-es-email").status_code == 422
+
+    def test_crear_duplicado_por_mayusculas(self, client):
+        crear_regular(client, email="dup@example.com")
+        assert crear_regular(client, email="DUP@example.com").status_code == 409
+
+    def test_merge(self, client):
+        crear_regular(client, email="existe@example.com")
+        filas = [
+            {"tipo": "Regular", "nombre": "Existe Actualizado", "email": "existe@example.com",
+             "telefono": "+56944556677", "direccion": "Calle 1"},
+            {"tipo": "Premium", "nombre": "Nueva Premium", "email": "nueva@example.com",
+             "telefono": "+56944556677", "direccion": "Calle 2"},
+            {"tipo": "Regular", "nombre": "Sin Email", "telefono": "+56944556677",
+             "direccion": "Calle 3"},
+        ]
+        resp = client.post(
+            "/api/clientes/merge", data=json.dumps(filas), content_type="application/json"
+        )
+        data = resp.get_json()
+        assert resp.status_code == 200
+        assert (data["insertados"], data["actualizados"]) == (1, 1)
+        assert [(e["indice"], e["campo"]) for e in data["errores"]] == [(2, "email")]
+        resp = client.get("/api/clientes/by-email/existe@example.com")
+        assert resp.get_json()["cliente"]["nombre"] == "Existe Actualizado"
+
+    def test_merge_requiere_lista(self, client):
+        resp = client.post(
+            "/api/clientes/merge",
+            data=json.dumps({"email": "x@example.com"}), content_type="application/json",
+        )
+        assert resp.status_code == 400
+
+    def test_merge_value_error_es_400(self, client, monkeypatch):
+        from src.services.cliente_service import ClienteService
+
+        def falla(self, filas, region="CL"):
+            raise ValueError("Región telefónica desconocida: 'XX'")
+
+        monkeypatch.setattr(ClienteService, "fusionar_lote", falla)
+        resp = client.post(
+            "/api/clientes/merge",
+            data=json.dumps([{"email": "x@example.com"}]), content_type="application/json",
+        )
+        assert resp.status_code == 400
+        assert "Región" in resp.get_json()["error"]
+
+
 class TestActualizarCliente:
 
     def test_actualizar_nombre(self, client):
         resp = crear_regular(client)
         id_cliente = resp.get_json()["cliente"]["id"]
-        resp = client.put(f"/api/clientes/{id_cliente}",
+        resp = client.put(
+            f"/api/clientes/{id_cliente}",
             data=json.dumps({"nombre": "Nombre Nuevo"}),
             content_type="application/json")
         assert resp.status_code == 200
         assert resp.get_json()["cliente"]["nombre"] == "Nombre Nuevo"
 
     def test_actualizar_no_existe(self, client):
-        resp = client.put("/api/clientes/id-falso",
+        resp = client.put(
+            "/api/clientes/id-falso",
             data=json.dumps({"nombre": "Test"}),
             content_type="application/json")
         assert resp.status_code == 404
@@ -208,6 +350,35 @@ class TestToggleCliente:
         resp = client.patch(f"/api/clientes/{id_cliente}/toggle")
         assert "activado" in resp.get_json()["mensaje"]
 
+    def test_historial_registra_eventos(self, client):
+        resp = crear_regular(client)
+        id_cliente = resp.get_json()["cliente"]["id"]
+        client.patch(f"/api/clientes/{id_cliente}/toggle")
+        client.patch(f"/api/clientes/{id_cliente}/toggle")
+        resp = client.get(f"/api/clientes/{id_cliente}/historial")
+        acciones = [e["accion"] for e in resp.get_json()["historial"]]
+        assert acciones == ["activar", "desactivar", "crear"]
+
+    @pytest.mark.parametrize("limite", ["-1", "0", "muchos"])
+    def test_historial_limite_invalido(self, client, limite):
+        resp = client.get(f"/api/clientes/id-falso/historial?limit={limite}")
+        assert resp.status_code == 400
+
+    def test_toggle_no_existe(self, client):
+        resp = client.patch("/api/clientes/id-falso/toggle")
+        assert resp.status_code == 404
+
+    def test_agregar_puntos(self, client):
+        id_cliente = crear_regular(client).get_json()["cliente"]["id"]
+        resp = client.post(
+            f"/api/clientes/{id_cliente}/puntos",
+            data=json.dumps({"puntos": 120}), content_type="application/json")
+        assert resp.get_json()["puntos_fidelidad"] == 120
+        resp = client.post(
+            f"/api/clientes/{id_cliente}/puntos",
+            data=json.dumps({"puntos": -5}), content_type="application/json")
+        assert resp.status_code == 400
+
 
 class TestEstadisticas:
 
@@ -236,3 +407,25 @@ class TestExportar:
         resp = client.post("/api/clientes/export/csv")
         assert resp.status_code == 200
         assert resp.get_json()["ok"] is True
+
+    def test_exportar_csv_filtrado(self, client):
+        crear_regular(client)
+        resp = client.post("/api/clientes/export/csv?columnas=id,email&tipo=Regular&activo=true")
+        assert resp.status_code == 200
+
+    def test_exportar_csv_columna_invalida(self, client):
+        resp = client.post("/api/clientes/export/csv?columnas=id,clave")
+        assert resp.status_code == 400
+
+    def test_exportar_ndjson_gzip(self, client):
+        crear_regular(client)
+        resp = client.post("/api/clientes/export/ndjson?compresion=gzip&tipo=Regular")
+        assert resp.status_code == 200
+        ruta = resp.get_json()["ruta"]
+        assert ruta.endswith("clientes.ndjson.gz")
+        os.remove(ruta)
+
+    def test_exportar_compresion_invalida(self, client):
+        resp = client.post("/api/clientes/export/json?compresion=rar")
+        assert resp.status_code == 400
+        assert "Compresión desconocida" in resp.get_json()["error"]
@@ -0,0 +1,69 @@
+"""
+Pruebas de los contadores de estadísticas mantenidos por triggers.
+"""
+import pytest
+
+from src.database import migrations
+from src.database.connection import DatabaseConnection
+from src.database.estadisticas import (
+    leer_contadores,
+    verificar_estadisticas,
+    recontar_estadisticas,
+)
+
+COLUMNAS = "id, nombre, email, telefono, direccion, activo, tipo_cliente, " \
+    "fecha_registro, fecha_actualizacion, nivel_premium, cantidad_empleados"
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    ruta = str(tmp_path / "stats.db")
+    migrations.migrar(ruta)
+    return ruta
+
+
+def insertar(conn, id, tipo, activo=1, nivel=None, empleados=None):
+    conn.execute(
+        f"INSERT INTO clientes ({COLUMNAS}) VALUES (?, 'N', ?, 'T', 'D', ?, ?, 'f', 'f', ?, ?)",
+        (id, f"{id}@x.cl", activo, tipo, nivel, empleados),
+    )
+
+
+def contadores(ruta):
+    with DatabaseConnection(ruta) as conn:
+        return leer_contadores(conn)
+
+
+class TestContadores:
+
+    def test_insert_update_delete(self, ruta):
+        with DatabaseConnection(ruta) as conn:
+            insertar(conn, "r1", "Regular")
+            insertar(conn, "p1", "Premium", nivel="Gold")
+            insertar(conn, "c1", "Corporativo", activo=0, empleados=120)
+        c = contadores(ruta)
+        assert c["total"] == 3
+        assert c["tipo:Premium"] == 1
+        assert c["activo:1"] == 2 and c["activo:0"] == 1
+        assert c["nivel:Gold"] == 1
+        assert c["tamano:51-200"] == 1
+
+        with DatabaseConnection(ruta) as conn:
+            conn.execute("UPDATE clientes SET nivel_premium = 'Diamond' WHERE id = 'p1'")
+            conn.execute("UPDATE clientes SET cantidad_empleados = 500, activo = 1 WHERE id = 'c1'")
+            conn.execute("DELETE FROM clientes WHERE id = 'r1'")
+        c = contadores(ruta)
+        assert c["total"] == 2
+        assert c["nivel:Gold"] == 0 and c["nivel:Diamond"] == 1
+        assert c["tamano:51-200"] == 0 and c["tamano:201+"] == 1
+        assert c["activo:1"] == 2 and c["activo:0"] == 0
+        assert c["tipo:Regular"] == 0
+        assert verificar_estadisticas(ruta) == {}
+
+    def test_verificar_y_reparar(self, ruta):
+        with DatabaseConnection(ruta) as conn:
+            insertar(conn, "r1", "Regular")
+            conn.execute("UPDATE clientes_stats SET cantidad = 7 WHERE clave = 'total'")
+        assert verificar_estadisticas(ruta) == {"total": (7, 1)}
+        recontar_estadisticas(ruta)
+        assert verificar_estadisticas(ruta) == {}
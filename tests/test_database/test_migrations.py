@@ -0,0 +1,167 @@
+"""
+Pruebas del motor de migraciones versionadas.
+"""
+import sqlite3
+from datetime import datetime
+import pytest
+
+from src.database import migrations
+from src.database.connection import DatabaseConnection
+
+ESQUEMA_LEGADO = """
+    CREATE TABLE clientes (
+        id TEXT PRIMARY KEY, nombre TEXT NOT NULL, email TEXT NOT NULL UNIQUE,
+        telefono TEXT NOT NULL, direccion TEXT NOT NULL, activo INTEGER DEFAULT 1,
+        tipo_cliente TEXT NOT NULL DEFAULT 'Regular', fecha_registro TEXT NOT NULL,
+        fecha_actualizacion TEXT NOT NULL, limite_credito REAL,
+        puntos_fidelidad INTEGER DEFAULT 0, asesor_dedicado TEXT, nivel_premium TEXT,
+        descuento REAL, rut_empresa TEXT, razon_social TEXT, rubro TEXT,
+        contacto_comercial TEXT, cantidad_empleados INTEGER, descuento_volumen REAL
+    )
+"""
+
+
+@pytest.fixture
+def bd_legada(tmp_path):
+    """BD creada antes del motor de migraciones, con 10 clientes."""
+    ruta = str(tmp_path / "legada.db")
+    conn = sqlite3.connect(ruta)
+    conn.execute(ESQUEMA_LEGADO)
+    conn.executemany(
+        "INSERT INTO clientes (id, nombre, email, telefono, direccion, "
+        "fecha_registro, fecha_actualizacion) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (f"id{i}", f"José Núñez {i}", f"c{i}@example.com",
+             "+56 9 4455 6677", "Calle 123", "2024-01-01", "2024-01-01")
+            for i in range(10)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return ruta
+
+
+def contar_fts(ruta, termino):
+    with DatabaseConnection(ruta) as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM clientes_fts WHERE clientes_fts MATCH ?", (termino,)
+        ).fetchone()[0]
+
+
+class TestMigraciones:
+
+    def test_bd_nueva_queda_en_ultima_version(self, tmp_path):
+        ruta = str(tmp_path / "nueva.db")
+        migrations.migrar(ruta)
+        info = migrations.estado(ruta)
+        assert info["version"] == migrations.ultima_version()
+        assert all(bf["completado"] for bf in info["backfills"])
+
+    def test_idempotente(self, tmp_path):
+        ruta = str(tmp_path / "nueva.db")
+        migrations.migrar(ruta)
+        migrations._verificadas.discard(ruta)
+        migrations.migrar(ruta)
+        with DatabaseConnection(ruta) as conn:
+            total = conn.execute("SELECT COUNT(*) FROM schema_version").fetchone()[0]
+        assert total == migrations.ultima_version()
+
+    def test_bd_legada_con_backfill_por_lotes(self, bd_legada):
+        migrations.migrar(bd_legada, tam_lote=3)
+        assert contar_fts(bd_legada, "nunez") == 10
+
+    def test_bd_legada_completa_fechas_epoch(self, bd_legada):
+        migrations.migrar(bd_legada, tam_lote=3)
+        esperado = int(datetime(2024, 1, 1).timestamp())
+        with DatabaseConnection(bd_legada) as conn:
+            fechas = conn.execute(
+                "SELECT DISTINCT fecha_registro_ts, fecha_actualizacion_ts FROM clientes"
+            ).fetchall()
+        assert [tuple(f) for f in fechas] == [(esperado, esperado)]
+
+    def test_bd_legada_completa_claves_normalizadas(self, bd_legada):
+        migrations.migrar(bd_legada, tam_lote=4)
+        with DatabaseConnection(bd_legada) as conn:
+            claves = conn.execute(
+                "SELECT DISTINCT telefono_e164, rut_digitos FROM clientes"
+            ).fetchall()
+            email = conn.execute(
+                "SELECT email_normalizado FROM clientes WHERE id = 'id3'"
+            ).fetchone()[0]
+        assert [tuple(c) for c in claves] == [("+56944556677", None)]
+        assert email == "c3@example.com"
+
+    def test_backfill_reanudable(self, bd_legada, monkeypatch):
+        # Aplica las migraciones sin ejecutar los backfills
+        monkeypatch.setattr(migrations, "ejecutar_backfills", lambda *a, **k: False)
+        migrations.migrar(bd_legada)
+        monkeypatch.undo()
+
+        assert migrations.ejecutar_backfills(bd_legada, tam_lote=4, max_lotes=1) is False
+        info = migrations.estado(bd_legada)
+        assert info["backfills"][0]["cursor"] == 4
+        assert contar_fts(bd_legada, "nunez") == 4
+
+        assert migrations.ejecutar_backfills(bd_legada, tam_lote=4) is True
+        assert contar_fts(bd_legada, "nunez") == 10
+        assert migrations.estado(bd_legada)["backfills"][0]["completado"] == 1
+
+    def test_email_unico_sin_distinguir_mayusculas(self, bd_legada):
+        conn = sqlite3.connect(bd_legada)
+        conn.execute(
+            "UPDATE clientes SET email = 'C1@Example.com' WHERE id = 'id9'"
+        )
+        conn.commit()
+        conn.close()
+        # Los repetidos se reportan sin impedir el arranque
+        assert migrations.migrar(bd_legada, tam_lote=3) is None
+        assert migrations.emails_repetidos(bd_legada) == [
+            {"email_normalizado": "c1@example.com", "ids": ["id1", "id9"]},
+        ]
+        pendientes = [
+            bf["version"] for bf in migrations.estado(bd_legada)["backfills"]
+            if not bf["completado"]
+        ]
+        assert pendientes == [9]
+
+        with DatabaseConnection(bd_legada) as conn:
+            conn.execute(
+                "UPDATE clientes SET email = 'c9@example.com', "
+                "email_normalizado = 'c9@example.com' WHERE id = 'id9'"
+            )
+        migrations.migrar(bd_legada)
+        assert all(bf["completado"] for bf in migrations.estado(bd_legada)["backfills"])
+        with pytest.raises(sqlite3.IntegrityError, match="email_normalizado"):
+            with DatabaseConnection(bd_legada) as conn:
+                conn.execute(
+                    "UPDATE clientes SET email = 'C1@example.com', "
+                    "email_normalizado = 'c1@example.com' WHERE id = 'id2'"
+                )
+
+    def test_indice_unico_tras_el_backfill(self, bd_legada, monkeypatch):
+        # Las migraciones se aplican sin calcular aún email_normalizado
+        monkeypatch.setattr(migrations, "ejecutar_backfills", lambda *a, **k: False)
+        migrations.migrar(bd_legada)
+        monkeypatch.undo()
+        with DatabaseConnection(bd_legada) as conn:
+            nulos = conn.execute(
+                "SELECT COUNT(*) FROM clientes WHERE email_normalizado IS NULL"
+            ).fetchone()[0]
+        assert nulos == 10
+
+        assert migrations.ejecutar_backfills(bd_legada, tam_lote=4) is True
+        with DatabaseConnection(bd_legada) as conn:
+            unico = conn.execute(
+                "SELECT \"unique\" FROM pragma_index_list('clientes') "
+                "WHERE name = 'idx_clientes_email_normalizado'"
+            ).fetchone()[0]
+        assert unico == 1
+
+    def test_agregar_columna_idempotente(self, tmp_path):
+        ruta = str(tmp_path / "nueva.db")
+        migrations.migrar(ruta)
+        with DatabaseConnection(ruta) as conn:
+            migrations.agregar_columna(conn, "clientes", "extra", "TEXT")
+            migrations.agregar_columna(conn, "clientes", "extra", "TEXT")
+            columnas = [row[1] for row in conn.execute("PRAGMA table_info(clientes)")]
+        assert columnas.count("extra") == 1
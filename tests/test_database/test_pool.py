@@ -0,0 +1,102 @@
+"""
+Pruebas del pool de conexiones SQLite.
+"""
+import threading
+import pytest
+
+from src.database.pool import ConnectionPool, cerrar_pools, obtener_pool
+from src.database.connection import DatabaseConnection
+from src.exceptions.database_errors import ConexionDBError
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    return str(tmp_path / "pool.db")
+
+
+class TestConnectionPool:
+
+    def test_reutiliza_conexiones(self, ruta_db):
+        pool = ConnectionPool(ruta_db, tamano=2)
+        for _ in range(5):
+            conn = pool.obtener()
+            conn.execute("SELECT 1")
+            pool.devolver(conn)
+        stats = pool.estadisticas()
+        assert stats["checkouts"] == 5
+        assert stats["creadas"] == 1
+        assert stats["abiertas"] == 1
+        assert stats["en_uso"] == 0
+
+    def test_timeout_sin_conexiones_libres(self, ruta_db):
+        pool = ConnectionPool(ruta_db, tamano=1, timeout=0.05)
+        conn = pool.obtener()
+        with pytest.raises(ConexionDBError):
+            pool.obtener()
+        assert pool.estadisticas()["timeouts"] == 1
+        pool.devolver(conn)
+
+    def test_espera_hasta_devolucion(self, ruta_db):
+        pool = ConnectionPool(ruta_db, tamano=1, timeout=2)
+        conn = pool.obtener()
+        threading.Timer(0.05, pool.devolver, args=(conn,)).start()
+        otra = pool.obtener()
+        assert otra is conn
+        assert pool.estadisticas()["esperas"] == 1
+        pool.devolver(otra)
+
+    def test_descartar_cierra_conexion(self, ruta_db):
+        pool = ConnectionPool(ruta_db, tamano=1)
+        pool.devolver(pool.obtener(), descartar=True)
+        assert pool.estadisticas()["abiertas"] == 0
+
+
+class TestDatabaseConnection:
+
+    def test_commit_y_devolucion(self, ruta_db):
+        with DatabaseConnection(ruta_db) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+        with DatabaseConnection(ruta_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+        stats = DatabaseConnection.estadisticas_pool(ruta_db)
+        assert stats["creadas"] == 1
+        assert stats["en_uso"] == 0
+
+    def test_rollback_en_error(self, ruta_db):
+        with DatabaseConnection(ruta_db) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        with pytest.raises(RuntimeError):
+            with DatabaseConnection(ruta_db) as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("falla")
+        with DatabaseConnection(ruta_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+class TestPerfilesPragma:
+
+    def test_perfil_wal(self, ruta_db):
+        pool = ConnectionPool(ruta_db, perfil="wal")
+        conn = pool.obtener()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        pool.devolver(conn)
+
+    def test_perfil_invalido(self, ruta_db):
+        with pytest.raises(ValueError):
+            ConnectionPool(ruta_db, perfil="turbo")
+
+    def test_pragma_no_permitido(self, ruta_db):
+        with pytest.raises(ValueError):
+            ConnectionPool(ruta_db, perfil={"writable_schema": "ON"})
+
+    def test_perfil_distinto_al_del_pool(self, ruta_db):
+        try:
+            pool = obtener_pool(ruta_db, perfil="wal")
+            assert obtener_pool(ruta_db) is pool
+            assert obtener_pool(ruta_db, perfil="wal") is pool
+            with pytest.raises(ValueError, match="cerrar_pools"):
+                DatabaseConnection(ruta_db, perfil="wal_durable")
+        finally:
+            cerrar_pools()
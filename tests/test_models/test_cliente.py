@@ -237,3 +237,75 @@ class TestPolimorfismo:
         assert cliente_regular.tipo_cliente == "Regular"
         assert cliente_premium.tipo_cliente == "Premium"
         assert cliente_corporativo.tipo_cliente == "Corporativo"
+
+
+# ==================== TESTS CARGA CONFIABLE ====================
+
+class TestCargaConfiable:
+
+    def test_round_trip_conserva_datos(
+        self, cliente_regular, cliente_premium, cliente_corporativo
+    ):
+        for cliente in (cliente_regular, cliente_premium, cliente_corporativo):
+            datos = cliente.to_dict()
+            cargado = type(cliente).from_storage(datos)
+            assert cargado.to_dict() == datos
+
+    def test_no_revalida(self):
+        # Un dato almacenado no se vuelve a validar al cargarlo
+        cliente = ClienteRegular.from_storage({
+            "id": "abc", "nombre": "x", "email": "sin-arroba",
+            "telefono": "123", "direccion": "", "activo": 0,
+        })
+        assert cliente.email == "sin-arroba"
+        assert cliente.activo is False
+        assert cliente.limite_credito == 500_000
+
+    def test_calcula_descuentos_por_defecto(self):
+        premium = ClientePremium.from_storage({
+            "id": "p1", "nombre": "Test", "email": "p@test.com",
+            "telefono": "+56 9 4455 6677", "direccion": "Dirección 123",
+            "nivel_premium": "Diamond", "descuento": None,
+        })
+        assert premium.calcular_descuento(100000) == 20000.0
+
+
+# ==================== TESTS REGISTRO DE CAMBIOS ====================
+
+class TestRegistroCambios:
+
+    def test_instancia_nueva_sin_registro(self, cliente_regular):
+        assert cliente_regular.cambios is None
+
+    def test_cargado_registra_setters_y_metodos(self, cliente_premium):
+        cargado = ClientePremium.from_storage(cliente_premium.to_dict())
+        assert cargado.cambios == frozenset()
+        cargado.nombre = "Carlos Soto"
+        cargado.subir_nivel()
+        assert cargado.cambios == {"nombre", "nivel_premium", "descuento"}
+        cargado.limpiar_cambios()
+        assert cargado.cambios == frozenset()
+
+    def test_metodos_de_subclases(self, cliente_regular, cliente_corporativo):
+        regular = ClienteRegular.from_storage(cliente_regular.to_dict())
+        regular.agregar_puntos(10)
+        regular.desactivar()
+        assert regular.cambios == {"puntos_fidelidad", "activo"}
+
+        corporativo = ClienteCorporativo.from_storage(cliente_corporativo.to_dict())
+        corporativo.actualizar_empleados(300)
+        assert corporativo.cambios == {"cantidad_empleados", "descuento_volumen"}
+
+    def test_sin_dict_por_instancia(
+        self, cliente_regular, cliente_premium, cliente_corporativo
+    ):
+        for cliente in (cliente_regular, cliente_premium, cliente_corporativo):
+            assert not hasattr(cliente, "__dict__")
+            with pytest.raises(AttributeError):
+                cliente.atributo_nuevo = 1
+
+    def test_campos_coinciden_con_to_dict(
+        self, cliente_base, cliente_regular, cliente_premium, cliente_corporativo
+    ):
+        for cliente in (cliente_base, cliente_regular, cliente_premium, cliente_corporativo):
+            assert type(cliente).CAMPOS == tuple(cliente.to_dict())
@@ -0,0 +1,181 @@
+"""
+Pruebas de la exportación en streaming (JSON, NDJSON y CSV).
+"""
+import csv
+import gzip
+import json
+import os
+import pytest
+
+from src.models import ClienteRegular, ClientePremium, ClienteCorporativo
+from src.repositories.csv_repository import CSVRepository
+from src.repositories.json_repository import JSONRepository
+from src.repositories.ndjson_repository import NDJSONRepository
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.utils.compresion import compresiones_disponibles
+
+
+pytestmark = pytest.mark.usefixtures("limpiar_bd")
+
+
+@pytest.fixture
+def repo():
+    repo = SQLiteRepository()
+    repo.crear_lote([
+        ClienteRegular(
+            nombre="Ana Pérez", email="ana@example.com",
+            telefono="+56944556677", direccion="Calle Ñuñoa 1", puntos_fidelidad=1500,
+        ),
+        ClientePremium(
+            nombre="Bruno Soto", email="bruno@example.com",
+            telefono="+56966778899", direccion="Av. Providencia 2", nivel_premium="Diamond",
+        ),
+        ClienteCorporativo(
+            nombre="Carla Díaz", email="carla@empresa.cl",
+            telefono="+56987654321", direccion="Apoquindo 3",
+            rut_empresa="76.124.890-1", razon_social="TechCorp SpA",
+        ),
+    ])
+    return repo
+
+
+class TestIterarVistas:
+
+    def test_recorre_en_lotes_con_el_orden_de_listar(self, repo):
+        vistas = list(repo.iterar_vistas(tam_lote=2))
+        assert [v.id for v in vistas] == [c.id for c in repo.listar()]
+        assert [v.to_dict() for v in vistas] == [c.to_dict() for c in repo.listar()]
+
+    def test_filtros(self, repo):
+        assert [v.tipo_cliente for v in repo.iterar_vistas(tipo="Premium")] == ["Premium"]
+        repo.desactivar(repo.obtener_por_email("ana@example.com").id)
+        assert len(list(repo.iterar_vistas(activos_solo=True))) == 2
+        assert [v.email for v in repo.iterar_vistas(activo=False)] == ["ana@example.com"]
+
+
+class TestExportarJSON:
+
+    def test_mismo_formato_que_json_dump(self, repo, tmp_path):
+        ruta = str(tmp_path / "clientes.json")
+        JSONRepository(ruta).exportar(repo.iterar_vistas(tam_lote=2))
+
+        esperado = json.dumps(
+            [c.to_dict() for c in repo.listar()], ensure_ascii=False, indent=2
+        )
+        with open(ruta, encoding="utf-8") as f:
+            assert f.read() == esperado
+
+    def test_vacio(self, tmp_path):
+        ruta = str(tmp_path / "vacio.json")
+        JSONRepository(ruta).exportar(iter(()))
+        with open(ruta, encoding="utf-8") as f:
+            assert f.read() == json.dumps([], indent=2)
+
+    def test_error_no_reemplaza_el_archivo(self, repo, tmp_path):
+        ruta = tmp_path / "clientes.json"
+        ruta.write_text("[]", encoding="utf-8")
+
+        def clientes_con_falla():
+            yield from repo.iterar_vistas()
+            raise RuntimeError("falla a mitad de la exportación")
+
+        with pytest.raises(RuntimeError):
+            JSONRepository(str(ruta)).exportar(clientes_con_falla())
+        assert ruta.read_text(encoding="utf-8") == "[]"
+        assert os.listdir(tmp_path) == ["clientes.json"]  # Sin temporales
+
+    def test_gzip(self, repo, tmp_path):
+        plano = JSONRepository(str(tmp_path / "plano.json")).exportar(repo.iterar_vistas())
+        comprimido = JSONRepository(str(tmp_path / "clientes.json")).exportar(
+            repo.iterar_vistas(), compresion="gzip"
+        )
+        assert comprimido.endswith("clientes.json.gz")
+        with open(plano, "rb") as f, gzip.open(comprimido) as g:
+            assert g.read() == f.read()
+
+        lector = JSONRepository(comprimido)
+        assert [c.email for c in lector.iterar()] == [c.email for c in repo.listar()]
+
+
+class TestExportarNDJSON:
+
+    def test_un_cliente_por_linea(self, repo, tmp_path):
+        ruta = NDJSONRepository(str(tmp_path / "clientes.ndjson")).exportar(repo.iterar_vistas())
+        with open(ruta, encoding="utf-8") as f:
+            lineas = f.read().split("\n")
+        assert lineas[-1] == ""
+        assert [json.loads(linea) for linea in lineas[:-1]] == [c.to_dict() for c in repo.listar()]
+        assert "Calle Ñuñoa 1" in "".join(lineas)  # UTF-8 sin escapes
+
+    def test_gzip_ida_y_vuelta(self, repo, tmp_path):
+        ruta = NDJSONRepository(str(tmp_path / "clientes.ndjson")).exportar(
+            repo.iterar_vistas(), compresion="gzip"
+        )
+        assert ruta.endswith(".ndjson.gz")
+        importados = NDJSONRepository(ruta).importar(validar=False)
+        assert [c.to_dict() for c in importados] == [c.to_dict() for c in repo.listar()]
+
+    def test_compresion_invalida(self, tmp_path):
+        with pytest.raises(ValueError, match="Compresión desconocida"):
+            NDJSONRepository(str(tmp_path / "x.ndjson")).exportar(iter(()), compresion="rar")
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif("zstd" not in compresiones_disponibles(), reason="requiere zstandard")
+    @pytest.mark.parametrize("clase, archivo", [
+        (JSONRepository, "clientes.json"),
+        (NDJSONRepository, "clientes.ndjson"),
+    ])
+    def test_zstd_ida_y_vuelta(self, repo, tmp_path, clase, archivo):
+        ruta = clase(str(tmp_path / archivo)).exportar(repo.iterar_vistas(), compresion="zstd")
+        assert ruta.endswith(".zst")
+        importados = clase(ruta).importar(validar=False)
+        assert [c.to_dict() for c in importados] == [c.to_dict() for c in repo.listar()]
+
+    @pytest.mark.skipif("zstd" in compresiones_disponibles(), reason="zstandard instalado")
+    def test_zstd_sin_paquete(self, tmp_path):
+        with pytest.raises(ValueError, match="zstandard"):
+            NDJSONRepository(str(tmp_path / "x.ndjson")).exportar(iter(()), compresion="zstd")
+
+
+def leer_csv(ruta):
+    with open(ruta, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+class TestExportarCSV:
+
+    def test_esquema_fijo(self, repo, tmp_path):
+        ruta = str(tmp_path / "clientes.csv")
+        CSVRepository(ruta).exportar(repo.iterar_vistas(tam_lote=2))
+
+        filas = leer_csv(ruta)
+        assert tuple(filas[0]) == CSVRepository.COLUMNAS
+        por_email = {f[2]: dict(zip(filas[0], f)) for f in filas[1:]}
+        assert por_email["ana@example.com"]["puntos_fidelidad"] == "1500"
+        assert por_email["ana@example.com"]["rut_empresa"] == ""
+        assert por_email["bruno@example.com"]["nivel_premium"] == "Diamond"
+        assert por_email["carla@empresa.cl"]["activo"] == "True"
+
+    def test_sin_clientes_escribe_encabezado(self, tmp_path):
+        ruta = str(tmp_path / "vacio.csv")
+        CSVRepository(ruta).exportar(iter(()))
+        assert leer_csv(ruta) == [list(CSVRepository.COLUMNAS)]
+
+    def test_seleccion_de_columnas(self, repo, tmp_path):
+        ruta = str(tmp_path / "clientes.csv")
+        CSVRepository(ruta).exportar(
+            repo.iterar_vistas(tipo="Corporativo"), ["email", "rut_empresa"]
+        )
+        assert leer_csv(ruta) == [["email", "rut_empresa"], ["carla@empresa.cl", "76.124.890-1"]]
+
+    def test_columna_desconocida(self):
+        with pytest.raises(ValueError, match="Columnas desconocidas"):
+            CSVRepository.validar_columnas(["email", "password"])
+
+    def test_importa_lo_exportado(self, repo, tmp_path):
+        ruta = str(tmp_path / "clientes.csv")
+        CSVRepository(ruta).exportar(repo.iterar_vistas())
+        importados = CSVRepository(ruta).importar()
+        assert sorted(c.to_dict()["email"] for c in importados) == [
+            "ana@example.com", "bruno@example.com", "carla@empresa.cl",
+        ]
@@ -0,0 +1,451 @@
+"""
+Pruebas del repositorio SQLite.
+"""
+import time
+from datetime import datetime
+import pytest
+
+from src.database.connection import DatabaseConnection
+from src.exceptions.database_errors import RegistroDuplicadoError, RegistroNoEncontradoError
+from src.models import ClienteRegular, ClientePremium, ClienteCorporativo
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.utils.validacion_lote import validar_lote
+
+
+pytestmark = pytest.mark.usefixtures("limpiar_bd")
+
+
+@pytest.fixture
+def repo():
+    return SQLiteRepository()
+
+
+class AuditoriaEnMemoria:
+    """Destino de auditoría que solo acumula los eventos."""
+
+    def __init__(self):
+        self.eventos = []
+
+    def registrar(self, accion, entidad, entidad_id=None, detalle=None):
+        self.eventos.append((accion, entidad_id, detalle))
+
+
+def nuevo_regular(n, **extra):
+    return ClienteRegular(
+        nombre="Cliente Lote",
+        email=f"lote{n}@example.com",
+        telefono="+56944556677",
+        direccion="Calle Lote 123",
+        **extra,
+    )
+
+
+class TestCrearLote:
+
+    def test_inserta_en_varios_lotes(self, repo):
+        clientes = [nuevo_regular(i) for i in range(7)]
+        resultado = repo.crear_lote(clientes, tam_lote=3)
+        assert resultado == {"insertados": 7, "conflictos": []}
+        assert repo.contar() == 7
+
+    def test_acepta_iteradores(self, repo):
+        resultado = repo.crear_lote(nuevo_regular(i) for i in range(4))
+        assert resultado["insertados"] == 4
+
+    def test_email_duplicado_sin_distinguir_mayusculas(self, repo):
+        repo.crear(nuevo_regular(1))
+        mayusculas = nuevo_regular(1)
+        mayusculas.email = "Lote1@Example.com"
+        otro = nuevo_regular(2)
+        repetido = nuevo_regular(2)
+        repetido.email = "LOTE2@example.com"
+        resultado = repo.crear_lote([mayusculas, otro, repetido])
+        assert resultado["insertados"] == 1
+        assert [(c["indice"], c["campo"]) for c in resultado["conflictos"]] == [
+            (0, "email"), (2, "email"),
+        ]
+        assert repo.contar() == 2
+
+    def test_reporta_duplicados_sin_abortar(self, repo):
+        repo.crear(nuevo_regular(1))
+        clientes = [
+            nuevo_regular(1),  # ya existe en BD
+            nuevo_regular(2),
+            nuevo_regular(2),  # repetido dentro del lote
+            ClientePremium(
+                nombre="Premium Lote",
+                email="premium@example.com",
+                telefono="+56955667788",
+                direccion="Av Premium 456",
+                nivel_premium="Diamond",
+            ),
+        ]
+        resultado = repo.crear_lote(clientes)
+        assert resultado["insertados"] == 2
+        assert [c["indice"] for c in resultado["conflictos"]] == [0, 2]
+        assert all(c["campo"] == "email" for c in resultado["conflictos"])
+        premium = repo.obtener_por_email("premium@example.com")
+        assert premium.nivel_premium == "Diamond"
+
+    def test_audita_cada_fila_del_lote(self):
+        auditoria = AuditoriaEnMemoria()
+        repo = SQLiteRepository(auditoria=auditoria)
+        clientes = [nuevo_regular(i) for i in range(5)]
+        repo.crear_lote(clientes, tam_lote=3)
+        assert auditoria.eventos == [
+            ("crear", c.id, {"tipo": "Regular", "lote": True}) for c in clientes
+        ]
+
+    def test_conflicto_por_id(self, repo):
+        original = repo.crear(nuevo_regular(1))
+        resultado = repo.crear_lote([nuevo_regular(9, id=original.id)])
+        assert resultado["insertados"] == 0
+        assert resultado["conflictos"][0]["campo"] == "id"
+
+
+class TestBusquedaFullText:
+
+    @pytest.fixture
+    def clientes(self, repo):
+        repo.crear(ClientePremium(
+            nombre="María López",
+            email="maria@example.com",
+            telefono="+56955667788",
+            direccion="Los Leones 789",
+        ))
+        repo.crear(ClienteCorporativo(
+            nombre="Carlos Díaz",
+            email="carlos@empresa.cl",
+            telefono="+56966778899",
+            direccion="Apoquindo 1000",
+            rut_empresa="76.124.890-1",
+            razon_social="TechCorp SpA",
+        ))
+
+    def nombres(self, repo, busqueda, **filtros):
+        return [c.nombre for c in repo.listar(busqueda=busqueda, **filtros)]
+
+    def test_sin_tildes_ni_mayusculas(self, repo, clientes):
+        assert self.nombres(repo, "maria lopez") == ["María López"]
+        assert self.nombres(repo, "LÓP") == ["María López"]
+
+    def test_telefono_y_rut(self, repo, clientes):
+        assert self.nombres(repo, "966778899") == ["Carlos Díaz"]
+        assert self.nombres(repo, "+56 9 5566") == ["María López"]
+        assert self.nombres(repo, "76124890") == ["Carlos Díaz"]
+        assert self.nombres(repo, "techcorp") == ["Carlos Díaz"]
+
+    def test_solo_puntuacion_busca_subcadena(self, repo, clientes):
+        assert self.nombres(repo, "@empresa") == ["Carlos Díaz"]
+        assert sorted(self.nombres(repo, "@")) == ["Carlos Díaz", "María López"]
+        assert self.nombres(repo, "#") == []
+        assert self.nombres(repo, "%") == []
+
+    def test_combina_con_filtros(self, repo, clientes):
+        assert self.nombres(repo, "example", tipo="Corporativo") == []
+        assert self.nombres(repo, "empresa", tipo="Corporativo") == ["Carlos Díaz"]
+
+    def test_sincroniza_actualizacion_y_borrado(self, repo, clientes):
+        maria = repo.obtener_por_email("maria@example.com")
+        maria.nombre = "Mariana Soto"
+        repo.actualizar(maria)
+        assert self.nombres(repo, "lopez") == []
+        assert self.nombres(repo, "mariana") == ["Mariana Soto"]
+        repo.eliminar(maria.id)
+        assert self.nombres(repo, "mariana") == []
+
+
+class TestActualizacionParcial:
+
+    @pytest.fixture
+    def regular(self, repo):
+        return repo.crear(nuevo_regular(1))
+
+    def columna(self, id, columna):
+        with DatabaseConnection() as conn:
+            return conn.execute(
+                f"SELECT {columna} FROM clientes WHERE id = ?", (id,)
+            ).fetchone()[0]
+
+    def test_solo_escribe_columnas_modificadas(self, repo, regular):
+        cargado = repo.obtener_por_id(regular.id)
+        # Cambio concurrente en otra columna: no debe pisarse
+        with DatabaseConnection() as conn:
+            conn.execute(
+                "UPDATE clientes SET puntos_fidelidad = 77 WHERE id = ?", (regular.id,)
+            )
+        cargado.nombre = "Nombre Nuevo"
+        repo.actualizar(cargado)
+
+        assert self.columna(regular.id, "nombre") == "Nombre Nuevo"
+        assert self.columna(regular.id, "puntos_fidelidad") == 77
+        assert cargado.cambios == frozenset()
+
+    def test_sin_cambios_no_actualiza(self, repo, regular):
+        cargado = repo.obtener_por_id(regular.id)
+        fecha = self.columna(regular.id, "fecha_actualizacion")
+        repo.actualizar(cargado)
+        assert self.columna(regular.id, "fecha_actualizacion") == fecha
+
+    def test_alternar_activo(self, repo, regular):
+        assert repo.alternar_activo(regular.id) is False
+        assert repo.obtener_por_id(regular.id).activo is False
+        assert repo.alternar_activo(regular.id) is True
+        assert repo.obtener_por_id(regular.id).activo is True
+
+    def test_agregar_puntos(self, repo, regular):
+        assert repo.agregar_puntos(regular.id, 150) == 150
+        assert repo.agregar_puntos(regular.id, 50) == 200
+        assert repo.obtener_por_id(regular.id).puntos_fidelidad == 200
+
+    def test_agregar_puntos_solo_regulares(self, repo):
+        premium = repo.crear(ClientePremium(
+            nombre="Premium Puntos",
+            email="premium-puntos@example.com",
+            telefono="+56955667788",
+            direccion="Av Premium 456",
+        ))
+        with pytest.raises(RegistroNoEncontradoError):
+            repo.agregar_puntos(premium.id, 10)
+        with pytest.raises(ValueError):
+            repo.agregar_puntos(premium.id, -1)
+
+
+class TestListarVistas:
+
+    @pytest.fixture
+    def clientes(self, repo):
+        return [
+            repo.crear(nuevo_regular(1, puntos_fidelidad=2500)),
+            repo.crear(ClientePremium(
+                nombre="Premium Vista",
+                email="vista@example.com",
+                telefono="+56955667788",
+                direccion="Av Premium 456",
+                nivel_premium="Platinum",
+            )),
+            repo.crear(ClienteCorporativo(
+                nombre="Corporativo Vista",
+                email="corp-vista@empresa.cl",
+                telefono="+56966778899",
+                direccion="Apoquindo 1000",
+                rut_empresa="76.124.890-1",
+                razon_social="Vista SpA",
+                cantidad_empleados=120,
+            )),
+        ]
+
+    def test_mismo_to_dict_que_los_modelos(self, repo, clientes):
+        vistas, _ = repo.listar_vistas()
+        modelos, _ = repo.listar_pagina()
+        assert [v.to_dict() for v in vistas] == [m.to_dict() for m in modelos]
+        assert all(v._modelo is None for v in vistas)  # Sin construir modelos
+
+    def test_atributos_y_metodos_de_negocio(self, repo, clientes):
+        vistas = {v.tipo_cliente: v for v in repo.listar_vistas()[0]}
+        regular = vistas["Regular"]
+        assert regular.activo is True
+        assert regular.puntos_fidelidad == 2500
+        assert regular._modelo is None
+        assert regular.calcular_descuento(1000) == 20.0
+        assert isinstance(regular.modelo, ClienteRegular)
+        assert vistas["Premium"].calcular_descuento(1000) == 150.0
+        assert vistas["Corporativo"].calcular_descuento(1000) == 150.0
+
+    def test_valores_vacios_usan_los_defectos_del_modelo(self, repo, clientes):
+        with DatabaseConnection() as conn:
+            conn.execute("UPDATE clientes SET descuento = NULL, asesor_dedicado = NULL "
+                         "WHERE tipo_cliente = 'Premium'")
+        vista = repo.listar_vistas(tipo="Premium")[0][0]
+        assert vista.descuento == 0.15
+        assert vista.to_dict()["asesor_dedicado"] == "Sin asignar"
+
+    def test_solo_lectura(self, repo, clientes):
+        vista = repo.listar_vistas()[0][0]
+        with pytest.raises(AttributeError):
+            vista.nombre = "Otro"
+
+
+class TestFiltrosFecha:
+
+    @pytest.fixture
+    def clientes(self, repo):
+        fechas = ("2024-01-15T10:00:00", "2024-03-01T00:00:00", "2024-06-30T23:00:00")
+        return [
+            repo.crear(nuevo_regular(i, fecha_registro=fecha))
+            for i, fecha in enumerate(fechas)
+        ]
+
+    def emails(self, clientes):
+        return sorted(c.email for c in clientes)
+
+    def test_rango_de_registro(self, repo, clientes):
+        encontrados = repo.listar(registrado_desde="2024-02-01", registrado_hasta="2024-06-30")
+        assert self.emails(encontrados) == ["lote1@example.com", "lote2@example.com"]
+        pagina, _ = repo.listar_pagina(registrado_hasta=datetime(2024, 3, 1))
+        assert self.emails(pagina) == ["lote0@example.com", "lote1@example.com"]
+
+    def test_actualizado_desde(self, repo, clientes):
+        with DatabaseConnection() as conn:
+            conn.execute("UPDATE clientes SET fecha_actualizacion_ts = 0")
+        corte = int(time.time()) - 1
+        assert repo.listar(actualizado_desde=corte) == []
+        repo.alternar_activo(clientes[2].id)
+        vistas, _ = repo.listar_vistas(actualizado_desde=corte)
+        assert [v.email for v in vistas] == ["lote2@example.com"]
+
+    def test_fecha_invalida(self, repo):
+        with pytest.raises(ValueError):
+            repo.listar_pagina(registrado_desde="ayer")
+
+
+class TestClavesNormalizadas:
+
+    @pytest.fixture
+    def corporativo(self, repo):
+        return repo.crear(ClienteCorporativo(
+            nombre="Carlos Díaz",
+            email="Carlos@Empresa.cl",
+            telefono="+56966778899",
+            direccion="Apoquindo 1000",
+            rut_empresa="76.124.890-1",
+            razon_social="TechCorp SpA",
+        ))
+
+    def test_busquedas_exactas_normalizadas(self, repo, corporativo):
+        assert repo.obtener_por_email("CARLOS@empresa.CL").id == corporativo.id
+        for telefono in ("+56 9 6677 8899", "966778899", "+56-966-778-899"):
+            assert repo.obtener_por_telefono(telefono).id == corporativo.id
+        for rut in ("76124890-1", "761248901", "76.124.890-1"):
+            assert repo.obtener_por_rut(rut).id == corporativo.id
+
+    def test_sin_coincidencia(self, repo, corporativo):
+        assert repo.obtener_por_email("otro@empresa.cl") is None
+        assert repo.obtener_por_telefono("no-es-telefono") is None
+        assert repo.obtener_por_rut("") is None
+
+    def test_actualizacion_parcial_mantiene_claves(self, repo, corporativo):
+        cargado = repo.obtener_por_id(corporativo.id)
+        cargado.telefono = "+56944556677"
+        repo.actualizar(cargado)
+        assert repo.obtener_por_telefono("944556677").id == corporativo.id
+        assert repo.obtener_por_telefono("966778899") is None
+
+    def test_usa_indices(self, repo):
+        with DatabaseConnection() as conn:
+            for columna in ("email_normalizado", "telefono_e164", "rut_digitos"):
+                plan = " ".join(
+                    row[3] for row in conn.execute(
+                        f"EXPLAIN QUERY PLAN SELECT * FROM clientes WHERE {columna} = ?",
+                        ("x",),
+                    )
+                )
+                assert f"idx_clientes_{columna}" in plan
+
+
+class TestUpsertPorEmail:
+
+    def test_crear_rechaza_email_sin_distinguir_mayusculas(self, repo):
+        repo.crear(nuevo_regular(1))
+        duplicado = nuevo_regular(2)
+        duplicado.email = "LOTE1@example.com"
+        with pytest.raises(RegistroDuplicadoError):
+            repo.crear(duplicado)
+        assert repo.contar() == 1
+
+    def test_inserta_y_luego_actualiza(self, repo):
+        original, creado = repo.crear_o_actualizar(nuevo_regular(1, limite_credito=1000))
+        assert creado
+
+        cambio = nuevo_regular(1, limite_credito=5000)
+        cambio.nombre = "Cliente Sincronizado"
+        guardado, creado = repo.crear_o_actualizar(cambio)
+        assert not creado
+        assert guardado.id == original.id
+        assert guardado.fecha_registro == original.fecha_registro
+        assert guardado.nombre == "Cliente Sincronizado"
+        assert guardado.limite_credito == 5000
+        assert repo.contar() == 1
+
+    def test_email_sin_distinguir_mayusculas(self, repo):
+        original = repo.crear(nuevo_regular(1))
+        cambio = nuevo_regular(1, limite_credito=7000)
+        cambio.email = "LOTE1@Example.com"
+        guardado, creado = repo.crear_o_actualizar(cambio)
+        assert not creado
+        assert guardado.id == original.id
+        assert guardado.email == "lote1@example.com"  # Se conserva el original
+        assert repo.contar() == 1
+
+    def test_actualizar_marca_fecha_actualizacion(self, repo):
+        repo.crear(nuevo_regular(1))
+        # Como en fusionar_lote: filas validadas sin fecha_actualizacion
+        (_, datos), = validar_lote([{
+            "nombre": "Cliente Lote", "email": "lote1@example.com",
+            "telefono": "+56944556677", "direccion": "Calle Lote 123",
+            "fecha_registro": "2020-01-01T00:00:00",
+        }])["validos"]
+        antiguo = ClienteRegular.from_storage(datos)
+        antes = int(time.time())
+        guardado, creado = repo.crear_o_actualizar(antiguo)
+        assert not creado
+        assert guardado.fecha_actualizacion > "2020-01-02"
+        assert [c.id for c in repo.listar(actualizado_desde=antes)] == [guardado.id]
+
+    def test_actualizar_con_id_y_fecha_existentes(self, repo):
+        original = repo.crear(nuevo_regular(1))
+        cambio = ClienteRegular.from_storage({
+            **original.to_dict(), "limite_credito": 3000,
+        })
+        guardado, creado = repo.crear_o_actualizar(cambio)
+        assert not creado
+        assert guardado.limite_credito == 3000
+
+    def test_cambio_de_tipo_limpia_columnas(self, repo):
+        repo.crear(ClientePremium(
+            nombre="Ana Premium", email="lote1@example.com",
+            telefono="+56944556677", direccion="Calle 1", nivel_premium="Platinum",
+        ))
+        guardado, _ = repo.crear_o_actualizar(nuevo_regular(1))
+        assert isinstance(guardado, ClienteRegular)
+        with DatabaseConnection() as conn:
+            row = conn.execute(
+                "SELECT nivel_premium FROM clientes WHERE id = ?", (guardado.id,)
+            ).fetchone()
+        assert row[0] is None
+        assert repo.obtener_estadisticas().get("tipo:Premium", 0) == 0
+
+    def test_id_de_otro_cliente(self, repo):
+        existente = repo.crear(nuevo_regular(1))
+        otro = nuevo_regular(2, id=existente.id)
+        with pytest.raises(RegistroDuplicadoError):
+            repo.crear_o_actualizar(otro)
+
+    def test_lote(self, repo):
+        existente = repo.crear(nuevo_regular(1))
+        clientes = [
+            nuevo_regular(1, limite_credito=9000),
+            nuevo_regular(2),
+            nuevo_regular(3, id=existente.id),  # id ajeno
+            nuevo_regular(4),
+        ]
+        resultado = repo.crear_o_actualizar_lote(clientes, tam_lote=2)
+        assert resultado["insertados"] == 2
+        assert resultado["actualizados"] == 1
+        assert resultado["conflictos"] == [{
+            "indice": 2, "id": existente.id,
+            "email": "lote3@example.com", "campo": "id",
+        }]
+        assert repo.obtener_por_id(existente.id).limite_credito == 9000
+        assert repo.contar() == 3
+
+    def test_lote_audita_cada_fila(self):
+        auditoria = AuditoriaEnMemoria()
+        repo = SQLiteRepository(auditoria=auditoria)
+        existente = repo.crear(nuevo_regular(1))
+        nuevo = nuevo_regular(2)
+        repo.crear_o_actualizar_lote([nuevo_regular(1), nuevo])
+        detalle = {"tipo": "Regular", "upsert": True, "lote": True}
+        assert auditoria.eventos[1:] == [
+            ("actualizar", existente.id, detalle), ("crear", nuevo.id, detalle),
+        ]
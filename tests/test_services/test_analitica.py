@@ -0,0 +1,89 @@
+"""
+Pruebas del snapshot columnar y los descuentos vectorizados.
+"""
+import pytest
+
+from src.database import migrations
+from src.database.connection import DatabaseConnection
+from src.models import ClienteRegular, ClientePremium, ClienteCorporativo
+from src.services.analitica import SnapshotClientes
+
+
+def clientes_de_prueba():
+    base = dict(telefono="+56944556677", direccion="Calle Prueba 123")
+    clientes = []
+    for i, puntos in enumerate((0, 999, 2500, 9000)):
+        clientes.append(ClienteRegular(
+            nombre="Regular", email=f"r{i}@x.cl", puntos_fidelidad=puntos, **base
+        ))
+    for i, nivel in enumerate(ClientePremium.NIVELES_VALIDOS):
+        clientes.append(ClientePremium(
+            nombre="Premium", email=f"p{i}@x.cl", nivel_premium=nivel, **base
+        ))
+    clientes.append(ClientePremium(
+        nombre="Premium", email="p-esp@x.cl", descuento=0.33, activo=False, **base
+    ))
+    for i, empleados in enumerate((1, 10, 11, 50, 51, 200, 201, 5000)):
+        clientes.append(ClienteCorporativo(
+            nombre="Corporativo", email=f"c{i}@x.cl", rut_empresa="76.124.890-1",
+            razon_social="Empresa SpA", cantidad_empleados=empleados, **base
+        ))
+    return clientes
+
+
+@pytest.fixture
+def datos(tmp_path):
+    ruta = str(tmp_path / "analitica.db")
+    migrations.migrar(ruta)
+    clientes = clientes_de_prueba()
+    with DatabaseConnection(ruta) as conn:
+        for cliente in clientes:
+            fila = cliente.to_dict()
+            conn.execute(
+                f"INSERT INTO clientes ({', '.join(fila)}) "
+                f"VALUES ({', '.join('?' * len(fila))})",
+                list(fila.values()),
+            )
+    return SnapshotClientes.desde_bd(ruta, tam_lote=5), clientes
+
+
+class TestSnapshotClientes:
+
+    def test_descuentos_equivalen_al_modelo(self, datos):
+        snapshot, clientes = datos
+        assert len(snapshot) == len(clientes)
+        for monto in (100_000, 12_345.67):
+            esperado = sorted(c.calcular_descuento(monto) for c in clientes)
+            assert sorted(snapshot.descuentos(monto)) == pytest.approx(esperado)
+
+    def test_mascara_y_exposicion(self, datos):
+        snapshot, _ = datos
+        mascara = snapshot.mascara(tipo="Premium", activo=True)
+        assert mascara.sum() == 3
+        assert snapshot.descuentos(1000)[mascara].sum() == pytest.approx(450)
+
+    def test_agregar_por_nivel_y_tamano(self, datos):
+        snapshot, _ = datos
+        tasas = snapshot.tasas_descuento()
+        por_nivel = snapshot.agregar(tasas, por="nivel")
+        assert por_nivel["Diamond"]["cantidad"] == 1
+        assert por_nivel["Gold"]["suma"] == pytest.approx(0.10 + 0.33)
+
+        por_tamano = snapshot.agregar(tasas, por="tamano")
+        assert {k: v["cantidad"] for k, v in por_tamano.items()} == {
+            "1-10": 2, "11-50": 2, "51-200": 2, "201+": 2,
+        }
+        assert por_tamano["201+"]["p50"] == pytest.approx(0.20)
+
+    def test_agregar_por_tipo_con_percentiles(self, datos):
+        snapshot, _ = datos
+        por_tipo = snapshot.agregar(snapshot.puntos_fidelidad, por="tipo")
+        regular = por_tipo["Regular"]
+        assert regular["cantidad"] == 4
+        assert regular["suma"] == 12_499
+        assert regular["p50"] == pytest.approx(1749.5)
+
+    def test_agrupacion_invalida(self, datos):
+        snapshot, _ = datos
+        with pytest.raises(ValueError):
+            snapshot.agregar(snapshot.tasas_descuento(), por="region")
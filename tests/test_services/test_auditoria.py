@@ -0,0 +1,106 @@
+"""
+Pruebas del servicio de auditoría asíncrono (logs_actividad).
+"""
+import threading
+import pytest
+
+from config import Config
+from src.database import migrations
+from src.database.connection import DatabaseConnection
+from src.repositories.auditoria_repository import AuditoriaRepository
+from src.services.auditoria_service import AuditoriaService
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    ruta = str(tmp_path / "auditoria.db")
+    migrations.migrar(ruta)
+    return ruta
+
+
+@pytest.fixture
+def auditoria(ruta):
+    servicio = AuditoriaService(AuditoriaRepository(ruta), tam_lote=50, intervalo=0.05)
+    yield servicio
+    servicio.cerrar()
+
+
+def contar_logs(ruta):
+    with DatabaseConnection(ruta) as conn:
+        return conn.execute("SELECT COUNT(*) FROM logs_actividad").fetchone()[0]
+
+
+class RepositorioBloqueado(AuditoriaRepository):
+    """Repositorio que retiene la escritura hasta que se libera el evento."""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.liberar = threading.Event()
+
+    def guardar_lote(self, eventos):
+        self.liberar.wait(5)
+        return super().guardar_lote(eventos)
+
+
+class TestEscrituraPorLotes:
+
+    def test_flush_escribe_todo_en_lotes(self, auditoria, ruta):
+        for i in range(120):
+            auditoria.registrar("crear", "Cliente", f"id-{i}")
+        auditoria.flush()
+
+        stats = auditoria.estadisticas()
+        assert contar_logs(ruta) == 120
+        assert stats["escritos"] == 120
+        assert stats["en_cola"] == 0
+        assert 3 <= stats["lotes"] < 120  # Agrupados, no uno por evento
+
+    def test_historial_por_entidad(self, auditoria):
+        auditoria.registrar("crear", "Cliente", "a", {"tipo": "Regular"})
+        auditoria.registrar("crear", "Cliente", "b")
+        auditoria.registrar("desactivar", "Cliente", "a")
+
+        historial = auditoria.historial("a")
+        assert [e["accion"] for e in historial] == ["desactivar", "crear"]
+        assert historial[1]["detalle"] == {"tipo": "Regular"}
+
+    def test_detalle_de_texto(self, auditoria, ruta):
+        auditoria.registrar("nota", "Cliente", "t", "texto libre")
+        with DatabaseConnection(ruta) as conn:
+            # Fila escrita antes de serializar siempre el detalle
+            conn.execute(
+                "INSERT INTO logs_actividad (accion, entidad, entidad_id, detalle, fecha) "
+                "VALUES ('nota', 'Cliente', 't', 'texto legado', '2024-01-01')"
+            )
+        detalles = [e["detalle"] for e in auditoria.historial("t")]
+        assert sorted(detalles) == ["texto legado", "texto libre"]
+
+    def test_historial_respeta_limite(self, auditoria):
+        for _ in range(5):
+            auditoria.registrar("actualizar", "Cliente", "x")
+        assert len(auditoria.historial("x", limite=2)) == 2
+
+    def test_cerrar_vacia_la_cola(self, ruta):
+        servicio = AuditoriaService(AuditoriaRepository(ruta), intervalo=0.05)
+        for i in range(10):
+            servicio.registrar("crear", "Cliente", f"id-{i}")
+        servicio.cerrar()
+        assert contar_logs(ruta) == 10
+
+
+class TestColaAcotada:
+
+    def test_cola_llena_descarta_y_cuenta(self, ruta, monkeypatch):
+        monkeypatch.setattr(Config, "AUDIT_PUT_TIMEOUT", 0.01)
+        repo = RepositorioBloqueado(ruta)
+        servicio = AuditoriaService(repo, tam_cola=2, tam_lote=1, intervalo=0.05)
+
+        for i in range(10):
+            servicio.registrar("crear", "Cliente", f"id-{i}")
+        repo.liberar.set()
+        servicio.cerrar()
+
+        stats = servicio.estadisticas()
+        assert stats["descartados"] > 0
+        assert stats["encolados"] + stats["descartados"] == 10
+        assert contar_logs(ruta) == stats["escritos"] == stats["encolados"]
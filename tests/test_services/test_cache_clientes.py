@@ -0,0 +1,96 @@
+"""
+Pruebas de la caché de lectura de clientes en ClienteService.
+"""
+import sqlite3
+import pytest
+
+from src.database.connection import ruta_db_por_defecto
+from src.exceptions.database_errors import RegistroNoEncontradoError
+from src.services.cache_clientes import CacheClientes
+from src.services.cliente_service import ClienteService
+
+
+pytestmark = pytest.mark.usefixtures("limpiar_bd")
+
+
+@pytest.fixture
+def servicio():
+    servicio = ClienteService()
+    servicio.cache = CacheClientes(tamano=16, ttl=60)
+    yield servicio
+    servicio.cache.cerrar()
+
+
+@pytest.fixture
+def cliente(servicio):
+    cliente = servicio.crear_cliente(
+        "Corporativo",
+        nombre="Carlos Díaz",
+        email="carlos@empresa.cl",
+        telefono="+56966778899",
+        direccion="Apoquindo 1000",
+        rut_empresa="76.124.890-1",
+        razon_social="TechCorp SpA",
+    )
+    # La auditoría escribe en la misma BD: su commit también cambia data_version
+    servicio.auditoria.flush()
+    return cliente
+
+
+class TestCacheClientes:
+
+    def test_hits_y_copias(self, servicio, cliente):
+        primero = servicio.obtener_cliente(cliente.id)
+        primero.nombre = "Modificado Localmente"
+        segundo = servicio.obtener_cliente(cliente.id)
+        assert segundo.nombre == "Carlos Díaz"
+        stats = servicio.cache.estadisticas()["por_id"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_busqueda_por_email(self, servicio, cliente):
+        assert servicio.buscar_por_email("carlos@empresa.cl").id == cliente.id
+        assert servicio.buscar_por_email("carlos@empresa.cl").id == cliente.id
+        assert servicio.cache.estadisticas()["por_email"]["hits"] == 1
+        assert servicio.buscar_por_email("nadie@empresa.cl") is None
+
+    def test_escrituras_del_servicio_invalidan(self, servicio, cliente):
+        servicio.obtener_cliente(cliente.id)
+        servicio.actualizar_cliente(cliente.id, nombre="Carla Díaz")
+        assert servicio.obtener_cliente(cliente.id).nombre == "Carla Díaz"
+
+        servicio.desactivar_cliente(cliente.id)
+        assert servicio.obtener_cliente(cliente.id).activo is False
+
+        servicio.eliminar_cliente(cliente.id)
+        with pytest.raises(RegistroNoEncontradoError):
+            servicio.obtener_cliente(cliente.id)
+
+    def test_cambio_de_email_no_sirve_clave_vieja(self, servicio, cliente):
+        servicio.buscar_por_email("carlos@empresa.cl")
+        servicio.actualizar_cliente(cliente.id, email="nuevo@empresa.cl")
+        assert servicio.buscar_por_email("carlos@empresa.cl") is None
+        assert servicio.buscar_por_email("nuevo@empresa.cl").id == cliente.id
+
+    def test_detecta_escrituras_de_otra_conexion(self, servicio, cliente):
+        servicio.obtener_cliente(cliente.id)
+        # Simula otro proceso: conexión propia, fuera del pool y del servicio
+        externa = sqlite3.connect(ruta_db_por_defecto())
+        with externa:
+            externa.execute(
+                "UPDATE clientes SET nombre = 'Otro Proceso' WHERE id = ?", (cliente.id,)
+            )
+        externa.close()
+
+        assert servicio.obtener_cliente(cliente.id).nombre == "Otro Proceso"
+        assert servicio.cache.estadisticas()["vaciados"] >= 1
+
+    def test_ttl(self, servicio, cliente, monkeypatch):
+        reloj = [1000.0]
+        monkeypatch.setattr("src.utils.cache.time.monotonic", lambda: reloj[0])
+        servicio.cache.cerrar()
+        servicio.cache = CacheClientes(tamano=16, ttl=5)
+        servicio.obtener_cliente(cliente.id)
+        reloj[0] += 6
+        servicio.obtener_cliente(cliente.id)
+        assert servicio.cache.estadisticas()["por_id"]["expiradas"] == 1
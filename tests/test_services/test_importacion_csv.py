@@ -0,0 +1,117 @@
+"""
+Pruebas de la importación CSV en paralelo por rangos de bytes.
+"""
+import csv
+import mmap
+import pytest
+
+from src.database.connection import DatabaseConnection
+from src.services.importacion_csv import ImportadorCSV, dividir_en_rangos
+
+COLUMNAS = ["tipo_cliente", "nombre", "email", "telefono", "direccion", "activo", "puntos_fidelidad"]
+
+
+pytestmark = pytest.mark.usefixtures("limpiar_bd")
+
+
+def escribir(ruta, filas):
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(COLUMNAS)
+        escritor.writerows(filas)
+
+
+def fila(n, **extra):
+    datos = {
+        "tipo_cliente": "Regular",
+        "nombre": "Cliente Csv",
+        "email": f"csv{n}@example.com",
+        "telefono": "+56944556677",
+        # Campo entre comillas con saltos de línea: prueba los cortes de rango
+        "direccion": f"Calle \"Larga\" {n}\nDepto {n}\r\nSantiago",
+        "activo": "True",
+        "puntos_fidelidad": str(n),
+        **extra,
+    }
+    return [datos[c] for c in COLUMNAS]
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    filas = [fila(i) for i in range(40)]
+    filas[5][2] = "no-es-email"
+    filas[12][6] = "muchos"
+    filas[20] = fila(3)  # Email repetido: conflicto en la BD
+    ruta = tmp_path / "socios.csv"
+    escribir(ruta, filas)
+    return str(ruta)
+
+
+def emails_en_bd():
+    with DatabaseConnection() as conn:
+        return [r[0] for r in conn.execute("SELECT email FROM clientes ORDER BY rowid")]
+
+
+class TestDividirEnRangos:
+
+    def test_cortes_alineados_a_registros(self, archivo):
+        with open(archivo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rangos = dividir_en_rangos(mm, 0, tam_rango=100)
+            contenido = bytes(mm)
+        assert len(rangos) > 5
+        assert rangos[0][0] == 0 and rangos[-1][1] == len(contenido)
+        registros = []
+        for inicio, fin in rangos:
+            texto = contenido[inicio:fin].decode("utf-8")
+            registros.extend(csv.reader(texto.splitlines(keepends=True)))
+        # Ningún corte cae dentro de un campo entre comillas
+        assert len(registros) == 41
+        assert all(len(r) == len(COLUMNAS) for r in registros)
+
+
+class TestImportadorCSV:
+
+    def test_importa_y_reporta_errores(self, archivo, tmp_path):
+        resumen = ImportadorCSV(archivo, procesos=1, tam_rango=256).ejecutar()
+
+        assert resumen["procesados"] == 40
+        assert resumen["insertados"] == 37
+        assert resumen["errores"] == 2
+        assert resumen["conflictos"] == 1
+        assert emails_en_bd()[:4] == [f"csv{i}@example.com" for i in range(4)]
+
+        with open(resumen["reporte"], newline="", encoding="utf-8") as f:
+            reporte = list(csv.DictReader(f))
+        assert [(r["indice"], r["campo"]) for r in reporte] == [
+            ("5", "email"), ("12", "puntos_fidelidad"), ("20", "email"),
+        ]
+
+    def test_resultado_determinista_con_varios_procesos(self, archivo, tmp_path):
+        secuencial = ImportadorCSV(
+            archivo, procesos=1, tam_rango=256, ruta_reporte=str(tmp_path / "a.csv")
+        ).ejecutar()
+        orden_secuencial = emails_en_bd()
+        with DatabaseConnection() as conn:
+            conn.execute("DELETE FROM clientes")
+
+        paralelo = ImportadorCSV(
+            archivo, procesos=2, tam_rango=256, ruta_reporte=str(tmp_path / "b.csv")
+        ).ejecutar()
+
+        assert paralelo["procesos"] == 2
+        for clave in ("procesados", "insertados", "errores", "conflictos"):
+            assert paralelo[clave] == secuencial[clave]
+        assert emails_en_bd() == orden_secuencial
+        assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+
+    def test_columnas_faltantes_y_archivo_vacio(self, tmp_path):
+        ruta = tmp_path / "corto.csv"
+        ruta.write_text(
+            ",".join(COLUMNAS) + "\nRegular,Sin Columnas\n\n", encoding="utf-8"
+        )
+        resumen = ImportadorCSV(str(ruta), procesos=1).ejecutar()
+        assert resumen["procesados"] == 1 and resumen["errores"] == 1
+
+        vacio = tmp_path / "vacio.csv"
+        vacio.write_text("", encoding="utf-8")
+        assert ImportadorCSV(str(vacio), procesos=1).ejecutar()["procesados"] == 0
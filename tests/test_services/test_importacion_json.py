@@ -0,0 +1,151 @@
+"""
+Pruebas de la importación JSON/NDJSON incremental y reanudable.
+"""
+import gzip
+import json
+import os
+import pytest
+
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.services.auditoria_service import obtener_auditoria
+from src.services.importacion_json import ImportadorJSON
+
+
+pytestmark = pytest.mark.usefixtures("limpiar_bd")
+
+
+def fila(n, **extra):
+    return {
+        "tipo_cliente": "Regular",
+        "nombre": "Cliente Importado",
+        "email": f"import{n}@example.com",
+        "telefono": "+56944556677",
+        "direccion": "Calle Import 123",
+        **extra,
+    }
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    filas = [fila(i) for i in range(10)]
+    filas[3]["email"] = "no-es-email"
+    filas[7] = "no es un objeto"
+    ruta = tmp_path / "socios.json"
+    ruta.write_text(json.dumps(filas, indent=2), encoding="utf-8")
+    return str(ruta)
+
+
+class Interrupcion(Exception):
+    pass
+
+
+class TestImportadorJSON:
+
+    def test_importa_en_lotes(self, archivo):
+        avances = []
+        resumen = ImportadorJSON(archivo, tam_lote=4, progreso=avances.append).ejecutar()
+
+        assert (resumen["procesados"], resumen["insertados"], resumen["errores"]) == (10, 8, 2)
+        assert [e["indice"] for e in resumen["muestra_errores"]] == [3, 7]
+        assert [a["procesados"] for a in avances] == [4, 8, 10]
+        assert avances[-1]["bytes_leidos"] <= avances[-1]["bytes_totales"]
+        assert resumen["reanudado"] is False
+        assert SQLiteRepository().contar() == 8
+        assert not os.path.exists(archivo + ".checkpoint")
+
+    def test_historial_de_cada_cliente_importado(self, archivo):
+        ImportadorJSON(archivo, tam_lote=4, progreso=lambda a: None).ejecutar()
+        for email in ("import0@example.com", "import9@example.com"):
+            cliente = SQLiteRepository().obtener_por_email(email)
+            historial = obtener_auditoria().historial(cliente.id)
+            assert [e["accion"] for e in historial] == ["crear"]
+            assert historial[0]["detalle"] == {"tipo": "Regular", "lote": True}
+
+    def test_reanuda_tras_interrupcion(self, archivo):
+        def interrumpir(avance):
+            if avance["procesados"] >= 4:
+                raise Interrupcion()
+
+        with pytest.raises(Interrupcion):
+            ImportadorJSON(archivo, tam_lote=4, progreso=interrumpir).ejecutar()
+        assert SQLiteRepository().contar() == 3
+        with open(archivo + ".checkpoint", encoding="utf-8") as f:
+            assert json.load(f)["procesados"] == 4
+
+        resumen = ImportadorJSON(archivo, tam_lote=4, progreso=lambda a: None).ejecutar()
+        assert resumen["reanudado"] is True
+        assert (resumen["procesados"], resumen["insertados"], resumen["conflictos"]) == (10, 8, 0)
+        assert [e["indice"] for e in resumen["muestra_errores"]] == [7]
+        assert SQLiteRepository().contar() == 8
+
+    def test_lote_reintentado_no_duplica(self, archivo):
+        ImportadorJSON(archivo, tam_lote=4, progreso=lambda a: None).ejecutar()
+        resumen = ImportadorJSON(archivo, tam_lote=4, progreso=lambda a: None).ejecutar()
+        assert (resumen["insertados"], resumen["conflictos"]) == (0, 8)
+        assert SQLiteRepository().contar() == 8
+
+    def test_checkpoint_de_otra_version_se_ignora(self, archivo):
+        with open(archivo + ".checkpoint", "w", encoding="utf-8") as f:
+            json.dump({"firma": {"archivo": archivo, "tamano": 1}, "offset": 99}, f)
+        resumen = ImportadorJSON(archivo, progreso=lambda a: None).ejecutar()
+        assert resumen["reanudado"] is False
+        assert resumen["insertados"] == 8
+
+    def test_json_invalido_conserva_checkpoint(self, tmp_path):
+        ruta = tmp_path / "roto.json"
+        contenido = json.dumps([fila(i) for i in range(3)])
+        ruta.write_text(contenido[:-1] + ", {", encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON inválido"):
+            ImportadorJSON(str(ruta), tam_lote=2, progreso=lambda a: None).ejecutar()
+        # El tercer cliente quedó en un lote sin confirmar
+        assert SQLiteRepository().contar() == 2
+        with open(str(ruta) + ".checkpoint", encoding="utf-8") as f:
+            assert json.load(f)["procesados"] == 2
+
+
+@pytest.fixture
+def archivo_ndjson_gz(tmp_path):
+    ruta = tmp_path / "socios.ndjson.gz"
+    with gzip.open(ruta, "wt", encoding="utf-8") as f:
+        for i in range(10):
+            f.write(json.dumps(fila(i) if i != 3 else fila(i, email="malo")) + "\n")
+    return str(ruta)
+
+
+class TestImportadorNDJSON:
+
+    def test_gzip_en_lotes(self, archivo_ndjson_gz):
+        importador = ImportadorJSON(archivo_ndjson_gz, tam_lote=4, progreso=lambda a: None)
+        assert importador.formato == "ndjson"
+        resumen = importador.ejecutar()
+        assert (resumen["procesados"], resumen["insertados"], resumen["errores"]) == (10, 9, 1)
+        assert resumen["bytes_totales"] is None  # Offsets del contenido descomprimido
+
+    def test_reanuda_gzip(self, archivo_ndjson_gz):
+        def interrumpir(avance):
+            if avance["procesados"] >= 4:
+                raise Interrupcion()
+
+        with pytest.raises(Interrupcion):
+            ImportadorJSON(archivo_ndjson_gz, tam_lote=4, progreso=interrumpir).ejecutar()
+        resumen = ImportadorJSON(archivo_ndjson_gz, tam_lote=4, progreso=lambda a: None).ejecutar()
+        assert resumen["reanudado"] is True
+        assert (resumen["insertados"], resumen["conflictos"]) == (9, 0)
+        assert SQLiteRepository().contar() == 9
+
+    def test_reanuda_zstd(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        ruta = tmp_path / "socios.ndjson.zst"
+        texto = "".join(json.dumps(fila(i)) + "\n" for i in range(10))
+        ruta.write_bytes(zstandard.ZstdCompressor().compress(texto.encode("utf-8")))
+
+        def interrumpir(avance):
+            if avance["procesados"] >= 4:
+                raise Interrupcion()
+
+        with pytest.raises(Interrupcion):
+            ImportadorJSON(str(ruta), tam_lote=4, progreso=interrumpir).ejecutar()
+        resumen = ImportadorJSON(str(ruta), tam_lote=4, progreso=lambda a: None).ejecutar()
+        assert resumen["reanudado"] is True
+        assert (resumen["insertados"], resumen["conflictos"]) == (10, 0)
+        assert SQLiteRepository().contar() == 10
@@ -0,0 +1,120 @@
+"""
+Pruebas de la caché LRU y la memoización de validadores.
+"""
+import pytest
+
+from src.exceptions.validation_errors import EmailInvalidoError, RutInvalidoError
+from src.utils.cache import CacheLRU, memoizar
+from src.utils.validators import (
+    validar_email,
+    validar_rut,
+    estadisticas_cache_validadores,
+    limpiar_cache_validadores,
+)
+
+
+class TestCacheLRU:
+
+    def test_descarta_el_menos_reciente(self):
+        cache = CacheLRU(2)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.obtener("a")  # "b" queda como el menos reciente
+        cache.guardar("c", 3)
+        assert cache.obtener("b") is None
+        assert cache.obtener("a") == 1
+        stats = cache.estadisticas()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+
+    def test_tamano_cero_no_guarda(self):
+        cache = CacheLRU(0)
+        cache.guardar("a", 1)
+        assert len(cache) == 0
+
+    def test_limpiar_reinicia_contadores(self):
+        cache = CacheLRU(4)
+        cache.guardar("a", 1)
+        cache.obtener("a")
+        cache.limpiar()
+        assert cache.estadisticas() == {
+            "tamano": 4, "entradas": 0, "hits": 0, "misses": 0,
+            "evictions": 0, "expiradas": 0,
+        }
+
+    def test_ttl_expira_entradas(self, monkeypatch):
+        reloj = [100.0]
+        monkeypatch.setattr("src.utils.cache.time.monotonic", lambda: reloj[0])
+        cache = CacheLRU(4, ttl=10)
+        cache.guardar("a", 1)
+        reloj[0] += 9
+        assert cache.obtener("a") == 1
+        reloj[0] += 1
+        assert cache.obtener("a") is None
+        assert len(cache) == 0
+        assert cache.estadisticas()["expiradas"] == 1
+
+    def test_descartar_y_vaciar(self):
+        cache = CacheLRU(4)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.descartar("a")
+        cache.descartar("no-existe")
+        assert cache.obtener("a") is None
+        cache.vaciar()
+        assert len(cache) == 0
+        assert cache.estadisticas()["misses"] == 1  # vaciar conserva contadores
+
+
+class TestMemoizar:
+
+    def test_memoriza_resultados_y_errores(self):
+        llamadas = []
+
+        @memoizar(8, errores=(ValueError,))
+        def doble(x):
+            llamadas.append(x)
+            if x < 0:
+                raise ValueError(f"negativo: {x}")
+            return x * 2
+
+        assert doble(2) == doble(2) == 4
+        for _ in range(2):
+            with pytest.raises(ValueError, match="negativo: -1"):
+                doble(-1)
+        assert llamadas == [2, -1]
+        assert doble.cache.estadisticas()["hits"] == 2
+
+    def test_errores_no_declarados_no_se_memorizan(self):
+        llamadas = []
+
+        @memoizar(8)
+        def falla(x):
+            llamadas.append(x)
+            raise KeyError(x)
+
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                falla(1)
+        assert llamadas == [1, 1]
+
+
+class TestValidadoresMemoizados:
+
+    @pytest.fixture(autouse=True)
+    def cache_limpia(self):
+        limpiar_cache_validadores()
+        yield
+        limpiar_cache_validadores()
+
+    def test_email_repetido_usa_cache(self):
+        assert validar_email("Ana@Example.com") == validar_email("Ana@Example.com")
+        stats = estadisticas_cache_validadores()["email"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_error_memorizado_se_relanza(self):
+        for _ in range(2):
+            with pytest.raises(EmailInvalidoError):
+                validar_email("sin-arroba")
+        with pytest.raises(RutInvalidoError):
+            validar_rut("76.124.890-2")
+        assert estadisticas_cache_validadores()["email"]["hits"] == 1
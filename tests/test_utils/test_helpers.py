@@ -0,0 +1,63 @@
+"""
+Pruebas de la generación de IDs y fechas epoch.
+"""
+import time
+import uuid
+from datetime import date, datetime
+import pytest
+
+from config import Config
+from src.utils.helpers import (
+    a_epoch,
+    epoch_desde_iso,
+    generar_id,
+    generar_uuid7,
+    marca_tiempo,
+)
+
+
+class TestGenerarId:
+
+    def test_uuid7_formato_y_timestamp(self):
+        valor = uuid.UUID(generar_uuid7())
+        assert valor.version == 7
+        assert valor.variant == uuid.RFC_4122
+        ms = valor.int >> 80
+        assert abs(ms - time.time() * 1000) < 5000
+
+    def test_uuid7_estrictamente_creciente(self):
+        ids = [generar_uuid7() for _ in range(5000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_esquema_configurable(self, monkeypatch):
+        monkeypatch.setattr(Config, "ID_SCHEME", "uuid4")
+        assert uuid.UUID(generar_id()).version == 4
+        monkeypatch.setattr(Config, "ID_SCHEME", "uuid7")
+        assert uuid.UUID(generar_id()).version == 7
+
+    def test_esquema_invalido(self, monkeypatch):
+        monkeypatch.setattr(Config, "ID_SCHEME", "ulid")
+        with pytest.raises(ValueError):
+            generar_id()
+
+
+class TestFechasEpoch:
+
+    def test_a_epoch_acepta_varios_formatos(self):
+        inicio = int(datetime(2024, 5, 1).timestamp())
+        assert a_epoch("2024-05-01") == inicio
+        assert a_epoch(date(2024, 5, 1)) == inicio
+        assert a_epoch(datetime(2024, 5, 1)) == inicio
+        assert a_epoch(str(inicio)) == inicio
+        assert a_epoch("2024-05-01", fin_de_dia=True) == inicio + 86399
+        assert a_epoch("2024-05-01T10:00:00", fin_de_dia=True) == inicio + 36000
+
+    def test_a_epoch_invalido(self):
+        for valor in ("ayer", True, 1.5):
+            with pytest.raises(ValueError):
+                a_epoch(valor)
+
+    def test_marca_tiempo_consistente(self):
+        iso, epoch = marca_tiempo()
+        assert epoch_desde_iso(iso) == epoch
@@ -0,0 +1,96 @@
+"""
+Pruebas del parser incremental de arreglos JSON y de NDJSON.
+"""
+import io
+import json
+import pytest
+
+from src.utils.json_incremental import iterar_arreglo_json, iterar_lineas_json
+
+DATOS = [{"nombre": "Ñandú ✓", "n": i} for i in range(40)] + [123, "texto", [1, 2], None]
+
+
+class SinSeek(io.BytesIO):
+    """Flujo sin seek, como el lector de zstd."""
+
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+def leer(crudo: bytes, **opciones):
+    return list(iterar_arreglo_json(io.BytesIO(crudo), **opciones))
+
+
+class TestIterarArregloJSON:
+
+    @pytest.mark.parametrize("tam_bloque", [1, 3, 7, 64, 1 << 16])
+    def test_elementos_con_bloques_pequenos(self, tam_bloque):
+        crudo = json.dumps(DATOS, ensure_ascii=False, indent=2).encode("utf-8")
+        assert [e for e, _ in leer(crudo, tam_bloque=tam_bloque)] == DATOS
+
+    def test_reanuda_desde_offset(self):
+        crudo = json.dumps(DATOS, ensure_ascii=False).encode("utf-8")
+        elementos = leer(crudo, tam_bloque=5)
+        for k in (0, 17, len(DATOS) - 1):
+            resto = leer(crudo, desde=elementos[k][1], tam_bloque=5)
+            assert [e for e, _ in resto] == DATOS[k + 1:]
+
+    def test_reanuda_sin_seek(self):
+        crudo = json.dumps(DATOS, ensure_ascii=False).encode("utf-8")
+        elementos = leer(crudo)
+        assert [e for e, _ in iterar_arreglo_json(SinSeek(crudo))] == DATOS
+        resto = iterar_arreglo_json(SinSeek(crudo), desde=elementos[17][1], tam_bloque=5)
+        assert [e for e, _ in resto] == DATOS[18:]
+
+    def test_offset_en_bytes(self):
+        crudo = '["ñ", "é"]'.encode("utf-8")
+        assert leer(crudo) == [("ñ", 5), ("é", 11)]
+
+    def test_vacio_y_bom(self):
+        assert leer(b" [ ] ") == []
+        assert leer("\ufeff[1]".encode("utf-8")) == [(1, 5)]
+
+    @pytest.mark.parametrize("crudo", [b"", b"{}", b"[1,", b"[1 2]", b'[{"a":}]', b"[1"])
+    def test_json_invalido(self, crudo):
+        with pytest.raises(ValueError, match="JSON inválido"):
+            leer(crudo, tam_bloque=2)
+
+    def test_elemento_demasiado_grande(self):
+        crudo = json.dumps([{"x": "a" * 1000}]).encode("utf-8")
+        with pytest.raises(ValueError, match="mayor a"):
+            leer(crudo, tam_bloque=16, max_elemento=100)
+
+
+class TestIterarLineasJSON:
+
+    def crudo(self):
+        lineas = [json.dumps(d, ensure_ascii=False) for d in DATOS]
+        lineas.insert(3, "")  # Las líneas en blanco se ignoran
+        return ("\ufeff" + "\n".join(lineas) + "\n").encode("utf-8")
+
+    def test_elementos_y_reanudacion(self):
+        crudo = self.crudo()
+        elementos = list(iterar_lineas_json(io.BytesIO(crudo)))
+        assert [e for e, _ in elementos] == DATOS
+        assert elementos[-1][1] == len(crudo)
+        resto = iterar_lineas_json(io.BytesIO(crudo), desde=elementos[10][1])
+        assert [e for e, _ in resto] == DATOS[11:]
+
+    def test_reanudacion_sin_seek(self):
+        crudo = self.crudo()
+        elementos = list(iterar_lineas_json(SinSeek(crudo)))
+        assert [e for e, _ in elementos] == DATOS
+        resto = iterar_lineas_json(SinSeek(crudo), desde=elementos[10][1])
+        assert [e for e, _ in resto] == DATOS[11:]
+
+    def test_linea_invalida(self):
+        crudo = b'{"a": 1}\n{"a": \n'
+        with pytest.raises(ValueError, match="JSON inválido en el byte 9"):
+            list(iterar_lineas_json(io.BytesIO(crudo)))
+
+    def test_linea_demasiado_grande(self):
+        with pytest.raises(ValueError, match="mayor a 8 bytes"):
+            list(iterar_lineas_json(io.BytesIO(b'["abcdefghij"]\n'), max_elemento=8))
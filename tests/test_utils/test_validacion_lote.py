@@ -0,0 +1,98 @@
+"""
+Pruebas de la validación por lotes.
+"""
+import pytest
+
+from src.models import TIPOS_CLIENTE
+from src.utils.validacion_lote import validar_lote, iterar_validacion
+
+REGULAR = {
+    "tipo": "Regular",
+    "nombre": "juan pérez",
+    "email": "Juan@Example.com",
+    "telefono": "+56 9 4455 6677",
+    "direccion": "Av. Siempre Viva 123",
+    "puntos_fidelidad": "1500",
+}
+
+CORPORATIVO = {
+    "tipo_cliente": "Corporativo",
+    "nombre": "Ana Muñoz",
+    "email": "ana@empresa.cl",
+    "telefono": "+56977889900",
+    "direccion": "Apoquindo 1000",
+    "rut_empresa": "76124890-1",
+    "razon_social": "Empresa Test SpA",
+    "cantidad_empleados": 60,
+}
+
+
+class TestValidarLote:
+
+    def test_normaliza_filas_validas(self):
+        resultado = validar_lote([REGULAR, CORPORATIVO])
+        assert resultado["errores"] == []
+        (_, regular), (_, corporativo) = resultado["validos"]
+        assert regular["nombre"] == "Juan Pérez"
+        assert regular["puntos_fidelidad"] == 1500
+        assert regular["telefono"] == "+56 9 4455 6677"
+        assert corporativo["rut_empresa"] == "76.124.890-1"
+
+    def test_reporta_todos_los_campos_invalidos(self):
+        fila = dict(REGULAR, nombre="J4", email="sin-arroba", telefono="123")
+        resultado = validar_lote([fila])
+        assert resultado["validos"] == []
+        campos = {e["campo"] for e in resultado["errores"]}
+        assert campos == {"nombre", "email", "telefono"}
+        assert all(e["indice"] == 0 for e in resultado["errores"])
+
+    def test_errores_por_tipo(self):
+        premium = dict(REGULAR, tipo="Premium", email="p@x.cl", nivel_premium="Bronce")
+        corporativo = dict(CORPORATIVO, rut_empresa="76124890-2", razon_social="")
+        errores = validar_lote([premium, corporativo, {"tipo": "VIP"}])["errores"]
+        por_fila = {}
+        for e in errores:
+            por_fila.setdefault(e["indice"], set()).add(e["campo"])
+        assert por_fila[0] == {"nivel_premium"}
+        assert por_fila[1] == {"rut_empresa", "razon_social"}
+        assert "tipo_cliente" in por_fila[2] and "email" in por_fila[2]
+
+    def test_email_repetido_en_el_lote(self):
+        resultado = validar_lote([REGULAR, dict(REGULAR, email="juan@example.com")])
+        assert len(resultado["validos"]) == 1
+        assert resultado["errores"][0]["indice"] == 1
+
+    def test_email_repetido_con_mayusculas_no_ascii(self):
+        # casefold (clave email_normalizado de la BD): "ß" equivale a "SS"
+        filas = [dict(REGULAR, email="straße@example.com"),
+                 dict(REGULAR, email="STRASSE@example.com")]
+        resultado = validar_lote(filas)
+        assert len(resultado["validos"]) == 1
+        assert resultado["errores"][0]["indice"] == 1
+
+    def test_fecha_registro(self):
+        filas = [
+            dict(REGULAR, fecha_registro="2020-01-01"),
+            dict(REGULAR, email="b@x.cl", fecha_registro="ayer"),
+        ]
+        resultado = validar_lote(filas)
+        assert resultado["validos"][0][1]["fecha_registro"] == "2020-01-01T00:00:00"
+        assert [(e["indice"], e["campo"]) for e in resultado["errores"]] == [(1, "fecha_registro")]
+
+    def test_region_desconocida(self):
+        with pytest.raises(ValueError):
+            validar_lote([REGULAR], region="XX")
+
+
+class TestIterarValidacion:
+
+    def test_es_perezoso_y_hidrata(self):
+        def filas():
+            yield REGULAR
+            raise AssertionError("no debe consumirse más de lo pedido")
+
+        indice, datos, errores = next(iterar_validacion(filas()))
+        assert (indice, errores) == (0, [])
+        cliente = TIPOS_CLIENTE[datos["tipo_cliente"]].from_storage(datos)
+        assert cliente.email == "Juan@example.com"
+        assert cliente.puntos_fidelidad == 1500